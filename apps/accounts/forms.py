@@ -1,8 +1,10 @@
 from django import forms
-from django.contrib.auth.forms import UserCreationForm
+from django.contrib.auth.forms import PasswordResetForm, UserCreationForm
 from django.core.exceptions import ValidationError
+from django.template import loader
 
 from .models import CustomUser, Employer, JobSeeker, Profile
+from .tasks import send_email
 
 
 def _validate_password_similarity(password: str, username: str = "", email: str = ""):
@@ -196,3 +198,29 @@ class ProfileForm(forms.ModelForm):
             "w-full px-3 py-2 bg-gray-50 border border-gray-200 rounded-lg text-sm "
             "focus:ring-2 focus:ring-blue-500/50 focus:border-blue-500 transition-all hover:border-blue-400",
         )
+
+
+class QueuedPasswordResetForm(PasswordResetForm):
+    """Renders the reset email in the request but sends it from the task queue."""
+
+    def send_mail(
+        self,
+        subject_template_name,
+        email_template_name,
+        context,
+        from_email,
+        to_email,
+        html_email_template_name=None,
+    ):
+        subject = loader.render_to_string(subject_template_name, context)
+        body = loader.render_to_string(email_template_name, context)
+        html_body = None
+        if html_email_template_name is not None:
+            html_body = loader.render_to_string(html_email_template_name, context)
+        send_email.delay(
+            "".join(subject.splitlines()),
+            body,
+            [to_email],
+            from_email=from_email,
+            html_body=html_body,
+        )
@@ -0,0 +1,138 @@
+"""
+Resized renditions of uploaded company logos and avatars.
+
+Uploads are kept as they are; ``build_renditions`` (run by the task queue
+after the upload is saved) stores square crops of each size in
+``RENDITION_SIZES`` as WebP and JPEG next to it, without EXIF or other
+metadata. File names carry a hash of the original, so they never change
+content and can be served with a far-future ``Cache-Control: immutable``.
+The names are recorded in the model's ``<field>_renditions`` JSON field:
+
+    {"source": "company_logos/acme.png",
+     "64": {"webp": "...-64.webp", "jpeg": "...-64.jpg", "size": 64}, ...}
+
+Templates pick one with the ``{% picture %}`` tag (``{% load images %}``).
+"""
+
+import hashlib
+import io
+import logging
+import posixpath
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from apps.jobs.cache import invalidate
+
+logger = logging.getLogger(__name__)
+
+# Edge lengths (px) generated per image field; templates show logos at
+# 64-128px and avatars at 80px, so these cover 1x and 2x screens.
+RENDITION_SIZES = {
+    "company_logo": (64, 128, 256),
+    "avatar": (80, 160),
+}
+
+# format -> (file extension, Pillow format, save options)
+FORMATS = {
+    "webp": ("webp", "WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("jpg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+
+def renditions_field(field):
+    return f"{field}_renditions"
+
+
+def image_fields(model):
+    """The fields of ``model`` that get renditions."""
+    return [
+        field.name
+        for field in model._meta.get_fields()
+        if field.name in RENDITION_SIZES
+    ]
+
+
+def is_stale(instance, field):
+    """True when the renditions were not built from the current upload."""
+    source = getattr(instance, field).name or ""
+    return getattr(instance, renditions_field(field)).get("source", "") != source
+
+
+def render(image, size, fmt):
+    """Encode a ``size`` x ``size`` crop of ``image`` without metadata."""
+    _ext, pillow_format, options = FORMATS[fmt]
+    rendition = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+    if fmt == "jpeg" and rendition.mode != "RGB":
+        # JPEG has no alpha: flatten transparent logos onto white.
+        background = Image.new("RGB", rendition.size, "white")
+        background.paste(rendition, mask=rendition.getchannel("A"))
+        rendition = background
+    # Nothing from ``info`` (EXIF, ICC profile, comments) is written out.
+    rendition.info = {}
+    output = io.BytesIO()
+    rendition.save(output, pillow_format, **options)
+    return output.getvalue()
+
+
+def generate(file, sizes):
+    """
+    Write the renditions of an uploaded image to its storage; returns the
+    ``sizes`` part of the renditions mapping. Sizes larger than the
+    original are skipped rather than upscaled.
+    """
+    file.open("rb")
+    try:
+        content = file.read()
+    finally:
+        file.close()
+    digest = hashlib.sha256(content).hexdigest()[:20]
+    directory = posixpath.join(posixpath.dirname(file.name), "renditions")
+
+    with Image.open(io.BytesIO(content)) as original:
+        # Let the JPEG decoder scale down while decoding large photos.
+        original.draft("RGB", (max(sizes), max(sizes)))
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    renditions = {}
+    largest = min(image.size)
+    for size in sizes:
+        if size > largest and renditions:
+            break
+        size = min(size, largest)
+        entry = {"size": size}
+        for fmt, (ext, _format, _options) in FORMATS.items():
+            name = posixpath.join(directory, f"{digest}-{size}.{ext}")
+            # The same original always yields the same bytes.
+            if not file.storage.exists(name):
+                name = file.storage.save(name, ContentFile(render(image, size, fmt)))
+            entry[fmt] = name
+        renditions[str(size)] = entry
+    return renditions
+
+
+def build_renditions(model_label, pk, field):
+    """Generate and record the renditions of one stored image."""
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None or not is_stale(instance, field):
+        return
+    file = getattr(instance, field)
+    renditions = {"source": file.name or ""}
+    if file:
+        try:
+            renditions.update(generate(file, RENDITION_SIZES[field]))
+        except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+            # Recorded without sizes, so it isn't retried; templates fall
+            # back to the original.
+            logger.warning("Could not make renditions of %s", file.name, exc_info=True)
+
+    # Only if the upload hasn't been replaced in the meantime.
+    updated = model.objects.filter(pk=pk, **{field: file.name or ""}).update(
+        **{renditions_field(field): renditions}
+    )
+    if updated and model_label == "accounts.Employer":
+        # Cached company pages and cards embed the image URLs.
+        invalidate("employers")
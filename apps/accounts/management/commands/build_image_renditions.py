@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.accounts.images import (
+    build_renditions,
+    image_fields,
+    is_stale,
+    renditions_field,
+)
+from apps.accounts.models import Employer, Profile
+
+
+class Command(BaseCommand):
+    help = "Build missing or outdated renditions of logos and avatars."
+
+    def handle(self, *args, **options):
+        built = 0
+        for model in (Employer, Profile):
+            for field in image_fields(model):
+                rows = model.objects.exclude(**{field: ""}).only(
+                    "pk", field, renditions_field(field)
+                )
+                for instance in rows.iterator():
+                    if is_stale(instance, field):
+                        build_renditions(model._meta.label, instance.pk, field)
+                        built += 1
+        self.stdout.write(self.style.SUCCESS(f"Built renditions for {built} images."))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_cleanup_profile_location"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employer",
+            name="job_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
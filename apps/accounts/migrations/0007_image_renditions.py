@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employer",
+            name="company_logo_renditions",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="avatar_renditions",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.locations.gazetteer import link_places
+
+
+def link_employer_places(apps, schema_editor):
+    link_places(apps.get_model("accounts", "Employer").objects.all())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_image_renditions"),
+        ("locations", "0002_load_places"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employer",
+            name="place",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to="locations.place",
+            ),
+        ),
+        migrations.RunPython(link_employer_places, migrations.RunPython.noop),
+    ]
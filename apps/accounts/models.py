@@ -1,21 +1,32 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.urls import reverse
+from apps.locations.models import Place
 
 class CustomUser(AbstractUser):
     is_employer = models.BooleanField(default=False)
     is_job_seeker = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta(AbstractUser.Meta):
+        # login_view looks users up by username or email.
+        indexes = [models.Index(fields=["email"], name="user_email_idx")]
+
 class Employer(models.Model):
     user = models.OneToOneField(CustomUser, on_delete=models.CASCADE)
     company_name = models.CharField(max_length=255)
     company_description = models.TextField(blank=True)
     company_website = models.URLField(blank=True)
     company_logo = models.ImageField(upload_to='company_logos/', blank=True)
+    # Resized copies of the logo, built by apps.accounts.images.
+    company_logo_renditions = models.JSONField(default=dict, blank=True, editable=False)
     location = models.CharField(max_length=100, blank=True)
+    # The city ``location`` names, set by apps.locations.signals.
+    place = models.ForeignKey(Place, on_delete=models.SET_NULL, null=True, blank=True, editable=False)
     phone = models.CharField(max_length=20, blank=True)
     industry = models.CharField(max_length=100, blank=True)
+    # Active jobs posted by this employer, maintained by apps.jobs.signals.
+    job_count = models.PositiveIntegerField(default=0, editable=False)
     
     def __str__(self):
         return self.company_name
@@ -23,10 +34,6 @@ class Employer(models.Model):
     def get_absolute_url(self):
         return reverse('accounts:employer_profile', args=[str(self.id)])
 
-    @property
-    def job_count(self):
-        return self.jobs.filter(is_active=True).count()
-
 class JobSeeker(models.Model):
     user = models.OneToOneField(CustomUser, on_delete=models.CASCADE)
     resume = models.FileField(upload_to='resumes/', blank=True)
@@ -41,6 +48,8 @@ class JobSeeker(models.Model):
 class Profile(models.Model):
     user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, related_name="profile")
     avatar = models.ImageField(upload_to="avatars/", blank=True)
+    # Resized copies of the avatar, built by apps.accounts.images.
+    avatar_renditions = models.JSONField(default=dict, blank=True, editable=False)
     bio = models.TextField(blank=True)
     location = models.CharField(max_length=100, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -1,20 +1,21 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from .models import CustomUser, Profile
+from . import images, tasks
+from .models import CustomUser, Employer, Profile
 
 
 @receiver(post_save, sender=CustomUser)
 def create_or_update_profile(sender, instance, created, **kwargs):
-    print(
-        sender,
-        "sender",
-        instance,
-        "instance",
-        created,
-        "created",
-    )
     if created:
         Profile.objects.create(user=instance)
     else:
         Profile.objects.get_or_create(user=instance)
+
+
+@receiver(post_save, sender=Employer)
+@receiver(post_save, sender=Profile)
+def queue_image_renditions(sender, instance, **kwargs):
+    for field in images.image_fields(sender):
+        if images.is_stale(instance, field):
+            tasks.build_image_renditions.delay(sender._meta.label, instance.pk, field)
@@ -0,0 +1,18 @@
+from django.core.mail import EmailMultiAlternatives
+
+from apps.tasks.queue import task
+
+from . import images
+
+
+@task(max_attempts=5)
+def send_email(subject, body, to, from_email=None, html_body=None):
+    message = EmailMultiAlternatives(subject, body, from_email, to)
+    if html_body:
+        message.attach_alternative(html_body, "text/html")
+    message.send()
+
+
+@task
+def build_image_renditions(model_label, pk, field):
+    images.build_renditions(model_label, pk, field)
@@ -0,0 +1,64 @@
+from django import template
+from django.utils.html import format_html
+
+from apps.accounts.images import renditions_field
+
+register = template.Library()
+
+
+def pick(renditions, width):
+    """The smallest rendition at least ``width`` px wide, else the largest."""
+    entries = sorted(
+        (entry for key, entry in renditions.items() if key != "source"),
+        key=lambda entry: entry["size"],
+    )
+    for entry in entries:
+        if entry["size"] >= width:
+            return entry
+    return entries[-1] if entries else None
+
+
+@register.simple_tag
+def picture(instance, field, size, alt="", css_class=""):
+    """
+    ``<picture>`` for an image field shown at ``size`` CSS pixels: WebP with
+    a JPEG fallback, each with a 2x candidate for high-density screens.
+    Renders the original upload until its renditions are built.
+
+        {% picture company "company_logo" 64 alt=company.company_name css_class="..." %}
+    """
+    file = getattr(instance, field)
+    if not file:
+        return ""
+    renditions = getattr(instance, renditions_field(field))
+    normal = pick(renditions, size)
+    if normal is None or renditions.get("source") != file.name:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" width="{}" height="{}" loading="lazy">',
+            file.url,
+            alt,
+            css_class,
+            size,
+            size,
+        )
+
+    dense = pick(renditions, size * 2)
+    candidates = [(normal, "1x")] + ([(dense, "2x")] if dense is not normal else [])
+
+    def srcset(fmt):
+        return ", ".join(
+            f"{file.storage.url(entry[fmt])} {density}" for entry, density in candidates
+        )
+
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}">'
+        '<img src="{}" srcset="{}" alt="{}" class="{}" width="{}" height="{}" '
+        'loading="lazy" decoding="async"></picture>',
+        srcset("webp"),
+        file.storage.url(normal["jpeg"]),
+        srcset("jpeg"),
+        alt,
+        css_class,
+        size,
+        size,
+    )
@@ -1,3 +1,123 @@
-from django.test import TestCase
+import io
+import tempfile
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from PIL import Image
+
+from apps.accounts.models import Employer, JobSeeker, Profile
+from apps.tasks.queue import run_pending_tasks
+from core.testing import QueryBudgetTestCase, SeededTestCase
+
+
+class ProfileQueryBudgetTests(QueryBudgetTestCase):
+    def test_job_seeker_profile(self):
+        seeker = JobSeeker.objects.select_related("user").first()
+        # session, user, profile, job seeker, recent applications with jobs
+        self.assertQueryBudget(reverse("accounts:user_profile"), 5, user=seeker.user)
+
+    def test_employer_profile(self):
+        employer = Employer.objects.select_related("user").first()
+        # session, user, profile, employer, recent active jobs
+        self.assertQueryBudget(reverse("accounts:user_profile"), 5, user=employer.user)
+
+    def test_client_session_does_not_log_into_admin(self):
+        employer = Employer.objects.select_related("user").first()
+        employer.user.is_staff = True
+        employer.user.save()
+        self.login(employer.user)
+
+        self.assertEqual(
+            self.client.get(reverse("accounts:user_profile")).status_code, 200
+        )
+        self.assertEqual(self.client.get("/admin/").status_code, 302)
+
+
+def image_upload(name, size, fmt="JPEG", mode="RGB"):
+    image = Image.new(mode, size, "red")
+    exif = Image.Exif()
+    exif[0x0112] = 6  # orientation: rotated 90 degrees
+    exif[0x8825] = {2: (51.0, 30.0, 0.0)}  # GPS latitude
+    output = io.BytesIO()
+    image.save(output, fmt, exif=exif.tobytes())
+    return SimpleUploadedFile(name, output.getvalue())
+
+
+class ImageRenditionTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+        self.employer = Employer.objects.first()
+
+    def upload_logo(self, upload):
+        self.employer.company_logo = upload
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employer.save()
+        run_pending_tasks()
+        self.employer.refresh_from_db()
+        return self.employer.company_logo_renditions
+
+    def test_builds_stripped_renditions_off_the_request(self):
+        renditions = self.upload_logo(image_upload("logo.jpg", (3000, 2000)))
+
+        self.assertEqual(renditions["source"], self.employer.company_logo.name)
+        self.assertEqual(
+            [key for key in renditions if key != "source"], ["64", "128", "256"]
+        )
+        storage = self.employer.company_logo.storage
+        for entry in (renditions["64"], renditions["256"]):
+            self.assertRegex(
+                entry["webp"], r"^company_logos/renditions/[0-9a-f]{20}-\d+\.webp$"
+            )
+            for fmt in ("webp", "jpeg"):
+                with storage.open(entry[fmt]) as file, Image.open(file) as image:
+                    self.assertEqual(image.size, (entry["size"], entry["size"]))
+                    self.assertFalse(image.getexif())
+
+        profile = Profile.objects.first()
+        profile.avatar = image_upload("me.jpg", (3000, 2000))
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+        run_pending_tasks()
+        profile.refresh_from_db()
+        self.assertEqual(list(profile.avatar_renditions), ["source", "80", "160"])
+
+    def test_small_images_are_not_upscaled(self):
+        renditions = self.upload_logo(image_upload("logo.png", (50, 40), "PNG", "RGBA"))
+        self.assertEqual([key for key in renditions if key != "source"], ["40"])
+
+    def test_unreadable_upload_falls_back_to_original(self):
+        upload = SimpleUploadedFile("logo.png", b"not an image")
+        with self.assertLogs("apps.accounts.images", "WARNING"):
+            renditions = self.upload_logo(upload)
+        self.assertEqual(renditions, {"source": self.employer.company_logo.name})
+        response = self.client.get(
+            reverse("jobs:company_detail", args=[self.employer.pk])
+        )
+        self.assertContains(response, f'src="{self.employer.company_logo.url}"')
+
+    def test_pages_serve_renditions(self):
+        url = reverse("jobs:companies")
+        self.client.get(url)
+        renditions = self.upload_logo(image_upload("logo.jpg", (600, 600)))
+
+        small, large = renditions["64"]["webp"], renditions["128"]["webp"]
+        response = self.client.get(url)
+        self.assertContains(
+            response,
+            f'<source type="image/webp" srcset="/media/{small} 1x, /media/{large} 2x">',
+        )
+        self.assertNotContains(response, self.employer.company_logo.url)
+
+    def test_command_builds_missing_renditions(self):
+        self.employer.company_logo = image_upload("logo.jpg", (300, 300))
+        self.employer.save()  # no on-commit task
+        out = io.StringIO()
+        call_command("build_image_renditions", stdout=out)
+        self.assertIn("Built renditions for 1 images.", out.getvalue())
+        self.employer.refresh_from_db()
+        self.assertIn("256", self.employer.company_logo_renditions)
@@ -1,5 +1,6 @@
 from django.urls import path, reverse_lazy
 from . import views
+from .forms import QueuedPasswordResetForm
 from django.contrib.auth import views as auth_views
 
 app_name = 'accounts'
@@ -16,6 +17,7 @@ urlpatterns = [
     path('password_reset/', 
          auth_views.PasswordResetView.as_view(
              template_name='accounts/password_reset.html',
+             form_class=QueuedPasswordResetForm,
              email_template_name='accounts/password_reset_email.html',
              subject_template_name='accounts/password_reset_subject.txt',
              success_url=reverse_lazy('accounts:password_reset_done'),
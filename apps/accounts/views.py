@@ -176,7 +176,11 @@ def user_profile(request):
     employer = request.user.employer if request.user.is_employer and hasattr(request.user, "employer") else None
     applications = None
     if jobseeker:
-        applications = Application.objects.filter(job_seeker=request.user.jobseeker).order_by("-applied_date")[:3]
+        applications = (
+            Application.objects.filter(job_seeker=jobseeker)
+            .select_related("job")
+            .order_by("-applied_date")[:3]
+        )
 
     jobs = None
     if employer:
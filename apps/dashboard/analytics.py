@@ -0,0 +1,271 @@
+"""
+Per-job and per-employer rollups of applications and job views, in total
+(``JobStats``, ``EmployerStats``) and per day (``JobDailyStats``,
+``EmployerDailyStats``), so employer dashboards read a handful of rows
+however many postings the employer has.
+
+Every table holds the same counters. A daily row counts the applications
+applied that day, by their current status: a new application adds one to
+``applications`` and to its status, a status change moves one between
+statuses and a withdrawal takes both back, all on the day it was applied.
+The totals are the sums of the daily rows, and every change lands on the
+same row ``rebuild_rollups`` would count it in. Job rollups are
+deleted with their job; employer rollups keep counting applications to jobs
+that were archived since.
+
+Application saves and deletes update the rollups through
+``apps.dashboard.signals``. A deleted job takes its applications out of the
+employer rollups in one grouped query (``job_deleted``) rather than one
+change per application; applications archived first stay counted. Rows
+written in bulk bypass the signals: run ``rebuild_rollups``
+(``manage.py rebuild_analytics``) afterwards.
+Impressions and views arrive in batches from ``apps.dashboard.tracking``.
+"""
+
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.jobs.models import Application, ArchivedApplication, Job
+
+from .models import EmployerDailyStats, EmployerStats, JobDailyStats, JobStats
+
+STATUSES = [status for status, _label in Application.STATUS_CHOICES]
+APPLICATION_COUNTERS = ["applications", *STATUSES]
+TRAFFIC_COUNTERS = ["impressions", "views"]
+COUNTERS = [*TRAFFIC_COUNTERS, *APPLICATION_COUNTERS]
+
+
+def application_changed(application, old_status, new_status, employer_id=None):
+    """
+    Record an application moving from ``old_status`` to ``new_status``;
+    ``None`` stands for not existing (before creation, after withdrawal).
+    """
+    if old_status == new_status:
+        return
+    deltas = Counter()
+    if old_status is None:
+        deltas["applications"] += 1
+    else:
+        deltas[old_status] -= 1
+    if new_status is None:
+        deltas["applications"] -= 1
+    else:
+        deltas[new_status] += 1
+    if employer_id is None:
+        employer_id = _employer_id(application)
+    day = timezone.localdate(application.applied_date)
+    record([(application.job_id, employer_id, day, deltas)])
+
+
+def _employer_id(application):
+    if Application.job.is_cached(application):
+        return application.job.employer_id
+    return (
+        Job.objects.filter(pk=application.job_id)
+        .values_list("employer_id", flat=True)
+        .get()
+    )
+
+
+def job_deleted(job):
+    """
+    Take the applications deleted with ``job`` out of its employer's rollups,
+    from the days they were applied on, as ``rebuild_rollups`` counts them.
+    The job's own rollups are deleted with it.
+    """
+    archived = ArchivedApplication.objects.filter(job_id=job.pk).values("pk")
+    rows = (
+        Application.objects.filter(job_id=job.pk)
+        .exclude(pk__in=archived)
+        .annotate(day=TruncDate("applied_date"))
+        .values("day", "status")
+        .annotate(total=Count("pk"))
+        .order_by()
+    )
+    days = defaultdict(Counter)
+    for row in rows:
+        days[row["day"]].update(
+            {"applications": row["total"], row["status"]: row["total"]}
+        )
+    if not days:
+        return
+    totals = Counter()
+    for day, counts in days.items():
+        totals.update(counts)
+        _take(EmployerDailyStats, {"employer_id": job.employer_id, "day": day}, counts)
+    _take(EmployerStats, {"employer_id": job.employer_id}, totals)
+
+
+def _take(model, key, counts):
+    # No row means nothing was counted there; don't create one.
+    model.objects.filter(**key).update(
+        **{name: F(name) - count for name, count in counts.items()}
+    )
+
+
+def record_traffic(counts, batch_size=500):
+    """
+    Add ``{(day, job_id): {"impressions": n, "views": n}}`` to the rollups.
+    Per table and batch this costs one INSERT of the missing rows and one
+    UPDATE adding all the counts, however many views each job got.
+    """
+    employers = dict(
+        Job.objects.filter(pk__in={job_id for _day, job_id in counts})
+        .order_by()
+        .values_list("pk", "employer_id")
+    )
+    tables = defaultdict(lambda: defaultdict(Counter))
+    for (day, job_id), deltas in counts.items():
+        # Jobs deleted since they were viewed are skipped.
+        if job_id in employers:
+            for model, key in _rollup_keys(job_id, employers[job_id], day):
+                tables[model][key].update(deltas)
+
+    with transaction.atomic():
+        for model, rows in tables.items():
+            rows = list(rows.items())
+            for start in range(0, len(rows), batch_size):
+                _add_in_bulk(model, rows[start : start + batch_size])
+
+
+def _add_in_bulk(model, rows):
+    model.objects.bulk_create(
+        [model(**dict(key)) for key, _deltas in rows], ignore_conflicts=True
+    )
+    increments = {}
+    for name in TRAFFIC_COUNTERS:
+        whens = [
+            When(Q(**dict(key)), then=Value(deltas[name]))
+            for key, deltas in rows
+            if deltas[name]
+        ]
+        if whens:
+            increments[name] = F(name) + Case(*whens, default=Value(0))
+    if not increments:
+        return
+    # Narrowed to the rows' ids and days; the CASE adds 0 to any other row.
+    lookups = defaultdict(set)
+    for key, _deltas in rows:
+        for field, value in key:
+            lookups[f"{field}__in"].add(value)
+    model.objects.filter(**lookups).update(**increments)
+
+
+def record(changes):
+    """
+    Apply ``(job_id, employer_id, day, {counter: delta})`` changes to all
+    four tables. Changes to the same row are summed first, so a batch costs
+    one UPDATE per touched row.
+    """
+    rows = defaultdict(Counter)
+    for job_id, employer_id, day, deltas in changes:
+        for key in _rollup_keys(job_id, employer_id, day):
+            rows[key].update(deltas)
+
+    for (model, key), deltas in rows.items():
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if deltas:
+            _bump(model, dict(key), deltas)
+
+
+def _rollup_keys(job_id, employer_id, day):
+    """The row of each table that a change to ``job_id`` on ``day`` touches."""
+    return [
+        (JobStats, (("job_id", job_id),)),
+        (JobDailyStats, (("job_id", job_id), ("day", day))),
+        (EmployerStats, (("employer_id", employer_id),)),
+        (EmployerDailyStats, (("employer_id", employer_id), ("day", day))),
+    ]
+
+
+def _bump(model, key, deltas):
+    increments = {name: F(name) + delta for name, delta in deltas.items()}
+    if model.objects.filter(**key).update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**key, **deltas)
+    except IntegrityError:
+        # Another request created the row first.
+        model.objects.filter(**key).update(**increments)
+
+
+def rebuild_rollups(batch_size=1000):
+    """
+    Recompute every application counter from the stored applications,
+    counting each one on the day it was applied for. Impressions and views
+    are kept.
+    """
+    day = TruncDate("applied_date")
+    live = Application.objects.annotate(day=day).order_by()
+    archived = ArchivedApplication.objects.annotate(day=day).order_by()
+    # (table, its unique fields, {column: grouping lookup}, sources)
+    groups = [
+        (JobStats, ["job"], {"job_id": "job_id"}, [live]),
+        (JobDailyStats, ["job", "day"], {"job_id": "job_id", "day": "day"}, [live]),
+        (
+            EmployerStats,
+            ["employer"],
+            {"employer_id": "job__employer"},
+            [live, archived],
+        ),
+        (
+            EmployerDailyStats,
+            ["employer", "day"],
+            {"employer_id": "job__employer", "day": "day"},
+            [live, archived],
+        ),
+    ]
+    with transaction.atomic():
+        for model, unique_fields, columns, sources in groups:
+            totals = defaultdict(Counter)
+            for source in sources:
+                rows = source.values(*columns.values(), "status").annotate(
+                    total=Count("pk")
+                )
+                for row in rows:
+                    key = tuple(row[lookup] for lookup in columns.values())
+                    totals[key]["applications"] += row["total"]
+                    totals[key][row["status"]] += row["total"]
+
+            model.objects.update(**{name: 0 for name in APPLICATION_COUNTERS})
+            model.objects.bulk_create(
+                (
+                    model(
+                        **dict(zip(columns, key)),
+                        **{name: counts[name] for name in APPLICATION_COUNTERS},
+                    )
+                    for key, counts in totals.items()
+                ),
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=unique_fields,
+                update_fields=APPLICATION_COUNTERS,
+            )
+
+
+def daily_series(employer, days):
+    """``EmployerDailyStats`` for the last ``days`` days, zeros where missing."""
+    today = timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    stored = {
+        row.day: row
+        for row in EmployerDailyStats.objects.filter(employer=employer, day__gte=start)
+    }
+    return [
+        stored.get(day) or EmployerDailyStats(employer=employer, day=day)
+        for day in (start + timedelta(days=offset) for offset in range(days))
+    ]
+
+
+def seeker_summary(job_seeker):
+    """A job seeker's application count, in total and by status, in one query."""
+    return Application.objects.filter(job_seeker=job_seeker).aggregate(
+        applications=Count("pk"),
+        **{status: Count("pk", filter=Q(status=status)) for status in STATUSES},
+    )
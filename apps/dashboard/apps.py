@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.dashboard'  # Changed from 'dashboard' to 'apps.dashboard'
\ No newline at end of file
+    name = 'apps.dashboard'  # Changed from 'dashboard' to 'apps.dashboard'
+
+    def ready(self):
+        import apps.dashboard.signals  # noqa: F401
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.models import Employer
+from apps.dashboard.exports import FORMATS, application_rows, export_chunks
+
+
+class Command(BaseCommand):
+    help = "Stream every application to an employer's jobs as CSV or XLSX."
+
+    def add_arguments(self, parser):
+        parser.add_argument("employer", type=int, help="Employer id.")
+        parser.add_argument("--format", choices=FORMATS, default="csv")
+        parser.add_argument(
+            "--output", help="File to write; CSV goes to stdout by default."
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Rows fetched from the database cursor at a time.",
+        )
+
+    def handle(self, *args, **options):
+        employer = Employer.objects.filter(pk=options["employer"]).first()
+        if employer is None:
+            raise CommandError(f"Employer {options['employer']} does not exist.")
+        if options["format"] == "xlsx" and not options["output"]:
+            raise CommandError("XLSX exports need --output.")
+
+        rows = application_rows(employer, chunk_size=options["chunk_size"])
+        chunks = export_chunks(options["format"], rows)
+        if options["output"]:
+            with open(options["output"], "wb") as output:
+                for chunk in chunks:
+                    output.write(chunk.encode() if isinstance(chunk, str) else chunk)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.analytics import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the per-job and per-employer application rollups from the "
+        "stored applications (views are kept)."
+    )
+
+    def handle(self, *args, **options):
+        rebuild_rollups()
+        self.stdout.write(self.style.SUCCESS("Rebuilt the analytics rollups."))
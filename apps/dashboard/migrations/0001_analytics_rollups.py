@@ -0,0 +1,137 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("accounts", "0007_image_renditions"),
+        ("jobs", "0011_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmployerStats",
+            fields=[
+                ("views", models.IntegerField(default=0)),
+                ("applications", models.IntegerField(default=0)),
+                ("pending", models.IntegerField(default=0)),
+                ("reviewing", models.IntegerField(default=0)),
+                ("accepted", models.IntegerField(default=0)),
+                ("rejected", models.IntegerField(default=0)),
+                (
+                    "employer",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="accounts.employer",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="JobStats",
+            fields=[
+                ("views", models.IntegerField(default=0)),
+                ("applications", models.IntegerField(default=0)),
+                ("pending", models.IntegerField(default=0)),
+                ("reviewing", models.IntegerField(default=0)),
+                ("accepted", models.IntegerField(default=0)),
+                ("rejected", models.IntegerField(default=0)),
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="jobs.job",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="EmployerDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("views", models.IntegerField(default=0)),
+                ("applications", models.IntegerField(default=0)),
+                ("pending", models.IntegerField(default=0)),
+                ("reviewing", models.IntegerField(default=0)),
+                ("accepted", models.IntegerField(default=0)),
+                ("rejected", models.IntegerField(default=0)),
+                ("day", models.DateField()),
+                (
+                    "employer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="accounts.employer",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("employer", "day"), name="employer_daily_stats_uniq"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="JobDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("views", models.IntegerField(default=0)),
+                ("applications", models.IntegerField(default=0)),
+                ("pending", models.IntegerField(default=0)),
+                ("reviewing", models.IntegerField(default=0)),
+                ("accepted", models.IntegerField(default=0)),
+                ("rejected", models.IntegerField(default=0)),
+                ("day", models.DateField()),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="jobs.job",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("job", "day"), name="job_daily_stats_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
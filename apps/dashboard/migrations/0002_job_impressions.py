@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboard", "0001_analytics_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employerdailystats",
+            name="impressions",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="employerstats",
+            name="impressions",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="jobdailystats",
+            name="impressions",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="jobstats",
+            name="impressions",
+            field=models.IntegerField(default=0),
+        ),
+    ]
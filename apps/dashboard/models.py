@@ -1,3 +1,65 @@
 from django.db import models
 
-# Create your models here.
+from apps.accounts.models import Employer
+from apps.jobs.models import Job
+
+
+class Counters(models.Model):
+    """
+    Counters shared by the rollup tables (see ``apps.dashboard.analytics``).
+    Status columns match ``Application.STATUS_CHOICES``; daily rows count
+    the applications applied that day by current status. ``impressions`` counts
+    appearances on job list pages, ``views`` opened job pages.
+    """
+
+    impressions = models.IntegerField(default=0)
+    views = models.IntegerField(default=0)
+    applications = models.IntegerField(default=0)
+    pending = models.IntegerField(default=0)
+    reviewing = models.IntegerField(default=0)
+    accepted = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def conversion(self):
+        """Applications per view, or ``None`` before the first view."""
+        return self.applications / self.views if self.views > 0 else None
+
+
+class JobStats(Counters):
+    job = models.OneToOneField(
+        Job, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+
+
+class JobDailyStats(Counters):
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="daily_stats")
+    day = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["job", "day"], name="job_daily_stats_uniq")
+        ]
+
+
+class EmployerStats(Counters):
+    employer = models.OneToOneField(
+        Employer, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+
+
+class EmployerDailyStats(Counters):
+    employer = models.ForeignKey(
+        Employer, on_delete=models.CASCADE, related_name="daily_stats"
+    )
+    day = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["employer", "day"], name="employer_daily_stats_uniq"
+            )
+        ]
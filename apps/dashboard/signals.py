@@ -0,0 +1,62 @@
+from django.db.models.signals import (
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from apps.jobs.models import Application, Job
+
+from . import analytics
+
+UNKNOWN = object()
+
+
+@receiver(post_init, sender=Application)
+def remember_status(sender, instance, **kwargs):
+    # Read from __dict__ so a deferred status is never loaded just for this.
+    if instance.pk is None:
+        instance._stored_status = None
+    else:
+        instance._stored_status = instance.__dict__.get("status", UNKNOWN)
+
+
+@receiver(pre_save, sender=Application)
+@receiver(pre_delete, sender=Application)
+def load_stored_status(sender, instance, **kwargs):
+    # The rollups also need the day applied on, which can't be loaded once
+    # the application is deleted.
+    deferred_day = "applied_date" in instance.get_deferred_fields()
+    if instance._stored_status is UNKNOWN or deferred_day:
+        status, applied_date = (
+            Application.objects.filter(pk=instance.pk)
+            .values_list("status", "applied_date")
+            .first()
+        ) or (None, None)
+        if instance._stored_status is UNKNOWN:
+            instance._stored_status = status
+        if deferred_day:
+            instance.applied_date = applied_date
+
+
+@receiver(post_save, sender=Application)
+def update_rollups(sender, instance, created, **kwargs):
+    old_status = None if created else instance._stored_status
+    analytics.application_changed(instance, old_status, instance.status)
+    instance._stored_status = instance.status
+
+
+@receiver(post_delete, sender=Application)
+def withdraw_from_rollups(sender, instance, origin=None, **kwargs):
+    # Applications deleted along with their job are taken back by
+    # release_job_applications in one query; other cascades (deleted
+    # accounts) need rebuild_rollups.
+    if getattr(origin, "model", type(origin)) is Application:
+        analytics.application_changed(instance, instance._stored_status, None)
+
+
+@receiver(pre_delete, sender=Job)
+def release_job_applications(sender, instance, **kwargs):
+    analytics.job_deleted(instance)
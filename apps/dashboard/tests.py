@@ -1,3 +1,361 @@
-from django.test import TestCase
+import csv
+import io
+import zipfile
+from datetime import timedelta
+from unittest.mock import patch
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.db.models import Count
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import Employer, JobSeeker
+from apps.jobs.models import Application, Job
+from core.testing import QueryBudgetTestCase, SeededTestCase
+
+from . import analytics, tracking
+from .models import EmployerDailyStats, EmployerStats, JobDailyStats, JobStats
+
+
+class DashboardQueryBudgetTests(QueryBudgetTestCase):
+    def test_employer_dashboard(self):
+        employer = Employer.objects.select_related("user").first()
+        # session, user, employer with totals, recent applications with
+        # jobs and seekers, page of jobs with their totals, daily rollups
+        self.assertQueryBudget(
+            reverse("dashboard:employer_dashboard"), 6, user=employer.user
+        )
+
+    def test_employer_stats_api(self):
+        employer = Employer.objects.select_related("user").first()
+        # session, user, employer with totals, daily rollups, page of jobs
+        response = self.assertQueryBudget(
+            reverse("dashboard:employer_stats") + "?days=7", 5, user=employer.user
+        )
+        data = response.json()
+        self.assertEqual(
+            data["totals"]["applications"],
+            Application.objects.filter(job__employer=employer).count(),
+        )
+        self.assertEqual(len(data["daily"]), 7)
+        self.assertEqual(len(data["jobs"]), 20)
+        job = Job.objects.get(pk=data["jobs"][0]["id"])
+        self.assertEqual(data["jobs"][0]["applications"], job.applications.count())
+
+    def test_job_seeker_dashboard(self):
+        seeker = JobSeeker.objects.select_related("user").first()
+        # session, user, job seeker, status counts,
+        # page of applications with jobs and employers, recommended jobs
+        self.assertQueryBudget(
+            reverse("dashboard:jobseeker_dashboard"), 6, user=seeker.user
+        )
+
+    def test_job_seeker_dashboard_pages_applications(self):
+        seeker = JobSeeker.objects.select_related("user").first()
+        jobs = Job.objects.exclude(applications__job_seeker=seeker)[:45]
+        Application.objects.bulk_create(
+            Application(job=job, job_seeker=seeker, status="accepted") for job in jobs
+        )
+        applications = Application.objects.filter(job_seeker=seeker)
+        total = applications.count()
+
+        response = self.assertQueryBudget(
+            reverse("dashboard:jobseeker_dashboard") + "?page=2", 6, user=seeker.user
+        )
+        self.assertEqual(response.context["total_applications"], total)
+        self.assertEqual(
+            response.context["accepted_applications"],
+            applications.filter(status="accepted").count(),
+        )
+        self.assertEqual(
+            response.context["pending_applications"],
+            applications.filter(status="pending").count(),
+        )
+        page = response.context["applications"]
+        self.assertEqual(page.number, 2)
+        self.assertEqual(page.paginator.num_pages, -(-total // 20))
+        self.assertEqual(
+            [application.pk for application in page],
+            list(
+                applications.order_by("-applied_date", "-pk").values_list(
+                    "pk", flat=True
+                )[20:40]
+            ),
+        )
+
+
+class ApplicationExportTests(SeededTestCase):
+    def export(self, format, user):
+        self.login(user)
+        # session, user, employer, application rows
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse("dashboard:export_applications", args=[format])
+            )
+            content = b"".join(response.streaming_content)
+        self.assertIn("attachment", response["Content-Disposition"])
+        return content
+
+    def test_csv_export_streams_every_application(self):
+        employer = Employer.objects.select_related("user").first()
+        applications = Application.objects.filter(job__employer=employer)
+
+        rows = list(csv.reader(io.StringIO(self.export("csv", employer.user).decode())))
+
+        self.assertEqual(rows[0][:3], ["Application ID", "Job ID", "Job"])
+        self.assertEqual(len(rows) - 1, applications.count())
+        self.assertEqual(
+            {int(row[0]) for row in rows[1:]},
+            set(applications.values_list("pk", flat=True)),
+        )
+
+    def test_xlsx_export_is_a_workbook(self):
+        employer = Employer.objects.select_related("user").first()
+        content = self.export("xlsx", employer.user)
+
+        with zipfile.ZipFile(io.BytesIO(content)) as workbook:
+            self.assertIsNone(workbook.testzip())
+            sheet = workbook.read("xl/worksheets/sheet1.xml").decode()
+        count = Application.objects.filter(job__employer=employer).count()
+        self.assertEqual(sheet.count("<row>"), count + 1)
+
+    def test_formulas_are_neutralised_in_csv(self):
+        application = Application.objects.select_related("job__employer__user").first()
+        application.job.title = "=HYPERLINK(1)"
+        application.job.save()
+
+        content = self.export("csv", application.job.employer.user).decode()
+        self.assertIn("'=HYPERLINK(1)", content)
+
+    def test_job_seekers_cannot_export(self):
+        seeker = JobSeeker.objects.select_related("user").first()
+        self.login(seeker.user)
+        response = self.client.get(
+            reverse("dashboard:export_applications", args=["csv"])
+        )
+        self.assertRedirects(response, reverse("jobs:home"))
+
+
+@override_settings(TASKS_EAGER=True)
+class AnalyticsRollupTests(SeededTestCase):
+    def snapshot(self):
+        return {
+            model: sorted(
+                model.objects.values_list(*analytics.APPLICATION_COUNTERS).order_by()
+            )
+            for model in (JobStats, JobDailyStats, EmployerStats, EmployerDailyStats)
+        }
+
+    def test_signals_keep_rollups_equal_to_a_rebuild(self):
+        employer = Employer.objects.first()
+        job = Job.objects.filter(employer=employer, is_active=True).first()
+        seekers = JobSeeker.objects.exclude(applications__job=job)[:3]
+        applications = [
+            Application.objects.create(job=job, job_seeker=seeker) for seeker in seekers
+        ]
+        applications[0].status = "accepted"
+        applications[0].save()
+        # A deferred status is looked up before the change is recorded.
+        deferred = Application.objects.only("pk", "job").get(pk=applications[1].pk)
+        deferred.status = "rejected"
+        deferred.save()
+
+        stats = JobStats.objects.get(job=job)
+        self.assertEqual((stats.pending, stats.accepted, stats.rejected), (1, 1, 1))
+        self.login(applications[2].job_seeker.user)
+        self.client.post(
+            reverse("dashboard:withdraw_application", args=[applications[2].pk])
+        )
+
+        incremental = self.snapshot()
+        # Every application applied today was also counted today.
+        analytics.rebuild_rollups()
+        self.assertEqual(self.snapshot(), incremental)
+
+    def test_later_changes_count_on_the_day_applied(self):
+        job = Job.objects.filter(is_active=True).first()
+        seekers = JobSeeker.objects.exclude(applications__job=job)[:3]
+        applications = [
+            Application.objects.create(job=job, job_seeker=seeker) for seeker in seekers
+        ]
+        applied = timezone.now() - timedelta(days=3)
+        Application.objects.filter(pk__in=[a.pk for a in applications]).update(
+            applied_date=applied
+        )
+        analytics.rebuild_rollups()
+
+        for application in Application.objects.filter(
+            pk__in=[a.pk for a in applications[:2]]
+        ):
+            application.status = "reviewing"
+            application.save()
+        Application.objects.defer("applied_date").get(pk=applications[2].pk).delete()
+
+        daily = JobDailyStats.objects.get(job=job, day=timezone.localdate(applied))
+        self.assertEqual((daily.applications, daily.reviewing), (2, 2))
+        self.assertEqual(daily.pending, 0)
+        incremental = self.snapshot()
+        analytics.rebuild_rollups()
+        self.assertEqual(self.snapshot(), incremental)
+
+    def test_deleted_jobs_leave_the_employer_rollups(self):
+        job = Job.objects.annotate(n=Count("applications")).filter(n__gt=1).first()
+        employer = job.employer
+        seeker = JobSeeker.objects.exclude(applications__job=job).first()
+        Application.objects.create(job=job, job_seeker=seeker, status="accepted")
+        before = EmployerStats.objects.get(employer=employer)
+        removed = job.applications.count()
+        accepted = job.applications.filter(status="accepted").count()
+
+        job.delete()
+
+        after = EmployerStats.objects.get(employer=employer)
+        self.assertEqual(after.applications, before.applications - removed)
+        self.assertEqual(after.accepted, before.accepted - accepted)
+        incremental = self.snapshot()
+        analytics.rebuild_rollups()
+        self.assertEqual(self.snapshot(), incremental)
+
+    def test_views_and_conversion(self):
+        job = Job.objects.filter(applications__isnull=False).first()
+        today = timezone.localdate()
+        analytics.record_traffic(
+            {(today, job.pk): {"views": 40}, (today, 0): {"views": 5}}
+        )
+        analytics.record_traffic({(today, job.pk): {"views": 10, "impressions": 3}})
+        stats = JobStats.objects.get(job=job)
+        self.assertEqual((stats.views, stats.impressions), (50, 3))
+        self.assertEqual(stats.conversion, stats.applications / 50)
+        self.assertEqual(EmployerStats.objects.get(employer=job.employer).views, 50)
+
+        analytics.rebuild_rollups()
+        self.assertEqual(JobStats.objects.get(job=job).views, 50)
+
+    def test_employer_totals_survive_archiving(self):
+        employer = Employer.objects.first()
+        before = EmployerStats.objects.get(employer=employer).applications
+        call_command("expire_jobs", stdout=io.StringIO())
+        Job.objects.filter(employer=employer).update(
+            is_active=False, updated_at=timezone.now() - timedelta(days=365)
+        )
+        call_command("expire_jobs", stdout=io.StringIO())
+
+        self.assertFalse(Job.objects.filter(employer=employer).exists())
+        self.assertFalse(JobStats.objects.filter(job__employer=employer).exists())
+        self.assertEqual(
+            EmployerStats.objects.get(employer=employer).applications, before
+        )
+        analytics.rebuild_rollups()
+        self.assertEqual(
+            EmployerStats.objects.get(employer=employer).applications, before
+        )
+
+
+class ViewTrackingTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        tracking.reset()
+
+    def test_views_are_buffered_and_deduplicated(self):
+        job = Job.objects.filter(is_active=True).first()
+        url = reverse("jobs:job_detail", args=[job.pk])
+        self.client.get(url)
+        self.client.get(url)
+        self.client.get(url, HTTP_USER_AGENT="another browser")
+        page = self.client.get(reverse("jobs:job_list")).context["jobs"]
+        self.assertFalse(JobStats.objects.filter(job=job, views__gt=0).exists())
+
+        # Looking up employers, then an INSERT and an UPDATE per table in a
+        # savepoint.
+        with self.assertNumQueries(11):
+            self.assertEqual(tracking.flush(), len({job.pk, *(j.pk for j in page)}))
+        self.assertEqual(JobStats.objects.get(job=job).views, 2)
+        daily = EmployerDailyStats.objects.get(
+            employer=job.employer, day=timezone.localdate()
+        )
+        self.assertEqual(daily.views, 2)
+        self.assertEqual(
+            sorted(
+                JobStats.objects.filter(impressions__gt=0).values_list("job", flat=True)
+            ),
+            sorted(j.pk for j in page),
+        )
+        self.assertEqual(tracking.flush(), 0)
+
+    @override_settings(VIEW_TRACKING_DEDUP_SECONDS=0)
+    def test_every_view_counts_without_a_window(self):
+        job = Job.objects.filter(is_active=True).first()
+        for _ in range(3):
+            self.client.get(reverse("jobs:job_detail", args=[job.pk]))
+        tracking.flush()
+        self.assertEqual(JobStats.objects.get(job=job).views, 3)
+
+    @override_settings(VIEW_TRACKING_DEDUP_SECONDS=0)
+    def test_not_modified_responses_count(self):
+        job = Job.objects.filter(is_active=True).first()
+        shown = []
+        for url in (
+            reverse("jobs:job_detail", args=[job.pk]),
+            reverse("jobs:job_list"),
+        ):
+            response = self.client.get(url)
+            if "jobs" in response.context:
+                shown = [j.pk for j in response.context["jobs"]]
+            response = self.client.get(url, headers={"If-None-Match": response["ETag"]})
+            self.assertEqual(response.status_code, 304)
+        tracking.flush()
+        self.assertEqual(JobStats.objects.get(job=job).views, 2)
+        self.assertEqual(
+            dict(
+                JobStats.objects.filter(impressions__gt=0).values_list(
+                    "job", "impressions"
+                )
+            ),
+            dict.fromkeys(shown, 2),
+        )
+
+    def test_each_process_starts_its_own_flusher(self):
+        job = Job.objects.filter(is_active=True).first()
+        url = reverse("jobs:job_detail", args=[job.pk])
+        with (
+            patch.object(tracking, "_flush_interval", 30),
+            patch.object(tracking, "_flusher_pid", None),
+            patch.object(tracking.threading, "Thread") as thread,
+            patch.object(tracking.os, "getpid", return_value=100),
+        ):
+            self.client.get(url)
+            self.client.get(url)
+            self.assertEqual(thread.return_value.start.call_count, 1)
+            # A worker forked after the first thread started.
+            with patch.object(tracking.os, "getpid", return_value=101):
+                self.client.get(url)
+            self.assertEqual(thread.return_value.start.call_count, 2)
+
+    def test_failed_flush_keeps_the_counts(self):
+        job = Job.objects.filter(is_active=True).first()
+        self.client.get(reverse("jobs:job_detail", args=[job.pk]))
+        with (
+            patch.object(analytics, "record_traffic", side_effect=DatabaseError),
+            self.assertLogs("apps.dashboard.tracking", "ERROR"),
+        ):
+            self.assertEqual(tracking.flush(), 0)
+        self.assertEqual(tracking.flush(), 1)
+        self.assertEqual(JobStats.objects.get(job=job).views, 1)
+
+    def test_forgetting_stops_at_the_first_recent_visitor(self):
+        for job_id, seen in ((1, 0.0), (2, 3.0), (3, 8.0), (4, 1.0)):
+            tracking._seen["visitor", "views", job_id] = seen
+        tracking._forget(now=10.0, window=5)
+        # 4 is stale but kept behind 3, which is still in the window.
+        self.assertEqual([key[2] for key in tracking._seen], [3, 4])
+
+    def test_a_full_buffer_evicts_down_to_the_target(self):
+        request = RequestFactory().get("/")
+        request.session = self.client.session
+        with patch.multiple(tracking, MAX_SEEN=8, SEEN_TARGET=6):
+            tracking.record(request, "impressions", range(8))
+            self.assertEqual(len(tracking._seen), 8)
+            tracking.record(request, "impressions", [8])
+        self.assertEqual([key[2] for key in tracking._seen], [2, 3, 4, 5, 6, 7, 8])
@@ -0,0 +1,159 @@
+"""
+Job impressions (rows shown on job list pages) and views (job pages opened),
+counted in memory and written to the analytics rollups in batches.
+
+Views call ``record``, which only bumps a counter in this process. A daemon
+thread, enabled by ``core.wsgi``/``core.asgi`` and started by the first
+``record`` in each process (so workers forked from a preloaded application
+get their own), hands the summed counts to
+``analytics.record_traffic`` every ``VIEW_TRACKING_FLUSH_INTERVAL`` seconds
+and once more at exit, so requests never wait on the write and a popular job
+costs one UPDATE per interval rather than one per view. Counts buffered in a
+process that is killed are lost.
+
+A visitor (session, or address and browser when there is none) is counted
+once per job and kind within ``VIEW_TRACKING_DEDUP_SECONDS``, as far as this
+process has seen.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from . import analytics
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+# (day, job id) -> {"impressions": n, "views": n}
+_counts = defaultdict(Counter)
+# (visitor, kind, job id) -> time.monotonic() when it was last counted,
+# oldest first
+_seen = OrderedDict()
+# Flush interval once ``start_flusher`` was called, and the process whose
+# flusher thread is running.
+_flush_interval = None
+_flusher_pid = None
+
+# Visitors remembered for deduplication; past this, the oldest are dropped
+# early, down to SEEN_TARGET so it doesn't happen again on the next request.
+MAX_SEEN = 100_000
+SEEN_TARGET = MAX_SEEN * 3 // 4
+
+
+def visitor(request):
+    session_key = request.session.session_key
+    if session_key:
+        return session_key
+    address = request.META.get("REMOTE_ADDR", "")
+    browser = request.META.get("HTTP_USER_AGENT", "")
+    raw = f"{address}|{browser}"
+    return hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+
+def record(request, kind, job_ids):
+    """Count ``kind`` ("impressions" or "views") of ``job_ids`` for this request."""
+    who = visitor(request)
+    day = timezone.localdate()
+    now = time.monotonic()
+    window = settings.VIEW_TRACKING_DEDUP_SECONDS
+    with _lock:
+        if _flush_interval and _flusher_pid != os.getpid():
+            _start_thread()
+        if len(_seen) >= MAX_SEEN:
+            _forget(now, window, SEEN_TARGET)
+        for job_id in job_ids:
+            key = (who, kind, job_id)
+            seen = _seen.get(key)
+            if seen is not None and now - seen < window:
+                continue
+            _seen[key] = now
+            _seen.move_to_end(key)
+            _counts[day, job_id][kind] += 1
+
+
+def replay(request, tracked):
+    """
+    ``record`` again what a page counted when rendered, ``{kind: job_ids}``,
+    for a revalidation of it answered with a 304.
+    """
+    for kind, job_ids in tracked.items():
+        record(request, kind, job_ids)
+
+
+def _forget(now, window, limit=None):
+    """
+    Drop visitors outside the window, then the oldest until at most
+    ``limit`` remain. Stops at the first key it keeps.
+    """
+    while _seen:
+        key, seen = next(iter(_seen.items()))
+        if now - seen < window and (limit is None or len(_seen) <= limit):
+            break
+        _seen.popitem(last=False)
+
+
+def flush():
+    """Write the buffered counts; returns how many (day, job) rows they had."""
+    global _counts
+    with _lock:
+        counts, _counts = _counts, defaultdict(Counter)
+        _forget(time.monotonic(), settings.VIEW_TRACKING_DEDUP_SECONDS)
+    if not counts:
+        return 0
+    try:
+        analytics.record_traffic(counts)
+    except Exception:
+        logger.exception("Could not write job views; keeping them for the next flush")
+        with _lock:
+            for key, deltas in counts.items():
+                _counts[key].update(deltas)
+        return 0
+    return len(counts)
+
+
+def start_flusher():
+    """
+    Flush every ``VIEW_TRACKING_FLUSH_INTERVAL`` seconds and at exit. The
+    thread starts with the first ``record`` in each process.
+    """
+    global _flush_interval
+    interval = settings.VIEW_TRACKING_FLUSH_INTERVAL
+    with _lock:
+        if _flush_interval is not None or not interval:
+            return
+        _flush_interval = interval
+    atexit.register(flush)
+
+
+def _start_thread():
+    # Called with _lock held.
+    global _flusher_pid
+    _flusher_pid = os.getpid()
+    threading.Thread(
+        target=_flush_forever, args=(_flush_interval,), name="job-views", daemon=True
+    ).start()
+
+
+def _flush_forever(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            flush()
+        finally:
+            # Connections are per thread; don't hold this one between flushes.
+            connections.close_all()
+
+
+def reset():
+    with _lock:
+        _counts.clear()
+        _seen.clear()
@@ -6,6 +6,12 @@ app_name = "dashboard"
 urlpatterns = [
     path("", views.home, name="home"),
     path("employer/", views.employer_dashboard, name="employer_dashboard"),
+    path("employer/stats/", views.employer_stats, name="employer_stats"),
+    path(
+        "employer/applications.<str:format>",
+        views.export_applications,
+        name="export_applications",
+    ),
     path("jobseeker/", views.job_seeker_dashboard, name="jobseeker_dashboard"),
     path(
         "application/<int:application_id>/edit/",
@@ -1,7 +1,16 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.paginator import Paginator
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from apps.accounts.models import Employer
+from apps.jobs.matching import recommended_jobs
 from apps.jobs.models import Job, Application
+from apps.jobs.pagination import KeysetPaginator
+from . import analytics
+from .exports import FORMATS, application_rows, export_chunks
+from .models import EmployerStats, JobStats
 from django.shortcuts import render
 
 
@@ -9,43 +18,139 @@ def home(request):
     return render(request, "dashboard/home.html")
 
 
+def dashboard_employer(request):
+    """The signed-in employer with its ``stats`` row, or ``None``."""
+    if not request.user.is_employer:
+        return None
+    return Employer.objects.select_related("stats").filter(user=request.user).first()
+
+
+def employer_jobs_page(employer, cursor, per_page=20):
+    """A cursor page of the employer's jobs, each with its ``stats`` row."""
+    jobs = Job.objects.filter(employer=employer).select_related("stats")
+    return KeysetPaginator(jobs, per_page).get_page(cursor)
+
+
+def stats_or_zero(instance, model):
+    """``instance.stats``, or an unsaved all-zero row before the first event."""
+    return getattr(instance, "stats", None) or model()
+
+
 @login_required
 def employer_dashboard(request):
-    if not request.user.is_employer:
+    employer = dashboard_employer(request)
+    if employer is None:
         messages.error(request, "Access denied. Employer account required.")
         return redirect("jobs:home")
 
-    posted_jobs = Job.objects.filter(employer=request.user.employer)
-    recent_applications = Application.objects.filter(
-        job__employer=request.user.employer
-    ).order_by("-applied_date")[:5]
+    recent_applications = (
+        Application.objects.filter(job__employer=employer)
+        .select_related("job", "job_seeker__user")
+        .order_by("-applied_date")[:5]
+    )
+    jobs = employer_jobs_page(employer, request.GET.get("cursor"))
+    daily = analytics.daily_series(employer, 30)
 
     context = {
-        "posted_jobs": posted_jobs,
+        "employer": employer,
+        "stats": stats_or_zero(employer, EmployerStats),
+        "jobs": [(job, stats_or_zero(job, JobStats)) for job in jobs],
+        "jobs_page": jobs,
         "recent_applications": recent_applications,
-        "total_jobs": posted_jobs.count(),
-        "total_applications": Application.objects.filter(
-            job__employer=request.user.employer
-        ).count(),
+        "last_30_days": {
+            "applications": sum(row.applications for row in daily),
+            "views": sum(row.views for row in daily),
+        },
     }
     return render(request, "dashboard/employer_dashboard.html", context)
 
 
+def counters(stats):
+    return {
+        **{name: getattr(stats, name) for name in analytics.COUNTERS},
+        "conversion": stats.conversion,
+    }
+
+
+@login_required
+def employer_stats(request):
+    """
+    Dashboard data as JSON, read from the rollups only: totals, one row per
+    day for the last ``?days=`` days (up to 365) and a cursor page of jobs.
+    """
+    employer = dashboard_employer(request)
+    if employer is None:
+        return JsonResponse({"error": "Employer account required."}, status=403)
+    try:
+        days = min(max(int(request.GET.get("days", 30)), 1), 365)
+    except ValueError:
+        return JsonResponse({"error": "days must be a number."}, status=400)
+    jobs = employer_jobs_page(employer, request.GET.get("cursor"))
+
+    return JsonResponse(
+        {
+            "totals": {
+                "active_jobs": employer.job_count,
+                **counters(stats_or_zero(employer, EmployerStats)),
+            },
+            "daily": [
+                {"day": row.day.isoformat(), **counters(row)}
+                for row in analytics.daily_series(employer, days)
+            ],
+            "jobs": [
+                {
+                    "id": job.pk,
+                    "title": job.title,
+                    "is_active": job.is_active,
+                    **counters(stats_or_zero(job, JobStats)),
+                }
+                for job in jobs
+            ],
+            "next": jobs.next_cursor,
+        }
+    )
+
+
+@login_required
+def export_applications(request, format):
+    if not request.user.is_employer:
+        messages.error(request, "Access denied. Employer account required.")
+        return redirect("jobs:home")
+    if format not in FORMATS:
+        raise Http404
+
+    rows = application_rows(request.user.employer)
+    response = StreamingHttpResponse(
+        export_chunks(format, rows), content_type=FORMATS[format]
+    )
+    filename = f"applications-{timezone.localdate():%Y-%m-%d}.{format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
 @login_required
 def job_seeker_dashboard(request):
     if not request.user.is_job_seeker:
         messages.error(request, "Access denied. Job seeker account required.")
         return redirect("jobs:home")
 
-    applications = Application.objects.filter(
-        job_seeker=request.user.jobseeker
-    ).order_by("-applied_date")
+    job_seeker = request.user.jobseeker
+    summary = analytics.seeker_summary(job_seeker)
+    applications = (
+        Application.objects.filter(job_seeker=job_seeker)
+        .select_related("job__employer")
+        .order_by("-applied_date", "-pk")
+    )
+    paginator = Paginator(applications, 20)
+    # Already counted by the summary.
+    paginator.count = summary["applications"]
 
     context = {
-        "applications": applications,
-        "total_applications": applications.count(),
-        "pending_applications": applications.filter(status="pending").count(),
-        "accepted_applications": applications.filter(status="accepted").count(),
+        "applications": paginator.get_page(request.GET.get("page")),
+        "total_applications": summary["applications"],
+        "pending_applications": summary["pending"],
+        "accepted_applications": summary["accepted"],
+        "recommended_jobs": recommended_jobs(job_seeker, limit=5),
     }
     return render(request, "dashboard/job_seeker_dashboard.html", context)
 
@@ -1,6 +1,6 @@
 from django import forms
 from django.contrib import admin
-from .models import Job, Category, Application
+from .models import ArchivedJob, Job, JobAlert, Category, Application
 from djmoney.models.fields import MoneyField
 from djmoney.forms.widgets import MoneyWidget
 
@@ -59,6 +59,7 @@ class CategoryForm(forms.ModelForm):
 class CategoryAdmin(admin.ModelAdmin):
     form = CategoryForm
     list_display = ("name", "icon_preview", "job_count")
+    readonly_fields = ("job_count",)
     search_fields = ("name",)
 
     def icon_preview(self, obj):
@@ -67,11 +68,6 @@ class CategoryAdmin(admin.ModelAdmin):
     icon_preview.short_description = "Icon"
     icon_preview.allow_tags = True
 
-    def job_count(self, obj):
-        return obj.job_set.count()
-
-    job_count.short_description = "Number of Jobs"
-
     class Media:
         css = {
             "all": (
@@ -88,3 +84,24 @@ class ApplicationAdmin(admin.ModelAdmin):
     list_filter = ("status", "applied_date")
     search_fields = ("job__title", "job_seeker__user__username")
     date_hierarchy = "applied_date"
+
+
+@admin.register(JobAlert)
+class JobAlertAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "job_seeker", "frequency", "is_active", "last_sent_at")
+    list_filter = ("frequency", "is_active")
+    search_fields = ("search", "location", "job_seeker__user__username")
+    raw_id_fields = ("job_seeker",)
+
+
+@admin.register(ArchivedJob)
+class ArchivedJobAdmin(admin.ModelAdmin):
+    list_display = ("title", "employer", "posted_date", "deadline", "archived_at")
+    search_fields = ("title", "employer__company_name")
+    date_hierarchy = "archived_at"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,227 @@
+"""
+Job alerts: saved searches emailed to job seekers as new jobs are posted.
+
+New jobs are matched in batches against every active alert in one pass. The
+alerts are loaded into an ``AlertIndex`` (a map per criterion plus an
+inverted index over search terms), so a job finds the alerts it satisfies
+with a few dictionary lookups instead of each alert running its search as a
+query. Matches wait in ``JobAlertMatch`` until the alert's digest is sent:
+instant alerts right after matching, daily ones by ``manage.py
+send_job_alerts``. Each job seeker gets one email per run, and emails go out
+over one connection in batches of ``JOB_ALERT_EMAIL_BATCH_SIZE``.
+"""
+
+from collections import Counter, defaultdict
+from itertools import groupby, islice
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.template import loader
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.locations import gazetteer
+
+from .facets import band_for
+from .models import Job, JobAlert, JobAlertMatch
+from .search.tokenizer import tokenize, weighted_terms
+
+# Jobs listed per alert in one email; the rest are behind the search link.
+DIGEST_JOBS_PER_ALERT = 20
+
+EMPTY = frozenset()
+
+
+class AlertIndex:
+    """
+    Active alerts indexed by criterion. Blank criteria are stored under
+    ``None`` and match every job. Search text follows the search backend:
+    every term must occur in the job, the last one as a prefix. A location
+    naming a place matches jobs in that place, other text by substring.
+    """
+
+    def __init__(self, alerts):
+        self.by_category = defaultdict(set)
+        self.by_job_type = defaultdict(set)
+        self.by_salary = defaultdict(set)
+        self.by_term = defaultdict(set)
+        self.by_prefix = defaultdict(set)
+        self.prefix_lengths = set()
+        self.exact_terms = {}
+        self.locations = {}
+        for alert in alerts:
+            pk = alert["pk"]
+            self.by_category[alert["category_id"]].add(pk)
+            self.by_job_type[alert["job_type"] or None].add(pk)
+            self.by_salary[alert["salary"] or None].add(pk)
+            if alert["location"]:
+                # A place id when the text names one, else the folded text.
+                place = gazetteer.resolve(alert["location"])
+                self.locations[pk] = (
+                    alert["location"].casefold() if place is None else place
+                )
+            terms = list(dict.fromkeys(tokenize(alert["search"])))
+            if terms:
+                *exact, prefix = terms
+                for term in exact:
+                    self.by_term[term].add(pk)
+                self.by_prefix[prefix].add(pk)
+                self.prefix_lengths.add(len(prefix))
+                self.exact_terms[pk] = len(exact)
+
+    def _lookup(self, index, key):
+        return index.get(key, EMPTY) | index.get(None, EMPTY)
+
+    def match(self, job):
+        """Ids of the alerts ``job`` satisfies."""
+        candidates = self._lookup(self.by_category, job.category_id)
+        candidates &= self._lookup(self.by_job_type, job.job_type)
+        if not candidates:
+            return set()
+        band = band_for(job.salary.amount, job.salary_currency, job.salary_type)
+        candidates &= self._lookup(self.by_salary, band)
+
+        searching = candidates & self.exact_terms.keys()
+        if searching:
+            terms = weighted_terms(job)
+            hits = Counter()
+            for term in terms:
+                for pk in self.by_term.get(term, EMPTY) & searching:
+                    hits[pk] += 1
+            prefixed = set()
+            for term in terms:
+                for length in self.prefix_lengths:
+                    if length <= len(term):
+                        prefixed |= self.by_prefix.get(term[:length], EMPTY)
+            candidates -= {
+                pk
+                for pk in searching
+                if pk not in prefixed or hits[pk] < self.exact_terms[pk]
+            }
+
+        location = job.location.casefold()
+        return {
+            pk
+            for pk in candidates
+            if pk not in self.locations
+            or self.locations[pk] == job.place_id
+            or (isinstance(self.locations[pk], str) and self.locations[pk] in location)
+        }
+
+
+def load_index():
+    return AlertIndex(
+        JobAlert.objects.filter(is_active=True).values(
+            "pk", "search", "location", "category_id", "job_type", "salary"
+        )
+    )
+
+
+def match_new_jobs(job_ids):
+    """Queue ``JobAlertMatch`` rows for new jobs; returns the matched alert ids."""
+    jobs = list(
+        Job.objects.filter(pk__in=job_ids, is_active=True).only(
+            "pk",
+            "title",
+            "description",
+            "requirements",
+            "location",
+            "place_id",
+            "category_id",
+            "job_type",
+            "salary",
+            "salary_currency",
+            "salary_type",
+        )
+    )
+    if not jobs:
+        return set()
+    index = load_index()
+    matches = [
+        JobAlertMatch(alert_id=pk, job_id=job.pk)
+        for job in jobs
+        for pk in index.match(job)
+    ]
+    JobAlertMatch.objects.bulk_create(matches, batch_size=1000, ignore_conflicts=True)
+    return {match.alert_id for match in matches}
+
+
+def absolute_url(path):
+    return settings.SITE_URL.rstrip("/") + path
+
+
+def digest_message(user, matches):
+    """One email listing ``matches`` (ordered by alert) for ``user``."""
+    alerts = []
+    for alert, alert_matches in groupby(matches, key=lambda match: match.alert):
+        jobs = [match.job for match in alert_matches]
+        alerts.append(
+            {
+                "alert": alert,
+                "jobs": [
+                    (job, absolute_url(reverse("jobs:job_detail", args=[job.pk])))
+                    for job in jobs[:DIGEST_JOBS_PER_ALERT]
+                ],
+                "more": max(len(jobs) - DIGEST_JOBS_PER_ALERT, 0),
+                "search_url": absolute_url(
+                    reverse("jobs:job_list") + "?" + urlencode(alert.criteria())
+                ),
+            }
+        )
+    total = sum(len(entry["jobs"]) + entry["more"] for entry in alerts)
+    body = loader.render_to_string(
+        "jobs/emails/job_alert_digest.txt",
+        {
+            "user": user,
+            "alerts": alerts,
+            "alerts_url": absolute_url(reverse("jobs:job_alerts")),
+        },
+    )
+    subject = f"{total} new job{'s' if total != 1 else ''} matching your alerts"
+    return EmailMessage(subject, body, to=[user.email])
+
+
+def send_digests(frequency, alert_ids=None, batch_size=None):
+    """
+    Email pending matches of ``frequency`` alerts (optionally only
+    ``alert_ids``). Returns the number of emails sent.
+    """
+    batch_size = batch_size or settings.JOB_ALERT_EMAIL_BATCH_SIZE
+    pending = JobAlertMatch.objects.filter(
+        alert__frequency=frequency, alert__is_active=True
+    )
+    if alert_ids is not None:
+        pending = pending.filter(alert_id__in=alert_ids)
+    # Jobs closed since they matched are not worth an email.
+    pending.filter(job__is_active=False).delete()
+
+    seeker_ids = iter(
+        list(
+            pending.order_by().values_list("alert__job_seeker_id", flat=True).distinct()
+        )
+    )
+    sent = 0
+    connection = get_connection()
+    while batch := list(islice(seeker_ids, batch_size)):
+        matches = list(
+            pending.filter(alert__job_seeker_id__in=batch)
+            .select_related("alert__job_seeker__user", "alert__category", "job")
+            .order_by("alert__job_seeker_id", "alert_id", "-job__posted_date")
+        )
+        messages = [
+            digest_message(seeker_matches[0].alert.job_seeker.user, seeker_matches)
+            for seeker_matches in (
+                list(group)
+                for _seeker, group in groupby(
+                    matches, key=lambda match: match.alert.job_seeker_id
+                )
+            )
+            if seeker_matches[0].alert.job_seeker.user.email
+        ]
+        sent += connection.send_messages(messages) or 0
+        JobAlertMatch.objects.filter(pk__in=[match.pk for match in matches]).delete()
+        JobAlert.objects.filter(pk__in={match.alert_id for match in matches}).update(
+            last_sent_at=timezone.now()
+        )
+    return sent
@@ -0,0 +1,264 @@
+"""
+Read-only JSON API, version 1.
+
+Rows are read with ``values()`` so no model instances are built, list pages
+are streamed as they are read from the cursor, and ``?fields=`` limits both
+the columns selected and the keys returned.
+"""
+
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.accounts.models import Employer
+
+from .cache import conditional_public_page
+from .models import Category, Job
+from .pagination import after_cursor, decode_cursor, encode_cursor
+from .views import job_last_modified
+
+# Public field name -> ``values()`` lookup.
+JOB_FIELDS = {
+    "id": "id",
+    "title": "title",
+    "employer": "employer_id",
+    "company": "employer__company_name",
+    "category": "category_id",
+    "category_name": "category__name",
+    "location": "location",
+    "salary": "salary",
+    "salary_currency": "salary_currency",
+    "salary_type": "salary_type",
+    "job_type": "job_type",
+    "posted_date": "posted_date",
+    "updated_at": "updated_at",
+    "deadline": "deadline",
+    "description": "description",
+    "requirements": "requirements",
+}
+# Long text is only sent when asked for (and on the detail endpoint).
+JOB_LIST_FIELDS = [
+    name for name in JOB_FIELDS if name not in ("description", "requirements")
+]
+CATEGORY_FIELDS = {name: name for name in ("id", "name", "icon", "job_count")}
+EMPLOYER_FIELDS = {
+    name: name
+    for name in (
+        "id",
+        "company_name",
+        "company_description",
+        "company_website",
+        "location",
+        "industry",
+        "job_count",
+    )
+}
+
+encoder = DjangoJSONEncoder(separators=(",", ":"))
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def json_response(data, status=200):
+    return JsonResponse(
+        data, status=status, json_dumps_params={"separators": (",", ":")}
+    )
+
+
+def error(message, status=400):
+    return json_response({"error": message}, status=status)
+
+
+def api_view(view):
+    """Turn ``BadRequest`` into a 400 and apply ``API_RATE_LIMIT`` per client."""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        limit, window = settings.API_RATE_LIMIT
+        if limit:
+            now = time.time()
+            client = request.META.get("REMOTE_ADDR", "")
+            key = f"api-throttle:{client}:{int(now // window)}"
+            cache.add(key, 0, window)
+            if cache.incr(key) > limit:
+                response = error("Rate limit exceeded.", status=429)
+                response["Retry-After"] = str(int(window - now % window) + 1)
+                return response
+        try:
+            return view(request, *args, **kwargs)
+        except BadRequest as exc:
+            return error(str(exc))
+
+    return wrapper
+
+
+def selected_fields(request, fields, default=None):
+    """Public names requested with ``?fields=a,b``, in the order given."""
+    requested = request.GET.get("fields")
+    if not requested:
+        return list(default or fields)
+    names = [name.strip() for name in requested.split(",") if name.strip()]
+    unknown = [name for name in names if name not in fields]
+    if unknown:
+        raise BadRequest(f"Unknown fields: {', '.join(unknown)}.")
+    return names
+
+
+def page_size(request):
+    try:
+        size = int(request.GET.get("limit", settings.API_PAGE_SIZE))
+    except ValueError:
+        raise BadRequest("limit must be an integer.")
+    return max(1, min(size, settings.API_MAX_PAGE_SIZE))
+
+
+def serialize(row, names, fields):
+    return {name: row[fields[name]] for name in names}
+
+
+def stream_page(rows, names, fields, limit, cursor_for):
+    """
+    Yield a ``{"results": [...], "next": ...}`` document row by row. ``rows``
+    holds up to ``limit + 1`` entries; the extra one only signals a next page.
+    """
+    yield '{"results":['
+    last = None
+    for count, row in enumerate(rows):
+        if count == limit:
+            break
+        if last is not None:
+            yield ","
+        yield encoder.encode(serialize(row, names, fields))
+        last = row
+    else:
+        last = None
+    yield '],"next":' + encoder.encode(cursor_for(last) if last else None) + "}"
+
+
+def streaming_json(chunks):
+    return StreamingHttpResponse(chunks, content_type="application/json")
+
+
+def integer_param(request, name):
+    value = request.GET.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer.")
+
+
+def active_jobs(request):
+    jobs = Job.objects.filter(is_active=True)
+    category = integer_param(request, "category")
+    if category is not None:
+        jobs = jobs.filter(category_id=category)
+    employer = integer_param(request, "employer")
+    if employer is not None:
+        jobs = jobs.filter(employer_id=employer)
+    job_type = request.GET.get("job_type")
+    if job_type:
+        if job_type not in dict(Job.JOB_TYPE_CHOICES):
+            raise BadRequest("Unknown job_type.")
+        jobs = jobs.filter(job_type=job_type)
+    updated_since = request.GET.get("updated_since")
+    if updated_since:
+        try:
+            since = parse_datetime(updated_since)
+        except ValueError:  # well formed, but not a date (2024-02-30)
+            since = None
+        if since is None:
+            raise BadRequest("updated_since must be an ISO 8601 datetime.")
+        if timezone.is_naive(since):
+            # Without an offset, read it in the site's time zone like form input.
+            since = timezone.make_aware(since)
+        jobs = jobs.filter(updated_at__gte=since)
+    return jobs
+
+
+@api_view
+@conditional_public_page("jobs", "categories", "employers")
+def job_list(request):
+    """Active jobs, newest first, paged with the opaque ``next`` cursor."""
+    names = selected_fields(request, JOB_FIELDS, JOB_LIST_FIELDS)
+    limit = page_size(request)
+    jobs = active_jobs(request)
+
+    cursor = request.GET.get("cursor")
+    if cursor:
+        position = decode_cursor(cursor)
+        if position is None or position[0] != "next":
+            raise BadRequest("Invalid cursor.")
+        jobs = after_cursor(jobs, *position[1:])
+    else:
+        jobs = jobs.order_by("-posted_date", "-pk")
+
+    lookups = {JOB_FIELDS[name] for name in names} | {"id", "posted_date"}
+    rows = jobs.values(*lookups)[: limit + 1].iterator(chunk_size=limit + 1)
+    return streaming_json(
+        stream_page(
+            rows, names, JOB_FIELDS, limit, lambda row: encode_cursor(row, "next")
+        )
+    )
+
+
+@api_view
+@conditional_public_page("categories", "employers", last_modified=job_last_modified)
+def job_detail(request, job_id):
+    names = selected_fields(request, JOB_FIELDS)
+    row = (
+        Job.objects.filter(id=job_id, is_active=True)
+        .values(*{JOB_FIELDS[name] for name in names})
+        .first()
+    )
+    if row is None:
+        return error("Not found.", status=404)
+    return json_response(serialize(row, names, JOB_FIELDS))
+
+
+@api_view
+@conditional_public_page("jobs", "categories")
+def category_list(request):
+    names = selected_fields(request, CATEGORY_FIELDS)
+    rows = Category.objects.order_by("name", "pk").values(*names).iterator()
+    return streaming_json(
+        stream_page(rows, names, CATEGORY_FIELDS, None, lambda row: None)
+    )
+
+
+@api_view
+@conditional_public_page("jobs", "employers")
+def employer_list(request):
+    """Employers in id order; ``next`` is the last id returned."""
+    names = selected_fields(request, EMPLOYER_FIELDS)
+    limit = page_size(request)
+    employers = Employer.objects.order_by("pk")
+    after = integer_param(request, "cursor")
+    if after is not None:
+        employers = employers.filter(pk__gt=after)
+
+    rows = employers.values(*set(names) | {"id"})[: limit + 1].iterator(
+        chunk_size=limit + 1
+    )
+    return streaming_json(
+        stream_page(rows, names, EMPLOYER_FIELDS, limit, lambda row: str(row["id"]))
+    )
+
+
+@api_view
+@conditional_public_page("jobs", "employers")
+def employer_detail(request, pk):
+    names = selected_fields(request, EMPLOYER_FIELDS)
+    row = Employer.objects.filter(pk=pk).values(*names).first()
+    if row is None:
+        return error("Not found.", status=404)
+    return json_response(serialize(row, names, EMPLOYER_FIELDS))
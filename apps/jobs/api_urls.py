@@ -0,0 +1,13 @@
+from django.urls import path
+
+from . import api
+
+app_name = "api_v1"
+
+urlpatterns = [
+    path("jobs/", api.job_list, name="job_list"),
+    path("jobs/<int:job_id>/", api.job_detail, name="job_detail"),
+    path("categories/", api.category_list, name="category_list"),
+    path("employers/", api.employer_list, name="employer_list"),
+    path("employers/<int:pk>/", api.employer_detail, name="employer_detail"),
+]
@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.jobs'  # Changed from 'jobs' to 'apps.jobs'
\ No newline at end of file
+    name = 'apps.jobs'  # Changed from 'jobs' to 'apps.jobs'
+
+    def ready(self):
+        import apps.jobs.signals  # noqa: F401
@@ -0,0 +1,20 @@
+"""
+``urls.py`` with the views that have an async twin in ``async_views``
+swapped in; same paths and names, so ``reverse()`` works under either.
+"""
+
+from django.urls import URLPattern
+
+from . import async_views, urls
+
+app_name = urls.app_name
+
+urlpatterns = [
+    URLPattern(
+        pattern.pattern,
+        getattr(async_views, pattern.callback.__name__, pattern.callback),
+        pattern.default_args,
+        pattern.name,
+    )
+    for pattern in urls.urlpatterns
+]
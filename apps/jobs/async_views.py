@@ -0,0 +1,183 @@
+"""
+Native async versions of the public read views, served under ASGI (see
+``core.middleware.asgi_urlconf_middleware``). They keep the URLs, caching
+and templates of their twins in ``views.py``; querysets are evaluated here,
+since templates can't run queries from the event loop, and independent
+queries are awaited together. Unlike the sync views they therefore query
+even when the ``{% cache %}`` fragments showing the rows are cached; the
+page cache still spares anonymous visitors.
+
+Django's async ORM still runs each query in a worker thread, one at a
+time per request, so ``gather`` overlaps cache reads and the other awaits
+rather than the queries themselves. What ASGI buys is that slow clients
+and cache hits no longer hold a thread each.
+"""
+
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from django.shortcuts import render
+
+from apps.accounts.models import Employer, JobSeeker
+from apps.dashboard import tracking
+
+from . import ranking
+from .cache import cache_public_page, conditional_public_page
+from .facets import afacet_counts, apply_facets, facet_total
+from .forms import JobApplicationForm, JobSearchForm
+from .models import Application, Category, Job
+from .pagination import capped_paginator
+from .ranking import sort_jobs
+from .views import filter_jobs
+
+
+async def _rows(queryset):
+    return [row async for row in queryset]
+
+
+@conditional_public_page("jobs", "employers")
+@cache_public_page("jobs", "employers")
+async def companies(request):
+    companies, request.user = await asyncio.gather(
+        _rows(Employer.objects.all()), request.auser()
+    )
+    return render(request, "jobs/companies.html", {"companies": companies})
+
+
+@conditional_public_page("jobs", "categories", "employers", "rankings")
+@cache_public_page("jobs", "categories", "employers", "rankings")
+async def home(request):
+    featured_jobs, categories, request.user = await asyncio.gather(
+        _rows(
+            sort_jobs(
+                Job.objects.filter(is_active=True).select_related("employer"),
+                "trending",
+            )[:6],
+        ),
+        _rows(Category.objects.all()),
+        request.auser(),
+    )
+    context = {
+        "featured_jobs": featured_jobs,
+        "categories": categories,
+    }
+    return render(request, "jobs/home.html", context)
+
+
+@conditional_public_page(
+    "jobs", "categories", "employers", "rankings", revalidated=tracking.replay
+)
+async def job_list(request):
+    form = JobSearchForm(request.GET)
+    jobs = Job.objects.filter(is_active=True).select_related("employer")
+
+    if request.GET.get("category"):
+        # Validating the category choice runs a query.
+        valid = await sync_to_async(form.is_valid)()
+    else:
+        valid = form.is_valid()
+    criteria = form.cleaned_data if valid else {}
+    if criteria.get("search"):
+        # The search backends rank with synchronous queries of their own.
+        jobs = await sync_to_async(filter_jobs)(jobs, criteria, facets=False)
+    else:
+        jobs = filter_jobs(jobs, criteria, facets=False)
+    facets, request.user = await asyncio.gather(
+        afacet_counts(jobs, criteria), request.auser()
+    )
+    jobs = apply_facets(jobs, criteria)
+
+    sort = criteria.get("sort", "")
+    cursor_pagination = not criteria.get("search") or bool(sort)
+    if cursor_pagination:
+        paginator = ranking.paginator(jobs, sort, 9, total=facet_total(facets))
+        jobs = await paginator.aget_page(request.GET.get("cursor"))
+    else:
+        paginator = capped_paginator(jobs, 9, facet_total(facets))
+        # Fetch the page's rows here so nothing queries from the template.
+        jobs = paginator.get_page(request.GET.get("page"))
+        jobs.object_list = [job async for job in jobs.object_list]
+    shown = [job.pk for job in jobs]
+    tracking.record(request, "impressions", shown)
+
+    context = {
+        "jobs": jobs,
+        "form": form,
+        "facets": facets,
+        "total_jobs": facet_total(facets),
+        "cursor_pagination": cursor_pagination,
+    }
+    response = render(request, "jobs/job_list.html", context)
+    response.revalidation_data = {"impressions": shown}
+    return response
+
+
+async def ajob_last_modified(request, job_id):
+    return (
+        await Job.objects.filter(id=job_id, is_active=True)
+        .values_list("updated_at", flat=True)
+        .afirst()
+    )
+
+
+@conditional_public_page(
+    "employers", last_modified=ajob_last_modified, revalidated=tracking.replay
+)
+async def job_detail(request, job_id):
+    job, request.user = await asyncio.gather(
+        Job.objects.select_related("employer")
+        .filter(id=job_id, is_active=True)
+        .afirst(),
+        request.auser(),
+    )
+    if job is None:
+        raise Http404("No Job matches the given query.")
+    tracking.record(request, "views", [job.pk])
+    application_form = JobApplicationForm() if request.user.is_authenticated else None
+    has_applied = False
+
+    if request.user.is_authenticated and request.user.is_job_seeker:
+        has_applied = await Application.objects.filter(
+            job=job, job_seeker__in=JobSeeker.objects.filter(user=request.user)
+        ).aexists()
+
+    context = {
+        "job": job,
+        "application_form": application_form,
+        "has_applied": has_applied,
+    }
+    response = render(request, "jobs/job_detail.html", context)
+    response.revalidation_data = {"views": [job.pk]}
+    return response
+
+
+@conditional_public_page("jobs", "categories")
+@cache_public_page("jobs", "categories")
+async def categories(request):
+    categories, request.user = await asyncio.gather(
+        _rows(Category.objects.all()), request.auser()
+    )
+    context = {
+        "categories": categories,
+    }
+    return render(request, "jobs/categories.html", context)
+
+
+@conditional_public_page("jobs", "employers")
+@cache_public_page("jobs", "employers")
+async def company_detail(request, pk):
+    company, active_jobs, request.user = await asyncio.gather(
+        Employer.objects.select_related("user").filter(pk=pk).afirst(),
+        _rows(Job.objects.filter(employer=pk, is_active=True)),
+        request.auser(),
+    )
+    if company is None:
+        raise Http404("No Employer matches the given query.")
+
+    context = {
+        "company": company,
+        "active_jobs": active_jobs,
+        "job_count": company.job_count,
+    }
+    return render(request, "jobs/company_detail.html", context)
@@ -0,0 +1,269 @@
+import hashlib
+import time
+from functools import wraps
+from inspect import iscoroutinefunction
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+
+# Template fragments (``{% cache %}`` names) rendered from each kind of data.
+FRAGMENTS = {
+    "jobs": ["featured_jobs", "home_categories", "category_grid", "company_cards"],
+    "categories": ["home_categories", "category_grid"],
+    "employers": ["featured_jobs", "company_cards"],
+    "rankings": ["featured_jobs"],
+}
+
+
+def _generation_key(namespace):
+    return f"cache-generation:{namespace}"
+
+
+def generations(namespaces):
+    """
+    Current generation of each namespace. Generations start from a timestamp
+    so a key that was evicted never comes back with an old value.
+    """
+    keys = [_generation_key(namespace) for namespace in namespaces]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns(), None)
+            found[key] = cache.get(key)
+    return [found[key] for key in keys]
+
+
+async def agenerations(namespaces):
+    keys = [_generation_key(namespace) for namespace in namespaces]
+    found = await cache.aget_many(keys)
+    for key in keys:
+        if key not in found:
+            await cache.aadd(key, time.time_ns(), None)
+            found[key] = await cache.aget(key)
+    return [found[key] for key in keys]
+
+
+def invalidate(*namespaces):
+    """Expire every cached page and fragment built from ``namespaces``."""
+    for namespace in namespaces:
+        try:
+            cache.incr(_generation_key(namespace))
+        except ValueError:
+            cache.set(_generation_key(namespace), time.time_ns(), None)
+    cache.delete_many(
+        {
+            make_template_fragment_key(fragment)
+            for namespace in namespaces
+            for fragment in FRAGMENTS[namespace]
+        }
+    )
+
+
+def invalidate_on_commit(*namespaces):
+    transaction.on_commit(lambda: invalidate(*namespaces))
+
+
+def is_public_request(request):
+    """
+    True for GET/HEAD requests with no session or message cookies. Checked on
+    cookies alone so it never loads the session or the user.
+    """
+    return (
+        request.method in ("GET", "HEAD")
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and CookieStorage.cookie_name not in request.COOKIES
+    )
+
+
+def cache_public_page(*namespaces):
+    """
+    Cache the rendered page for anonymous visitors until one of
+    ``namespaces`` is invalidated or ``PUBLIC_PAGE_CACHE_TIMEOUT`` passes.
+    Works on sync and async views.
+    """
+
+    def page_key(view, request, stamps):
+        stamp = ":".join(str(generation) for generation in stamps)
+        path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        return f"public-page:{view.__name__}:{stamp}:{path}"
+
+    def cacheable(response):
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+        )
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                if not is_public_request(request):
+                    return await view(request, *args, **kwargs)
+
+                key = page_key(view, request, await agenerations(namespaces))
+                cached = await cache.aget(key)
+                if cached is not None:
+                    content, content_type = cached
+                    return HttpResponse(content, content_type=content_type)
+
+                response = await view(request, *args, **kwargs)
+                if cacheable(response):
+                    await cache.aset(
+                        key,
+                        (response.content, response["Content-Type"]),
+                        settings.PUBLIC_PAGE_CACHE_TIMEOUT,
+                    )
+                return response
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not is_public_request(request):
+                return view(request, *args, **kwargs)
+
+            key = page_key(view, request, generations(namespaces))
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+
+            response = view(request, *args, **kwargs)
+            if cacheable(response):
+                cache.set(
+                    key,
+                    (response.content, response["Content-Type"]),
+                    settings.PUBLIC_PAGE_CACHE_TIMEOUT,
+                )
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def conditional_public_page(*namespaces, last_modified=None, revalidated=None):
+    """
+    Answer anonymous revalidations with ``304 Not Modified`` before the view
+    runs. The ETag combines the request path with the generations of
+    ``namespaces``, so it costs cache reads only; ``last_modified(request,
+    *args, **kwargs)`` may add a per-object timestamp (``None`` means the
+    object is missing and the view runs as usual). Public responses are
+    marked cacheable by shared caches for ``PUBLIC_PAGE_MAX_AGE`` seconds.
+
+    A view whose renders have side effects (counting views) leaves what a
+    304 should repeat on ``response.revalidation_data``; it is cached under
+    the ETag for ``PUBLIC_PAGE_CACHE_TIMEOUT`` seconds and handed to
+    ``revalidated(request, data)`` with each 304 in that time. Later 304s
+    skip it.
+
+    Works on sync and async views; for an async view ``last_modified`` must
+    be a coroutine function too.
+    """
+
+    def data_key(etag):
+        return f"revalidation-data:{etag}"
+
+    def remember(response, etag):
+        data = getattr(response, "revalidation_data", None)
+        if etag and data is not None and response.status_code == 200:
+            return data_key(etag), data, settings.PUBLIC_PAGE_CACHE_TIMEOUT
+        return None
+
+    def replays(response):
+        return revalidated is not None and response.status_code == 304
+
+    def validators(request, stamps, timestamp):
+        """``(quoted ETag, Last-Modified epoch)`` for a public request."""
+        parts = [request.get_full_path(), *stamps]
+        if last_modified is not None:
+            if timestamp is None:
+                return None, None
+            parts.append(timestamp.timestamp())
+        etag = hashlib.md5(":".join(map(str, parts)).encode()).hexdigest()
+        modified = int(timestamp.timestamp()) if timestamp is not None else None
+        return quote_etag(etag), modified
+
+    def finish(request, response, etag, modified):
+        if request.method in ("GET", "HEAD"):
+            if modified and not response.has_header("Last-Modified"):
+                response.headers["Last-Modified"] = http_date(modified)
+            if etag:
+                response.headers.setdefault("ETag", etag)
+        patch_vary_headers(response, ["Cookie"])
+        if (
+            is_public_request(request)
+            and response.status_code in (200, 304)
+            and not response.cookies
+        ):
+            patch_cache_control(
+                response, public=True, max_age=settings.PUBLIC_PAGE_MAX_AGE
+            )
+        else:
+            patch_cache_control(response, private=True)
+        return response
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                etag = modified = None
+                if is_public_request(request):
+                    timestamp = None
+                    if last_modified is not None:
+                        timestamp = await last_modified(request, *args, **kwargs)
+                    etag, modified = validators(
+                        request, await agenerations(namespaces), timestamp
+                    )
+                response = get_conditional_response(
+                    request, etag=etag, last_modified=modified
+                )
+                if response is None:
+                    response = await view(request, *args, **kwargs)
+                    if entry := remember(response, etag):
+                        await cache.aset(*entry)
+                elif replays(response):
+                    data = await cache.aget(data_key(etag))
+                    if data is not None:
+                        revalidated(request, data)
+                return finish(request, response, etag, modified)
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            etag = modified = None
+            if is_public_request(request):
+                timestamp = None
+                if last_modified is not None:
+                    timestamp = last_modified(request, *args, **kwargs)
+                etag, modified = validators(request, generations(namespaces), timestamp)
+            response = get_conditional_response(
+                request, etag=etag, last_modified=modified
+            )
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if entry := remember(response, etag):
+                    cache.set(*entry)
+            elif replays(response):
+                data = cache.get(data_key(etag))
+                if data is not None:
+                    revalidated(request, data)
+            return finish(request, response, etag, modified)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,97 @@
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.accounts.models import Employer
+
+from .models import Category, Job
+
+UNKNOWN = object()
+
+
+def counter_state(job):
+    """
+    The ``(category_id, employer_id)`` a job contributes to, or ``None``
+    when it is inactive. Read from ``__dict__`` so deferred fields are never
+    loaded just to track counters; returns ``UNKNOWN`` in that case.
+    """
+    values = job.__dict__
+    if not all(name in values for name in ("is_active", "category_id", "employer_id")):
+        return UNKNOWN
+    if not values["is_active"]:
+        return None
+    return values["category_id"], values["employer_id"]
+
+
+def stored_counter_state(job_id):
+    row = (
+        Job.objects.filter(pk=job_id)
+        .values_list("is_active", "category_id", "employer_id")
+        .first()
+    )
+    if row is None or not row[0]:
+        return None
+    return row[1], row[2]
+
+
+def apply_counter_change(old, new):
+    """Move one unit of ``job_count`` from the ``old`` state to the ``new`` one."""
+    apply_counter_changes([(old, new)])
+
+
+def apply_counter_changes(changes):
+    """
+    Apply many ``(old, new)`` state changes at once. Deltas are summed per
+    row first, so this issues one UPDATE per distinct delta rather than per
+    job; use it wherever jobs are written without signals (``bulk_create``,
+    ``QuerySet.update``).
+    """
+    deltas = {Category: Counter(), Employer: Counter()}
+    for old, new in changes:
+        if old == new:
+            continue
+        for state, delta in ((old, -1), (new, 1)):
+            if state is None:
+                continue
+            category_id, employer_id = state
+            if category_id is not None:
+                deltas[Category][category_id] += delta
+            deltas[Employer][employer_id] += delta
+
+    for model, counts in deltas.items():
+        rows_by_delta = defaultdict(list)
+        for pk, delta in counts.items():
+            if delta:
+                rows_by_delta[delta].append(pk)
+        for delta, pks in rows_by_delta.items():
+            # Clamp at zero so drift never trips the unsigned column's
+            # constraint; ``reconcile_job_counts`` repairs it.
+            model.objects.filter(pk__in=pks).update(
+                job_count=Greatest(F("job_count") + delta, 0)
+            )
+
+
+def active_job_count(field):
+    return Coalesce(
+        Subquery(
+            Job.objects.filter(**{field: OuterRef("pk")}, is_active=True)
+            .order_by()
+            .values(field)
+            .annotate(total=Count("pk"))
+            .values("total")
+        ),
+        0,
+    )
+
+
+def reconcile_counters():
+    """Recompute every stored counter. Returns ``(categories, employers)`` fixed."""
+    fixed = []
+    for model, field in ((Category, "category"), (Employer, "employer")):
+        actual = active_job_count(field)
+        stale = model.objects.annotate(actual=actual).exclude(job_count=F("actual"))
+        fixed.append(
+            model.objects.filter(pk__in=stale.values("pk")).update(job_count=actual)
+        )
+    return tuple(fixed)
@@ -0,0 +1,87 @@
+"""
+Deadline enforcement and archival, run by ``manage.py expire_jobs``.
+
+``expire_jobs`` deactivates active jobs whose deadline has passed with one
+UPDATE per batch. ``QuerySet.update`` skips the ``Job`` signals, so each
+batch moves the stored counters, drops the jobs from the search index and
+skill matches, and invalidates the page cache itself.
+
+``archive_jobs`` then moves jobs that have been inactive for a while, with
+their applications, into ``ArchivedJob``/``ArchivedApplication`` so the hot
+``jobs_job`` table and its indexes only hold jobs that can still be shown.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from . import matching
+from .cache import invalidate_on_commit
+from .counters import apply_counter_changes
+from .models import Application, ArchivedApplication, ArchivedJob, Job
+from .search import get_backend
+
+JOB_FIELDS = [
+    field.attname
+    for field in ArchivedJob._meta.concrete_fields
+    if field.name != "archived_at"
+]
+APPLICATION_FIELDS = [field.attname for field in ArchivedApplication._meta.fields]
+
+
+def expire_jobs(today=None, batch_size=1000):
+    """Deactivate active jobs with a deadline before ``today``. Returns the count."""
+    today = today or timezone.localdate()
+    expired = Job.objects.filter(is_active=True, deadline__lt=today).order_by("pk")
+    total = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                expired.select_for_update().values_list(
+                    "pk", "category_id", "employer_id"
+                )[:batch_size]
+            )
+            if not rows:
+                return total
+            job_ids = [pk for pk, _category, _employer in rows]
+            Job.objects.filter(pk__in=job_ids).update(
+                is_active=False, updated_at=timezone.now()
+            )
+            apply_counter_changes(
+                ((category, employer), None) for _pk, category, employer in rows
+            )
+            get_backend().remove_many(job_ids)
+            matching.remove_jobs(job_ids)
+            invalidate_on_commit("jobs")
+        total += len(rows)
+
+
+def archive_jobs(before=None, batch_size=500):
+    """
+    Move jobs inactive since before ``before`` (default: ``JOB_ARCHIVE_AFTER_DAYS``
+    ago) and their applications to the archive tables. Returns the job count.
+    """
+    if before is None:
+        before = timezone.now() - timedelta(days=settings.JOB_ARCHIVE_AFTER_DAYS)
+    stale = Job.objects.filter(is_active=False, updated_at__lt=before).order_by("pk")
+    total = 0
+    while True:
+        with transaction.atomic():
+            jobs = list(stale.select_for_update().values(*JOB_FIELDS)[:batch_size])
+            if not jobs:
+                return total
+            job_ids = [job["id"] for job in jobs]
+            ArchivedJob.objects.bulk_create(ArchivedJob(**job) for job in jobs)
+            ArchivedApplication.objects.bulk_create(
+                ArchivedApplication(**application)
+                for application in Application.objects.filter(
+                    job_id__in=job_ids
+                ).values(*APPLICATION_FIELDS)
+            )
+            # Inactive jobs are not indexed and have no skills left, and their
+            # applications were just archived, so the delete signals cost a
+            # couple of queries per job.
+            Job.objects.filter(pk__in=job_ids).delete()
+        total += len(jobs)
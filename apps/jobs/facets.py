@@ -0,0 +1,223 @@
+from collections import Counter, defaultdict
+from decimal import Decimal
+
+from django.conf import settings
+from django.db.models import Case, Count, DecimalField, F, Q, Value, When
+
+from apps.locations import gazetteer
+
+from .models import Job
+
+# Upper bounds are exclusive; ``None`` means unbounded. Keys match the values
+# posted by the salary filter on ``job_list.html``.
+SALARY_BANDS = [
+    ("0-30000", "$0 - $30,000", 0, 30000),
+    ("30000-60000", "$30,000 - $60,000", 30000, 60000),
+    ("60000-90000", "$60,000 - $90,000", 60000, 90000),
+    ("90000+", "$90,000+", 90000, None),
+]
+
+# Multipliers turning an hourly/weekly rate into a yearly figure.
+SALARY_PERIODS = {
+    Job.SalaryType.HOURLY: 2080,
+    Job.SalaryType.WEEKLY: 52,
+    Job.SalaryType.FIXED: 1,
+}
+
+LOCATION_FACET_SIZE = 10
+
+
+def exchange_rates():
+    """Currency -> rate converting an amount into ``DEFAULT_CURRENCY``."""
+    return getattr(settings, "SALARY_EXCHANGE_RATES", {settings.DEFAULT_CURRENCY: 1})
+
+
+def normalized_salary():
+    """Expression for the yearly salary of a job in ``DEFAULT_CURRENCY``."""
+    whens = [
+        When(
+            salary_currency=currency,
+            salary_type=period,
+            then=F("salary") * Value(Decimal(str(rate)) * multiplier),
+        )
+        for currency, rate in exchange_rates().items()
+        for period, multiplier in SALARY_PERIODS.items()
+    ]
+    return Case(
+        *whens,
+        default=F("salary"),
+        output_field=DecimalField(max_digits=16, decimal_places=2),
+    )
+
+
+def salary_band():
+    return Case(
+        *[
+            When(_band_q(low, high), then=Value(key))
+            for key, _label, low, high in SALARY_BANDS
+        ],
+        default=Value(""),
+    )
+
+
+def yearly_salary(amount, currency, salary_type):
+    """Python twin of ``normalized_salary`` for one salary."""
+    rate = exchange_rates().get(currency)
+    multiplier = SALARY_PERIODS.get(salary_type)
+    if rate is not None and multiplier is not None:
+        amount = amount * Decimal(str(rate)) * multiplier
+    return amount
+
+
+def band_for(amount, currency, salary_type):
+    """The ``SALARY_BANDS`` key for one salary; Python twin of ``salary_band``."""
+    amount = yearly_salary(amount, currency, salary_type)
+    for key, _label, low, high in SALARY_BANDS:
+        if amount >= low and (high is None or amount < high):
+            return key
+    return ""
+
+
+def _band_q(low, high, field="normalized_salary"):
+    q = Q(**{f"{field}__gte": low})
+    if high is not None:
+        q &= Q(**{f"{field}__lt": high})
+    return q
+
+
+def apply_facets(jobs, criteria):
+    """Narrow ``jobs`` to the facet values selected in ``criteria``."""
+    category = criteria.get("category")
+    job_type = criteria.get("job_type")
+    salary = criteria.get("salary")
+
+    if category:
+        jobs = jobs.filter(category=category)
+    if job_type:
+        jobs = jobs.filter(job_type=job_type)
+    if salary:
+        _key, _label, low, high = next(
+            band for band in SALARY_BANDS if band[0] == salary
+        )
+        jobs = jobs.alias(normalized_salary=normalized_salary()).filter(
+            _band_q(low, high)
+        )
+    return jobs
+
+
+def facet_groups(jobs):
+    """
+    ``jobs`` grouped by every facet dimension at once, with a count per
+    group. ``jobs`` must already carry the non-facet filters (search,
+    location).
+    """
+    return (
+        Job.objects.filter(pk__in=jobs.order_by().values("pk"))
+        .alias(normalized_salary=normalized_salary())
+        .annotate(
+            salary_band=salary_band(),
+            # Locations are grouped by place; the text only where there's none.
+            unplaced_location=Case(
+                When(place__isnull=True, then=F("location")), default=Value("")
+            ),
+        )
+        .values(
+            "job_type",
+            "category",
+            "category__name",
+            "place",
+            "unplaced_location",
+            "salary_band",
+        )
+        .annotate(total=Count("pk"))
+        .order_by()
+    )
+
+
+def facet_counts(jobs, criteria):
+    """
+    Count matching jobs for every facet value with a single grouped query
+    (``facet_groups``). Each facet is rolled up in Python from the groups
+    that satisfy the *other* selected facets, so a selected job type still
+    shows how many results the remaining job types would give.
+    """
+    return facets_from_groups(facet_groups(jobs), criteria)
+
+
+async def afacet_counts(jobs, criteria):
+    groups = [group async for group in facet_groups(jobs)]
+    return facets_from_groups(groups, criteria)
+
+
+def facets_from_groups(groups, criteria):
+    selected = {
+        "job_type": criteria.get("job_type") or None,
+        "category": getattr(criteria.get("category"), "pk", None),
+        "salary": criteria.get("salary") or None,
+    }
+    counts = defaultdict(Counter)
+    category_names = {}
+    for group in groups:
+        values = {
+            "job_type": group["job_type"],
+            "category": group["category"],
+            "salary": group["salary_band"],
+            "location": (
+                gazetteer.label(group["place"])
+                if group["place"]
+                else group["unplaced_location"]
+            ),
+        }
+        category_names[group["category"]] = group["category__name"]
+        for facet in ("job_type", "category", "salary", "location"):
+            if all(
+                selected[other] in (None, values[other])
+                for other in selected
+                if other != facet
+            ):
+                counts[facet][values[facet]] += group["total"]
+
+    # Searched-for text that names a place selects that place's option.
+    location = criteria.get("location") or None
+    if location and (place := gazetteer.resolve(location)) is not None:
+        location = gazetteer.label(place)
+
+    def build(facet, options):
+        current = selected[facet] if facet in selected else location
+        return [
+            {
+                "value": value,
+                "label": label,
+                "count": counts[facet][value],
+                "selected": current is not None and str(current) == str(value),
+            }
+            for value, label in options
+        ]
+
+    return {
+        "job_type": build("job_type", Job.JOB_TYPE_CHOICES),
+        "category": build(
+            "category",
+            sorted(
+                ((pk, name) for pk, name in category_names.items() if pk is not None),
+                key=lambda option: option[1],
+            ),
+        ),
+        "salary": build("salary", [(key, label) for key, label, *_ in SALARY_BANDS]),
+        "location": build(
+            "location",
+            [
+                (location, location)
+                for location, _count in counts["location"].most_common(
+                    LOCATION_FACET_SIZE
+                )
+            ],
+        ),
+    }
+
+
+def facet_total(facets, facet="job_type"):
+    """Size of the filtered result set, derived from one facet's counts."""
+    options = facets[facet]
+    selected = [option for option in options if option["selected"]]
+    return sum(option["count"] for option in selected or options)
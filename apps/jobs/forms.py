@@ -1,7 +1,14 @@
 from django import forms
-from .models import Job, Application
+from django.core.validators import FileExtensionValidator
+from .models import Job, JobAlert, Application, Category
+from .facets import SALARY_BANDS
+from .ranking import SORTS
 from django_select2.forms import Select2Widget
 
+SALARY_CHOICES = [("", "Salary Range")] + [
+    (key, label) for key, label, *_ in SALARY_BANDS
+]
+
 
 class JobForm(forms.ModelForm):
     class Meta:
@@ -56,13 +63,42 @@ class JobSearchForm(forms.Form):
     location = forms.CharField(
         required=False, widget=forms.TextInput(attrs={"placeholder": "Location"})
     )
-    category = forms.ChoiceField(required=False)
+    radius = forms.TypedChoiceField(
+        required=False,
+        coerce=int,
+        empty_value=None,
+        choices=[("", "Exact location")]
+        + [(str(km), f"Within {km} km") for km in (10, 25, 50, 100)],
+    )
+    category = forms.ModelChoiceField(
+        required=False, queryset=Category.objects.all(), empty_label="All Categories"
+    )
     job_type = forms.ChoiceField(
         required=False, choices=[("", "All Types")] + Job.JOB_TYPE_CHOICES
     )
+    salary = forms.ChoiceField(required=False, choices=SALARY_CHOICES)
+    sort = forms.ChoiceField(
+        required=False, choices=[(key, label) for key, (label, _field) in SORTS.items()]
+    )
+
+
+class JobAlertForm(forms.ModelForm):
+    salary = forms.ChoiceField(required=False, choices=SALARY_CHOICES)
+
+    class Meta:
+        model = JobAlert
+        fields = ["search", "location", "category", "job_type", "salary", "frequency"]
+        labels = {"search": "Keywords"}
 
 
 class JobPostForm(forms.ModelForm):
     class Meta:
         model = Job
         fields = ["title", "description", "location", "salary", "job_type"]
+
+
+class JobImportForm(forms.Form):
+    file = forms.FileField(
+        validators=[FileExtensionValidator(["csv", "jsonl", "ndjson"])],
+        help_text="CSV with a header row, or JSON Lines with one job object per line.",
+    )
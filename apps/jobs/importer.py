@@ -0,0 +1,180 @@
+"""
+Bulk job import from CSV or JSON Lines files.
+
+Rows are read lazily, cleaned with the same form fields ``JobForm`` uses,
+and written with ``bulk_create`` one batch per transaction. Categories and
+employers are resolved from maps loaded once up front. ``bulk_create`` skips
+the ``Job`` signals, so rows get their place when built, and each batch
+updates the search index, the rankings, the stored counters and the page
+cache itself and queues a skill-match refresh and job alert matching for
+the batch.
+"""
+
+import csv
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from apps.accounts.models import Employer
+from apps.locations import gazetteer
+
+from .cache import invalidate_on_commit
+from .counters import apply_counter_changes, counter_state
+from .forms import JobForm
+from .models import Category, Job
+from .ranking import rank_new_jobs
+from .search import get_backend
+from .tasks import match_job_alerts, refresh_job_matches
+
+FORMATS = ("csv", "jsonl")
+COLUMNS = [
+    "title",
+    "category",
+    "description",
+    "requirements",
+    "location",
+    "salary",
+    "salary_currency",
+    "salary_type",
+    "job_type",
+    "deadline",
+    "employer",
+]
+# Columns that may be left out; everything else follows ``JobForm``.
+DEFAULTS = {
+    "salary_currency": settings.DEFAULT_CURRENCY,
+    "salary_type": Job.SalaryType.FIXED,
+}
+
+
+def guess_format(filename):
+    extension = filename.rsplit(".", 1)[-1].lower()
+    return {"csv": "csv", "jsonl": "jsonl", "ndjson": "jsonl"}.get(extension)
+
+
+def read_rows(stream, format):
+    """
+    Yield ``(line number, row)`` from a text stream. ``row`` is ``None`` for
+    a JSON line that is not an object.
+    """
+    if format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield number, row if isinstance(row, dict) else None
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        # (line number, {column: [messages]})
+        self.errors = []
+
+
+class JobImporter:
+    """
+    Import jobs for ``employer``, or (for admins and the management command)
+    for the employer named in each row's ``employer`` column, by id or
+    company name.
+    """
+
+    def __init__(self, employer=None, batch_size=1000):
+        self.employer = employer
+        self.batch_size = batch_size
+        self.fields = {
+            name: field
+            for name, field in JobForm.base_fields.items()
+            if name != "category"
+        }
+        self.categories = self._lookup(Category.objects.values_list("pk", "name"))
+        self.employers = (
+            {}
+            if employer
+            else self._lookup(Employer.objects.values_list("pk", "company_name"))
+        )
+
+    @staticmethod
+    def _lookup(rows):
+        lookup = {}
+        for pk, name in rows:
+            lookup.setdefault(name.strip().casefold(), pk)
+            lookup[str(pk)] = pk
+        return lookup
+
+    def run(self, rows):
+        result = ImportResult()
+        rows = iter(rows)
+        while batch := list(islice(rows, self.batch_size)):
+            jobs = []
+            for line, row in batch:
+                job, errors = self.build(row)
+                if errors:
+                    result.errors.append((line, errors))
+                else:
+                    jobs.append(job)
+            if jobs:
+                self.save(jobs)
+                result.created += len(jobs)
+        return result
+
+    def build(self, row):
+        """Return ``(job, errors)`` for one row; ``job`` is unsaved."""
+        if row is None:
+            return None, {"__all__": ["Expected a JSON object."]}
+        row = {
+            key.strip(): "" if value is None else str(value).strip()
+            for key, value in row.items()
+            if key
+        }
+        for column, default in DEFAULTS.items():
+            row[column] = row.get(column) or default
+
+        values, errors = {}, {}
+        for name, field in self.fields.items():
+            raw = row.get(name, "")
+            if name == "salary":
+                raw = [raw, row["salary_currency"]]
+            try:
+                values[name] = field.clean(raw)
+            except ValidationError as exc:
+                errors[name] = exc.messages
+
+        values["category_id"] = self.categories.get(row.get("category", "").casefold())
+        if values["category_id"] is None:
+            errors["category"] = ["Unknown category."]
+        if self.employer:
+            values["employer_id"] = self.employer.pk
+        else:
+            values["employer_id"] = self.employers.get(
+                row.get("employer", "").casefold()
+            )
+            if values["employer_id"] is None:
+                errors["employer"] = ["Unknown employer."]
+
+        if errors:
+            return None, errors
+        values["place_id"] = gazetteer.resolve(values["location"])
+        return Job(**values), {}
+
+    def save(self, jobs):
+        with transaction.atomic():
+            jobs = Job.objects.bulk_create(jobs)
+            get_backend().index_many(jobs)
+            rank_new_jobs(jobs)
+            job_ids = [job.pk for job in jobs]
+            refresh_job_matches.delay(job_ids)
+            match_job_alerts.delay(job_ids)
+            apply_counter_changes((None, counter_state(job)) for job in jobs)
+            invalidate_on_commit("jobs")
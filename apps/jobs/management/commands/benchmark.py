@@ -0,0 +1,407 @@
+"""
+Drive every GET page in ``core/urls.py`` against the current database and
+report, per view, throughput, latency percentiles and queries per request.
+
+Requests go through the full middleware stack, either with the test client
+(``--runner client``) or by calling the project's WSGI or ASGI application
+in-process (``--runner wsgi`` / ``asgi``), which also open and close the
+database connection per request as a real server does. WSGI requests are
+sent from ``--concurrency`` threads, as a threaded worker would serve them;
+ASGI requests from as many tasks on one event loop, as a single async worker
+would, so the public pages run their async views. Give several runners to
+compare them page by page. URL arguments are filled from existing rows and
+pages behind a login are requested as a matching employer or job seeker, so
+load a realistic dataset first with ``manage.py seed``.
+
+Query counts come from ``core.instrumentation``, which the command enables
+for its run.
+"""
+
+import asyncio
+import logging
+import statistics
+import threading
+import time
+from collections import Counter
+from io import BytesIO
+from unittest.mock import patch
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from apps.jobs.models import Application, Job
+from core import instrumentation
+from core.instrumentation import percentile
+from core.middleware.admin_cookie_middleware import CLIENT_SESSION_COOKIE
+
+# Not worth benchmarking, or they would change state between requests.
+SKIPPED_NAMESPACES = {"admin", "django_select2"}
+SKIPPED_VIEWS = {"accounts:logout", "metrics"}
+EMPLOYER_VIEWS = {
+    "accounts:employer_profile",
+    "dashboard:employer_dashboard",
+    "dashboard:export_applications",
+    "dashboard:manage_application",
+    "jobs:import_jobs",
+    "jobs:post_job",
+}
+SEEKER_VIEWS = {
+    "accounts:edit_profile",
+    "accounts:user_profile",
+    "dashboard:edit_application",
+    "dashboard:jobseeker_dashboard",
+    "dashboard:withdraw_application",
+    "jobs:apply_job",
+    "jobs:delete_job_alert",
+    "jobs:job_alerts",
+}
+UNCACHED = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+def url_names(patterns=None, namespace=""):
+    """Yield ``(name, argument names)`` for every named URL pattern."""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace in SKIPPED_NAMESPACES:
+                continue
+            prefix = namespace
+            if pattern.namespace:
+                prefix = f"{namespace}{pattern.namespace}:"
+            yield from url_names(pattern.url_patterns, prefix)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield f"{namespace}{pattern.name}", list(pattern.pattern.converters)
+
+
+class Command(BaseCommand):
+    help = "Benchmark every page: throughput, latency percentiles and query counts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--runner",
+            nargs="+",
+            choices=["client", "wsgi", "asgi"],
+            default=["client"],
+            help=(
+                "Drive pages with the test client or the WSGI or ASGI "
+                "application; several runners are compared."
+            ),
+        )
+        parser.add_argument(
+            "--requests", type=int, default=50, help="Timed requests per page."
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=5, help="Untimed requests per page first."
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Threads (tasks for asgi) requesting each page at the same time.",
+        )
+        parser.add_argument(
+            "--filter",
+            action="append",
+            default=[],
+            help="Only pages whose URL name or path contains this (repeatable).",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Disable the cache so every request renders the page.",
+        )
+
+    def handle(self, *args, **options):
+        self.options = options
+        overrides = {
+            "ALLOWED_HOSTS": [*settings.ALLOWED_HOSTS, "testserver"],
+            "API_RATE_LIMIT": (0, 60),
+            "INSTRUMENTATION_ENABLED": True,
+        }
+        if options["no_cache"]:
+            overrides["CACHES"] = UNCACHED
+        # Failing pages are reported by status; one traceback per request
+        # would bury the table.
+        request_logger = logging.getLogger("django.request")
+        with override_settings(**overrides), patch.object(
+            request_logger, "disabled", True
+        ):
+            pages = self.pages()
+            if not pages:
+                raise CommandError("No pages match the filter.")
+            runners = list(dict.fromkeys(options["runner"]))
+            throughput = {}
+            for runner in runners:
+                self.runner = runner
+                if runner == "wsgi":
+                    self.application = get_wsgi_application()
+                elif runner == "asgi":
+                    self.application = get_asgi_application()
+                if len(runners) > 1:
+                    self.stdout.write(self.style.MIGRATE_LABEL(runner))
+                self.stdout.write(
+                    self.style.MIGRATE_HEADING(
+                        f"{'page':<36} {'status':>6} {'req/s':>8} {'p50':>8} "
+                        f"{'p90':>8} {'p99':>8} {'max':>8} {'queries':>8}"
+                    )
+                )
+                for name, path, session in pages:
+                    throughput[runner, name] = self.report(
+                        name, *self.run(path, session)
+                    )
+            if len(runners) > 1:
+                self.compare(
+                    runners, [name for name, _path, _session in pages], throughput
+                )
+
+    def pages(self):
+        """``(name, path, session key or None)`` for every page to request."""
+        application = (
+            Application.objects.filter(status="pending", job__is_active=True)
+            .select_related("job__employer__user", "job_seeker__user")
+            .order_by("pk")
+            .first()
+        )
+        if application is None:
+            raise CommandError("No data to benchmark; run manage.py seed first.")
+        employer, seeker = application.job.employer, application.job_seeker
+        job = (
+            Job.objects.filter(is_active=True)
+            .exclude(applications__job_seeker=seeker)
+            .order_by("-posted_date")
+            .first()
+            or application.job
+        )
+        arguments = {
+            "job_id": job.pk,
+            "pk": employer.pk,
+            "application_id": application.pk,
+            "format": "csv",
+            "uidb64": "MQ",
+            "token": "set-password",
+        }
+        sessions = {
+            "employer": self.session(employer.user),
+            "seeker": self.session(seeker.user),
+        }
+
+        pages = []
+        for name, parameters in url_names():
+            if name in SKIPPED_VIEWS:
+                continue
+            path = reverse(name, kwargs={key: arguments[key] for key in parameters})
+            if self.options["filter"] and not any(
+                text in name or text in path for text in self.options["filter"]
+            ):
+                continue
+            session = None
+            if name in EMPLOYER_VIEWS:
+                session = sessions["employer"]
+            elif name in SEEKER_VIEWS:
+                session = sessions["seeker"]
+            pages.append((name, path, session))
+        return pages
+
+    def session(self, user):
+        client = Client()
+        client.force_login(user)
+        return client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def run(self, path, session):
+        """Request ``path`` concurrently; returns timings, statuses, queries."""
+        concurrency = max(self.options["concurrency"], 1)
+        per_worker = -(-self.options["requests"] // concurrency)
+        if self.runner == "asgi":
+            latencies, statuses, windows = asyncio.run(
+                self.run_tasks(path, session, concurrency, per_worker)
+            )
+        else:
+            latencies, statuses, windows = self.run_threads(
+                path, session, concurrency, per_worker
+            )
+        elapsed = max(end for _start, end in windows) - min(
+            start for start, _end in windows
+        )
+        queries = sum(total[3] for total in instrumentation.totals.values())
+        return latencies, statuses, queries, elapsed
+
+    def run_threads(self, path, session, concurrency, per_thread):
+        latencies, statuses, windows = [], Counter(), []
+        lock = threading.Lock()
+        # Threads warm up first, then start the timed requests together.
+        ready = threading.Barrier(concurrency, action=instrumentation.reset)
+
+        def worker():
+            send = self.sender(path, session)
+            for _ in range(self.options["warmup"]):
+                send()
+            timings, codes = [], []
+            ready.wait()
+            started = time.perf_counter()
+            for _ in range(per_thread):
+                start = time.perf_counter()
+                codes.append(send())
+                timings.append(time.perf_counter() - start)
+            with lock:
+                windows.append((started, time.perf_counter()))
+                latencies.extend(timings)
+                statuses.update(codes)
+
+        def threaded_worker():
+            try:
+                worker()
+            finally:
+                connection.close()
+
+        if concurrency == 1:
+            worker()
+        else:
+            threads = [
+                threading.Thread(target=threaded_worker) for _ in range(concurrency)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        return latencies, statuses, windows
+
+    async def run_tasks(self, path, session, concurrency, per_task):
+        latencies, statuses, windows = [], Counter(), []
+        ready = asyncio.Barrier(concurrency)
+        send = self.asgi_sender(path, session)
+
+        async def worker():
+            for _ in range(self.options["warmup"]):
+                await send()
+            if await ready.wait() == 0:
+                instrumentation.reset()
+            await ready.wait()
+            started = time.perf_counter()
+            for _ in range(per_task):
+                start = time.perf_counter()
+                statuses[await send()] += 1
+                latencies.append(time.perf_counter() - start)
+            windows.append((started, time.perf_counter()))
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return latencies, statuses, windows
+
+    def sender(self, path, session):
+        """A callable that requests ``path`` once and returns the status code."""
+        if self.runner == "client":
+            client = Client(raise_request_exception=False)
+            if session:
+                client.cookies[CLIENT_SESSION_COOKIE] = session
+
+            def send():
+                response = client.get(path)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                return response.status_code
+
+            return send
+
+        path, _, query = path.partition("?")
+        environ = {
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "HTTP_HOST": "testserver",
+        }
+        if session:
+            environ["HTTP_COOKIE"] = f"{CLIENT_SESSION_COOKIE}={session}"
+        setup_testing_defaults(environ)
+        status = []
+
+        def start_response(line, headers, exc_info=None):
+            status.append(int(line.split(" ", 1)[0]))
+
+        def send():
+            request = {**environ, "wsgi.input": BytesIO()}
+            response = self.application(request, start_response)
+            try:
+                b"".join(response)
+            finally:
+                response.close()
+            return status.pop()
+
+        return send
+
+    def asgi_sender(self, path, session):
+        """A coroutine function requesting ``path`` from the ASGI application."""
+        path, _, query = path.partition("?")
+        headers = [(b"host", b"testserver")]
+        if session:
+            headers.append((b"cookie", f"{CLIENT_SESSION_COOKIE}={session}".encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 0),
+            "server": ("testserver", 80),
+        }
+
+        async def send():
+            messages = [{"type": "http.request", "body": b"", "more_body": False}]
+            status = []
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                # The client never disconnects; Django cancels this wait
+                # once the response is sent.
+                await asyncio.Future()
+
+            async def send_message(message):
+                if message["type"] == "http.response.start":
+                    status.append(message["status"])
+
+            await self.application(dict(scope), receive, send_message)
+            return status[0]
+
+        return send
+
+    def report(self, name, latencies, statuses, queries, elapsed):
+        """Write a page's row; returns its requests per second."""
+        latencies = sorted(latency * 1000 for latency in latencies)
+        status, _ = statuses.most_common(1)[0]
+        style = self.style.WARNING if status >= 400 else str
+        self.stdout.write(
+            style(
+                f"{name:<36} {status:>6} {len(latencies) / elapsed:>8.1f} "
+                f"{statistics.median(latencies):>8.2f} "
+                f"{percentile(latencies, 0.9):>8.2f} "
+                f"{percentile(latencies, 0.99):>8.2f} {latencies[-1]:>8.2f} "
+                f"{queries / len(latencies):>8.1f}"
+            )
+        )
+        return len(latencies) / elapsed
+
+    def compare(self, runners, names, throughput):
+        """Requests per second of each page under every runner, side by side."""
+        baseline = runners[0]
+        self.stdout.write(self.style.MIGRATE_LABEL(f"req/s compared to {baseline}"))
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"{'page':<36} " + " ".join(f"{runner:>8}" for runner in runners)
+            )
+        )
+        for name in names:
+            base = throughput[baseline, name]
+            cells = [f"{base:>8.1f}"] + [
+                f"{throughput[runner, name] / base:>7.2f}x" for runner in runners[1:]
+            ]
+            self.stdout.write(f"{name:<36} " + " ".join(cells))
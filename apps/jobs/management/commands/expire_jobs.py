@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.jobs import expiry
+
+
+class Command(BaseCommand):
+    help = (
+        "Deactivate jobs past their deadline and archive long-inactive jobs; "
+        "run daily from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--archive-after",
+            type=int,
+            default=settings.JOB_ARCHIVE_AFTER_DAYS,
+            help="Archive jobs inactive for this many days (default %(default)s).",
+        )
+        parser.add_argument(
+            "--no-archive",
+            action="store_true",
+            help="Only deactivate expired jobs.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of jobs updated or moved per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        expired = expiry.expire_jobs(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Deactivated {expired} expired jobs."))
+        if options["no_archive"]:
+            return
+        before = timezone.now() - timedelta(days=options["archive_after"])
+        archived = expiry.archive_jobs(before, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} inactive jobs."))
@@ -0,0 +1,244 @@
+"""
+Run the main pages once and report, per page, how many queries it makes,
+how long each takes and how the database executes it (EXPLAIN). Plans
+that scan a large table without an index are flagged, so a missing index
+shows up here before it shows up in production.
+
+Caching is switched off so every query runs. ``--seed N`` loads a synthetic
+dataset of N jobs inside a transaction that is rolled back afterwards;
+without it the current data is used.
+"""
+
+import re
+import statistics
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from apps.accounts.models import CustomUser, Employer, JobSeeker
+from apps.jobs.models import Category, Job
+from core.middleware.admin_cookie_middleware import CLIENT_SESSION_COOKIE
+from core.seeding import Seeder
+
+# A full scan of a table ("SCAN jobs_job" on SQLite, "Seq Scan on jobs_job"
+# on PostgreSQL); SQLite index scans read "SCAN t USING [COVERING] INDEX i".
+FULL_SCAN = re.compile(r"(?:^|\s)SCAN (\w+)\b(?! USING)|Seq Scan on (\w+)")
+# Scans that are the point of the query rather than a missing index.
+EXPECTED_SCANS = {
+    "jobs_jobsearchdocument": "BM25 statistics average over every document",
+}
+UNCACHED = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Report query counts, timings and EXPLAIN plans for the main pages."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            metavar="JOBS",
+            help="Seed this many jobs (rolled back afterwards) instead of using "
+            "the current data.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Times each query is re-run to time it (median is reported).",
+        )
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=1000,
+            help="Only flag full scans of tables with at least this many rows.",
+        )
+        parser.add_argument(
+            "--plans", action="store_true", help="Print every plan, not just scans."
+        )
+        parser.add_argument(
+            "--fail-on-scan",
+            action="store_true",
+            help="Exit with an error if any full scan is flagged.",
+        )
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.table_sizes = {}
+        try:
+            with transaction.atomic():
+                if options["seed"]:
+                    jobs = options["seed"]
+                    Seeder().run(
+                        employers=max(jobs // 100, 1),
+                        seekers=max(jobs // 20, 1),
+                        jobs=jobs,
+                        applications=jobs,
+                    )
+                with override_settings(
+                    ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+                    CACHES=UNCACHED,
+                    API_RATE_LIMIT=(0, 60),
+                ):
+                    scans = self.report()
+                raise Rollback
+        except Rollback:
+            pass
+
+        if scans and options["fail_on_scan"]:
+            raise CommandError(f"{scans} queries scan a large table.")
+
+    def targets(self):
+        """``(label, url or queryset, user)`` for every page worth checking."""
+        job = Job.objects.filter(is_active=True).first()
+        category = Category.objects.order_by("-job_count").first()
+        employer = (
+            Employer.objects.select_related("user").order_by("-job_count").first()
+        )
+        seeker = JobSeeker.objects.select_related("user").first()
+        if job is None or employer is None or seeker is None:
+            raise CommandError("No data to explain; pass --seed.")
+        login = seeker.user.email or seeker.user.username
+
+        return [
+            ("home", reverse("jobs:home"), None),
+            ("job_list", reverse("jobs:job_list"), None),
+            (
+                "job_list (category)",
+                f"{reverse('jobs:job_list')}?category={category.pk}",
+                None,
+            ),
+            ("job_list (search)", f"{reverse('jobs:job_list')}?search=python", None),
+            ("job_list (popular)", f"{reverse('jobs:job_list')}?sort=popular", None),
+            (
+                "job_list (near)",
+                f"{reverse('jobs:job_list')}?location=NYC&radius=50",
+                None,
+            ),
+            ("job_detail", reverse("jobs:job_detail", args=[job.pk]), None),
+            ("categories", reverse("jobs:categories"), None),
+            ("companies", reverse("jobs:companies"), None),
+            (
+                "company_detail",
+                reverse("jobs:company_detail", args=[employer.pk]),
+                None,
+            ),
+            ("api job_list", reverse("api_v1:job_list"), None),
+            (
+                "employer_dashboard",
+                reverse("dashboard:employer_dashboard"),
+                employer.user,
+            ),
+            (
+                "jobseeker_dashboard",
+                reverse("dashboard:jobseeker_dashboard"),
+                seeker.user,
+            ),
+            (
+                "login lookup",
+                CustomUser.objects.filter(Q(username=login) | Q(email=login)),
+                None,
+            ),
+        ]
+
+    def report(self):
+        scans = 0
+        for label, target, user in self.targets():
+            client = Client()
+            if user is not None:
+                client.force_login(user)
+                session = client.cookies.pop(settings.SESSION_COOKIE_NAME)
+                client.cookies[CLIENT_SESSION_COOKIE] = session.value
+            with self.capture() as queries:
+                if isinstance(target, str):
+                    response = client.get(target)
+                    if response.streaming:
+                        b"".join(response.streaming_content)
+                else:
+                    list(target)
+
+            timed = [(self.time(sql, params), sql, params) for sql, params in queries]
+            total = sum(elapsed for elapsed, _sql, _params in timed)
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"{label}: {len(timed)} queries, {total:.2f} ms"
+                )
+            )
+            for elapsed, sql, params in timed:
+                self.stdout.write(f"  {elapsed:8.2f} ms  {sql[:110]}")
+                plan = self.explain(sql, params)
+                flagged = self.large_scans(plan)
+                scans += bool(flagged)
+                for table in flagged:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"              full scan of {table} "
+                            f"({self.table_sizes[table]} rows)"
+                        )
+                    )
+                if self.options["plans"]:
+                    for line in plan:
+                        self.stdout.write(f"              {line}")
+        return scans
+
+    @contextmanager
+    def capture(self):
+        """Collect the SELECTs run inside the block with their parameters."""
+        queries = []
+
+        def record(execute, sql, params, many, context):
+            if sql.lstrip().upper().startswith("SELECT") and not many:
+                queries.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            yield queries
+
+    def time(self, sql, params):
+        timings = []
+        with connection.cursor() as cursor:
+            for _ in range(self.options["repeat"]):
+                start = time.perf_counter()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def explain(self, sql, params):
+        prefix = connection.ops.explain_query_prefix()
+        with connection.cursor() as cursor:
+            cursor.execute(f"{prefix} {sql}", params)
+            return [
+                " ".join(str(column) for column in row) for row in cursor.fetchall()
+            ]
+
+    def large_scans(self, plan):
+        tables = set()
+        for line in plan:
+            for match in FULL_SCAN.finditer(line):
+                tables.add(match.group(1) or match.group(2))
+        # Subquery aliases and the like are not tables.
+        tables &= set(connection.introspection.table_names())
+        tables -= EXPECTED_SCANS.keys()
+        flagged = []
+        for table in sorted(tables):
+            if table not in self.table_sizes:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"SELECT COUNT(*) FROM {connection.ops.quote_name(table)}"
+                    )
+                    self.table_sizes[table] = cursor.fetchone()[0]
+            if self.table_sizes[table] >= self.options["min_rows"]:
+                flagged.append(table)
+        return flagged
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.models import Employer
+from apps.jobs.importer import FORMATS, JobImporter, guess_format, read_rows
+
+
+class Command(BaseCommand):
+    help = "Import jobs from a CSV or JSON Lines file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import.")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="File format; guessed from the extension by default.",
+        )
+        parser.add_argument(
+            "--employer",
+            type=int,
+            help="Employer id for every row, instead of each row's employer column.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows validated and written per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        format = options["format"] or guess_format(options["path"])
+        if format is None:
+            raise CommandError("Cannot guess the file format; pass --format.")
+
+        employer = None
+        if options["employer"] is not None:
+            employer = Employer.objects.filter(pk=options["employer"]).first()
+            if employer is None:
+                raise CommandError(f"Employer {options['employer']} does not exist.")
+
+        importer = JobImporter(employer=employer, batch_size=options["batch_size"])
+        with open(options["path"], encoding="utf-8-sig", newline="") as stream:
+            result = importer.run(read_rows(stream, format))
+
+        for line, errors in result.errors:
+            for field, messages in errors.items():
+                self.stderr.write(f"Line {line}: {field}: {' '.join(messages)}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.created} jobs; {len(result.errors)} rows rejected."
+            )
+        )
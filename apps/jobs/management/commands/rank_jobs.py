@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs.ranking import rebuild_rankings
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the popular, trending, most applied and salary rankings of "
+        "active jobs. Schedule it every few minutes."
+    )
+
+    def handle(self, *args, **options):
+        rebuild_rankings()
+        self.stdout.write(self.style.SUCCESS("Rebuilt the job rankings."))
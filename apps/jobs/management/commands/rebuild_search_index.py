@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs.models import Job
+from apps.jobs.search import get_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the job search index from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of jobs read and written per batch.",
+        )
+
+    def handle(self, *args, **options):
+        backend = get_backend()
+        backend.setup()
+        indexed = backend.rebuild(Job.objects.all(), batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {indexed} active jobs with {type(backend).__name__}."
+            )
+        )
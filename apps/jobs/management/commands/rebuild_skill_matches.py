@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs import matching
+
+
+class Command(BaseCommand):
+    help = "Recompute skill vectors and the precomputed job/candidate matches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of jobs or seekers processed per batch.",
+        )
+
+    def handle(self, *args, **options):
+        jobs, seekers = matching.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Matched {jobs} active jobs against {seekers} seekers.")
+        )
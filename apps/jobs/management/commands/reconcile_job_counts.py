@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored active job counters on categories and employers."
+
+    def handle(self, *args, **options):
+        categories, employers = reconcile_counters()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Corrected {categories} categories and {employers} employers."
+            )
+        )
@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.seeding import PASSWORD, Seeder
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the database with realistic synthetic employers, seekers, jobs "
+        "and applications for load testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employers", type=int, default=200)
+        parser.add_argument("--seekers", type=int, default=5000)
+        parser.add_argument("--jobs", type=int, default=20000)
+        parser.add_argument("--applications", type=int, default=50000)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed; the same seed always produces the same data.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows inserted per query.",
+        )
+        parser.add_argument(
+            "--skill-matches",
+            action="store_true",
+            help="Also compute skill matches (slow for large datasets).",
+        )
+
+    def handle(self, *args, **options):
+        seeder = Seeder(
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            log=self.stdout.write,
+        )
+        if seeder.exists():
+            raise CommandError(
+                f"Seed {options['seed']} is already loaded; pass another --seed."
+            )
+        start = time.perf_counter()
+        seeder.run(
+            employers=options["employers"],
+            seekers=options["seekers"],
+            jobs=options["jobs"],
+            applications=options["applications"],
+            skill_matches=options["skill_matches"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded in {time.perf_counter() - start:.1f}s. Sign in as "
+                f"seed{options['seed']}-employer0 or seed{options['seed']}-seeker0 "
+                f"with password {PASSWORD!r}."
+            )
+        )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs import alerts
+from apps.jobs.models import JobAlert
+
+
+class Command(BaseCommand):
+    help = "Email pending job alert matches; run daily from cron."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--frequency",
+            choices=JobAlert.Frequency.values,
+            default=JobAlert.Frequency.DAILY,
+            help="Which alerts to send (instant alerts normally go out on their own).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Emails sent per connection batch (default JOB_ALERT_EMAIL_BATCH_SIZE).",
+        )
+
+    def handle(self, *args, **options):
+        sent = alerts.send_digests(
+            options["frequency"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Sent {sent} job alert emails."))
@@ -0,0 +1,385 @@
+"""
+Skill matching between job seekers and jobs.
+
+Seekers' ``skills`` and jobs' titles and requirements are normalised into a
+shared vocabulary (``Skill``) and stored as sparse, L2-normalised TF-IDF
+vectors (``SeekerSkill`` / ``JobSkill``). Cosine similarity is then one
+indexed join summing ``weight * weight`` over shared skills.
+
+The best ``MATCHES_PER_OWNER`` jobs per seeker and candidates per job are
+kept in ``SkillMatch``, so serving recommendations is a single indexed read.
+Lists are refreshed incrementally when a seeker or job changes, using the
+document frequencies of the moment; ``rebuild_skill_matches`` recomputes every
+vector and list with fresh IDF values.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Count, F, Min, Sum
+from django.db.models.functions import Greatest
+
+from apps.accounts.models import JobSeeker
+
+from .models import Job, JobSkill, SeekerSkill, Skill, SkillMatch
+
+MATCHES_PER_OWNER = 50
+MAX_SKILL_WORDS = 3
+SKILL_SEPARATORS = re.compile(r"[,;|\n\r•]+")
+WORD_PATTERN = re.compile(r"[a-z0-9+#.]*[a-z0-9+#]")
+# Spellings folded into one vocabulary entry.
+SKILL_ALIASES = {
+    "golang": "go",
+    "js": "javascript",
+    "k8s": "kubernetes",
+    "ml": "machine learning",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "postgres": "postgresql",
+    "react.js": "react",
+    "reactjs": "react",
+}
+# A title mention counts more than one in the requirements.
+TITLE_WEIGHT = 2
+
+
+def normalize_skill(text):
+    name = " ".join(WORD_PATTERN.findall((text or "").lower()))
+    name = SKILL_ALIASES.get(name, name)
+    return name[: Skill._meta.get_field("name").max_length]
+
+
+def split_skills(text):
+    """Normalised skills of a comma-separated list, without duplicates."""
+    names = {}
+    for part in SKILL_SEPARATORS.split(text or ""):
+        name = normalize_skill(part)
+        if name and len(name.split()) <= MAX_SKILL_WORDS:
+            names[name] = None
+    return list(names)
+
+
+def _phrases(text):
+    words = [normalize_skill(word) for word in WORD_PATTERN.findall(text.lower())]
+    for size in range(1, MAX_SKILL_WORDS + 1):
+        for start in range(len(words) - size + 1):
+            yield normalize_skill(" ".join(words[start : start + size]))
+
+
+def _job_terms(job, vocabulary):
+    """Skill name -> weighted count for ``job``."""
+    counts = Counter(split_skills(job.requirements))
+    for field, weight in (("title", TITLE_WEIGHT), ("requirements", 1)):
+        for phrase in _phrases(getattr(job, field) or ""):
+            if phrase in vocabulary:
+                counts[phrase] += weight
+    return counts
+
+
+def _skill_ids(names):
+    """Map ``names`` to ``Skill`` ids, creating the missing ones."""
+    names = set(names)
+    found = dict(Skill.objects.filter(name__in=names).values_list("name", "pk"))
+    missing = names - set(found)
+    if missing:
+        Skill.objects.bulk_create(
+            [Skill(name=name) for name in missing], ignore_conflicts=True
+        )
+        found.update(Skill.objects.filter(name__in=missing).values_list("name", "pk"))
+    return found
+
+
+def _vector(terms, skill_ids, document_frequency, total):
+    """L2-normalised TF-IDF weights keyed by skill id."""
+    weights = {}
+    for name, count in terms.items():
+        df = document_frequency.get(skill_ids[name], 0)
+        idf = math.log((1 + total) / (1 + df)) + 1
+        weights[skill_ids[name]] = (1 + math.log(count)) * idf
+    norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+    return {skill: weight / norm for skill, weight in weights.items()}
+
+
+def _shift_document_frequency(deltas):
+    rows_by_delta = defaultdict(list)
+    for skill_id, delta in deltas.items():
+        if delta:
+            rows_by_delta[delta].append(skill_id)
+    for delta, skill_ids in rows_by_delta.items():
+        Skill.objects.filter(pk__in=skill_ids).update(
+            job_count=Greatest(F("job_count") + delta, 0)
+        )
+
+
+def _scores(**filters):
+    """``{(job_id, seeker_id): cosine}`` for every pair sharing a skill."""
+    rows = (
+        SeekerSkill.objects.filter(**filters)
+        .values("job_seeker_id", job_id=F("skill__job_skills__job_id"))
+        .annotate(score=Sum(F("weight") * F("skill__job_skills__weight")))
+        .order_by()
+    )
+    return {
+        (row["job_id"], row["job_seeker_id"]): row["score"]
+        for row in rows
+        if row["job_id"] is not None
+    }
+
+
+def _top(scores, side):
+    """Keep the best ``MATCHES_PER_OWNER`` pairs per owner of ``side``."""
+    owner = 1 if side == "seeker" else 0
+    grouped = defaultdict(list)
+    for pair, score in scores.items():
+        grouped[pair[owner]].append((score, pair))
+    return [
+        SkillMatch(side=side, job_id=pair[0], job_seeker_id=pair[1], score=score)
+        for pairs in grouped.values()
+        for score, pair in heapq.nlargest(MATCHES_PER_OWNER, pairs)
+    ]
+
+
+def _merge(scores, side):
+    """
+    Merge freshly scored pairs into the existing lists of ``side`` (the
+    counterparties of a refreshed job or seeker) and trim them again.
+    """
+    if not scores:
+        return
+    owner_field = "job_seeker_id" if side == "seeker" else "job_id"
+    owner = 1 if side == "seeker" else 0
+    lists = SkillMatch.objects.filter(
+        side=side, **{f"{owner_field}__in": {pair[owner] for pair in scores}}
+    )
+    # Only lists with room, or whose lowest score is beaten, need rewriting.
+    bounds = {
+        row[owner_field]: (row["size"], row["lowest"])
+        for row in lists.values(owner_field)
+        .annotate(size=Count("pk"), lowest=Min("score"))
+        .order_by()
+    }
+    scores = {
+        pair: score
+        for pair, score in scores.items()
+        if bounds.get(pair[owner], (0, 0))[0] < MATCHES_PER_OWNER
+        or score > bounds[pair[owner]][1]
+    }
+    if not scores:
+        return
+    owners = {pair[owner] for pair in scores}
+    existing = SkillMatch.objects.filter(side=side, **{f"{owner_field}__in": owners})
+    combined = dict(scores)
+    stale = []
+    for pk, job_id, seeker_id, score in existing.values_list(
+        "pk", "job_id", "job_seeker_id", "score"
+    ):
+        if (job_id, seeker_id) in scores:
+            stale.append(pk)
+        else:
+            combined[(job_id, seeker_id)] = (score, pk)
+
+    keep = _top(
+        {
+            pair: value[0] if isinstance(value, tuple) else value
+            for pair, value in combined.items()
+        },
+        side,
+    )
+    kept = {(match.job_id, match.job_seeker_id) for match in keep}
+    stale += [
+        value[1]
+        for pair, value in combined.items()
+        if isinstance(value, tuple) and pair not in kept
+    ]
+    SkillMatch.objects.filter(pk__in=stale).delete()
+    SkillMatch.objects.bulk_create(
+        [match for match in keep if (match.job_id, match.job_seeker_id) in scores]
+    )
+
+
+def remove_jobs(job_ids):
+    """Drop the vectors and matches of jobs that were deleted or deactivated."""
+    old = Counter(
+        JobSkill.objects.filter(job_id__in=job_ids).values_list("skill_id", flat=True)
+    )
+    if not old:
+        # A job without skills has no matches either.
+        return
+    JobSkill.objects.filter(job_id__in=job_ids).delete()
+    SkillMatch.objects.filter(job_id__in=job_ids).delete()
+    _shift_document_frequency({skill: -count for skill, count in old.items()})
+
+
+@transaction.atomic
+def refresh_jobs(jobs):
+    """Re-vectorise ``jobs`` and update their candidates and seekers' lists."""
+    jobs = list(jobs)
+    remove_jobs([job.pk for job in jobs if not job.is_active])
+    jobs = [job for job in jobs if job.is_active]
+    if not jobs:
+        return
+
+    phrases = {phrase for job in jobs for phrase in _phrases(job.title or "")}
+    phrases |= {phrase for job in jobs for phrase in _phrases(job.requirements or "")}
+    vocabulary = set(
+        Skill.objects.filter(name__in=phrases).values_list("name", flat=True)
+    )
+    terms = {job.pk: _job_terms(job, vocabulary) for job in jobs}
+    skill_ids = _skill_ids(name for counts in terms.values() for name in counts)
+
+    job_ids = list(terms)
+    old = Counter(
+        JobSkill.objects.filter(job_id__in=job_ids).values_list("skill_id", flat=True)
+    )
+    new = Counter(skill_ids[name] for counts in terms.values() for name in counts)
+    _shift_document_frequency({skill: new[skill] - old[skill] for skill in old | new})
+
+    document_frequency = dict(
+        Skill.objects.filter(pk__in=new).values_list("pk", "job_count")
+    )
+    total = Job.objects.filter(is_active=True).count()
+    JobSkill.objects.filter(job_id__in=job_ids).delete()
+    JobSkill.objects.bulk_create(
+        JobSkill(job_id=job_id, skill_id=skill_id, weight=weight)
+        for job_id, counts in terms.items()
+        for skill_id, weight in _vector(
+            counts, skill_ids, document_frequency, total
+        ).items()
+    )
+
+    SkillMatch.objects.filter(job_id__in=job_ids).delete()
+    scores = _scores(skill__job_skills__job_id__in=job_ids)
+    SkillMatch.objects.bulk_create(_top(scores, "job"))
+    _merge(scores, "seeker")
+
+
+@transaction.atomic
+def refresh_seeker(job_seeker):
+    """Re-vectorise ``job_seeker`` and update their jobs and jobs' candidates."""
+    terms = Counter(split_skills(job_seeker.skills))
+    skill_ids = _skill_ids(terms)
+    document_frequency = dict(
+        Skill.objects.filter(pk__in=skill_ids.values()).values_list("pk", "job_count")
+    )
+    total = Job.objects.filter(is_active=True).count()
+
+    SeekerSkill.objects.filter(job_seeker=job_seeker).delete()
+    SeekerSkill.objects.bulk_create(
+        SeekerSkill(job_seeker=job_seeker, skill_id=skill_id, weight=weight)
+        for skill_id, weight in _vector(
+            terms, skill_ids, document_frequency, total
+        ).items()
+    )
+
+    SkillMatch.objects.filter(job_seeker=job_seeker).delete()
+    scores = _scores(job_seeker=job_seeker)
+    SkillMatch.objects.bulk_create(_top(scores, "seeker"))
+    _merge(scores, "job")
+
+
+def rebuild(batch_size=500):
+    """Recompute every vector and match list. Returns ``(jobs, seekers)``."""
+    with transaction.atomic():
+        SkillMatch.objects.all().delete()
+        JobSkill.objects.all().delete()
+        SeekerSkill.objects.all().delete()
+
+        # Vocabulary: seekers' skills plus skills listed in job requirements.
+        seekers = JobSeeker.objects.exclude(skills="").only("pk", "skills")
+        seeker_terms = {
+            seeker.pk: Counter(split_skills(seeker.skills))
+            for seeker in seekers.iterator(chunk_size=batch_size)
+        }
+        names = {name for counts in seeker_terms.values() for name in counts}
+        jobs = Job.objects.filter(is_active=True).only("pk", "title", "requirements")
+        for job in jobs.iterator(chunk_size=batch_size):
+            names.update(split_skills(job.requirements))
+        skill_ids = dict(Skill.objects.values_list("name", "pk"))
+        Skill.objects.bulk_create(
+            [Skill(name=name) for name in names - set(skill_ids)],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        skill_ids = dict(Skill.objects.values_list("name", "pk"))
+
+        # Document frequencies first, so every vector uses the final IDF.
+        document_frequency = Counter()
+        total = 0
+        for job in jobs.iterator(chunk_size=batch_size):
+            document_frequency.update(
+                skill_ids[name] for name in _job_terms(job, skill_ids)
+            )
+            total += 1
+        Skill.objects.bulk_update(
+            [
+                Skill(pk=pk, job_count=document_frequency[pk])
+                for pk in skill_ids.values()
+            ],
+            ["job_count"],
+            batch_size=batch_size,
+        )
+
+        def vectors():
+            for job in jobs.iterator(chunk_size=batch_size):
+                weights = _vector(
+                    _job_terms(job, skill_ids), skill_ids, document_frequency, total
+                )
+                for skill_id, weight in weights.items():
+                    yield JobSkill(job_id=job.pk, skill_id=skill_id, weight=weight)
+            for seeker_id, counts in seeker_terms.items():
+                weights = _vector(counts, skill_ids, document_frequency, total)
+                for skill_id, weight in weights.items():
+                    yield SeekerSkill(
+                        job_seeker_id=seeker_id, skill_id=skill_id, weight=weight
+                    )
+
+        rows = vectors()
+        while batch := list(islice(rows, batch_size * 10)):
+            for model in (JobSkill, SeekerSkill):
+                model.objects.bulk_create(
+                    [row for row in batch if isinstance(row, model)]
+                )
+
+        seeker_ids = list(seeker_terms)
+        for start in range(0, len(seeker_ids), batch_size):
+            scores = _scores(job_seeker_id__in=seeker_ids[start : start + batch_size])
+            SkillMatch.objects.bulk_create(
+                _top(scores, "seeker"), batch_size=batch_size * 10
+            )
+        job_ids = list(jobs.values_list("pk", flat=True).order_by("pk"))
+        for start in range(0, len(job_ids), batch_size):
+            scores = _scores(
+                skill__job_skills__job_id__in=job_ids[start : start + batch_size]
+            )
+            SkillMatch.objects.bulk_create(
+                _top(scores, "job"), batch_size=batch_size * 10
+            )
+    return total, len(seeker_terms)
+
+
+def recommended_jobs(job_seeker, limit=10):
+    """Active jobs best matching ``job_seeker``, annotated with ``match_score``."""
+    return (
+        Job.objects.filter(
+            is_active=True,
+            skill_matches__side="seeker",
+            skill_matches__job_seeker=job_seeker,
+        )
+        .select_related("employer")
+        .annotate(match_score=F("skill_matches__score"))
+        .order_by("-match_score", "-pk")[:limit]
+    )
+
+
+def top_candidates(job, limit=10):
+    """Job seekers best matching ``job``, annotated with ``match_score``."""
+    return (
+        JobSeeker.objects.filter(skill_matches__side="job", skill_matches__job=job)
+        .select_related("user")
+        .annotate(match_score=F("skill_matches__score"))
+        .order_by("-match_score", "-pk")[:limit]
+    )
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.jobs.search.tokenizer import weighted_terms
+
+
+def index_active_jobs(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    JobSearchDocument = apps.get_model("jobs", "JobSearchDocument")
+    JobSearchPosting = apps.get_model("jobs", "JobSearchPosting")
+
+    for job in Job.objects.filter(is_active=True).iterator():
+        terms = weighted_terms(job)
+        JobSearchDocument.objects.create(job_id=job.pk, length=sum(terms.values()))
+        JobSearchPosting.objects.bulk_create(
+            JobSearchPosting(term=term, job_id=job.pk, frequency=frequency)
+            for term, frequency in terms.items()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0004_alter_job_salary_currency"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobSearchDocument",
+            fields=[
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="jobs.job",
+                    ),
+                ),
+                ("length", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="JobSearchPosting",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=64)),
+                ("frequency", models.PositiveIntegerField()),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_postings",
+                        to="jobs.job",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("term", "job")},
+            },
+        ),
+        migrations.RunPython(index_active_jobs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:22
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_job_counts(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    for model, field in (
+        (apps.get_model("jobs", "Category"), "category"),
+        (apps.get_model("accounts", "Employer"), "employer"),
+    ):
+        model.objects.update(
+            job_count=Coalesce(
+                Subquery(
+                    Job.objects.filter(**{field: OuterRef("pk")}, is_active=True)
+                    .order_by()
+                    .values(field)
+                    .annotate(total=Count("pk"))
+                    .values("total")
+                ),
+                0,
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_employer_job_count"),
+        ("jobs", "0005_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="job_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_job_counts, migrations.RunPython.noop),
+    ]
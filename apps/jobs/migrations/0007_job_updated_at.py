@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:40
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_posted_date(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    Job.objects.update(updated_at=F("posted_date"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0006_category_job_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_posted_date, migrations.RunPython.noop),
+    ]
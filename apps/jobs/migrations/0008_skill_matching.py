@@ -0,0 +1,153 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_employer_job_count"),
+        ("jobs", "0007_job_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Skill",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, unique=True)),
+                ("job_count", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="SeekerSkill",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("weight", models.FloatField()),
+                (
+                    "job_seeker",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="skill_vector",
+                        to="accounts.jobseeker",
+                    ),
+                ),
+                (
+                    "skill",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="seeker_skills",
+                        to="jobs.skill",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("skill", "job_seeker")},
+            },
+        ),
+        migrations.CreateModel(
+            name="JobSkill",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("weight", models.FloatField()),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="skills",
+                        to="jobs.job",
+                    ),
+                ),
+                (
+                    "skill",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_skills",
+                        to="jobs.skill",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("skill", "job")},
+            },
+        ),
+        migrations.CreateModel(
+            name="SkillMatch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "side",
+                    models.CharField(
+                        choices=[
+                            ("seeker", "Jobs for a seeker"),
+                            ("job", "Candidates for a job"),
+                        ],
+                        max_length=6,
+                    ),
+                ),
+                ("score", models.FloatField()),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="skill_matches",
+                        to="jobs.job",
+                    ),
+                ),
+                (
+                    "job_seeker",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="skill_matches",
+                        to="accounts.jobseeker",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["side", "job_seeker", "-score"],
+                        name="jobs_skillm_side_2c502c_idx",
+                    ),
+                    models.Index(
+                        fields=["side", "job", "-score"],
+                        name="jobs_skillm_side_87cc69_idx",
+                    ),
+                ],
+                "unique_together": {("side", "job", "job_seeker")},
+            },
+        ),
+    ]
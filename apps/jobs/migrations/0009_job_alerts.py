@@ -0,0 +1,113 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_employer_job_count"),
+        ("jobs", "0008_skill_matching"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobAlert",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("search", models.CharField(blank=True, max_length=200)),
+                ("location", models.CharField(blank=True, max_length=100)),
+                (
+                    "job_type",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("full_time", "Full Time"),
+                            ("part_time", "Part Time"),
+                            ("contract", "Contract"),
+                            ("internship", "Internship"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("salary", models.CharField(blank=True, max_length=20)),
+                (
+                    "frequency",
+                    models.CharField(
+                        choices=[
+                            ("instant", "As jobs are posted"),
+                            ("daily", "Daily digest"),
+                        ],
+                        default="daily",
+                        max_length=10,
+                    ),
+                ),
+                ("is_active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("last_sent_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="jobs.category",
+                    ),
+                ),
+                (
+                    "job_seeker",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_alerts",
+                        to="accounts.jobseeker",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="JobAlertMatch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "alert",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_matches",
+                        to="jobs.jobalert",
+                    ),
+                ),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="jobs.job",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("alert", "job")},
+            },
+        ),
+    ]
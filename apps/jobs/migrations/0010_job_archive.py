@@ -0,0 +1,124 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:53
+
+import django.db.models.deletion
+import djmoney.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_employer_job_count"),
+        ("jobs", "0009_job_alerts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedJob",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=200)),
+                ("description", models.TextField()),
+                ("requirements", models.TextField()),
+                ("location", models.CharField(max_length=100)),
+                (
+                    "salary_currency",
+                    djmoney.models.fields.CurrencyField(
+                        choices=[
+                            ("GBP", "British Pound"),
+                            ("EUR", "Euro"),
+                            ("USD", "US Dollar"),
+                        ],
+                        default="USD",
+                        editable=False,
+                        max_length=3,
+                    ),
+                ),
+                (
+                    "salary",
+                    djmoney.models.fields.MoneyField(decimal_places=2, max_digits=10),
+                ),
+                (
+                    "salary_type",
+                    models.CharField(
+                        choices=[
+                            ("hourly", "Hourly"),
+                            ("weekly", "Weekly"),
+                            ("fixed", "Fixed"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "job_type",
+                    models.CharField(
+                        choices=[
+                            ("full_time", "Full Time"),
+                            ("part_time", "Part Time"),
+                            ("contract", "Contract"),
+                            ("internship", "Internship"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("posted_date", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("deadline", models.DateField(blank=True, null=True)),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="jobs.category",
+                    ),
+                ),
+                (
+                    "employer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_jobs",
+                        to="accounts.employer",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedApplication",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("cover_letter", models.TextField(blank=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("reviewing", "Reviewing"),
+                            ("accepted", "Accepted"),
+                            ("rejected", "Rejected"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("applied_date", models.DateTimeField()),
+                ("updated_date", models.DateTimeField()),
+                (
+                    "job_seeker",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_applications",
+                        to="accounts.jobseeker",
+                    ),
+                ),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="applications",
+                        to="jobs.archivedjob",
+                    ),
+                ),
+            ],
+        ),
+    ]
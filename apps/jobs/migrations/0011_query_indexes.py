@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_query_indexes"),
+        ("jobs", "0010_job_archive"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["job", "-applied_date"], name="application_job_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["job_seeker", "-applied_date"], name="application_seeker_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-posted_date", "-id"],
+                name="job_active_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["category", "-posted_date"],
+                name="job_active_category_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["employer", "-posted_date"], name="job_employer_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["deadline"],
+                name="job_active_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", False)),
+                fields=["updated_at"],
+                name="job_inactive_updated_idx",
+            ),
+        ),
+    ]
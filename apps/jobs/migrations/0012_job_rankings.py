@@ -0,0 +1,95 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:30
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Frozen copy of ``apps.jobs.facets.SALARY_PERIODS`` as of this migration.
+SALARY_PERIODS = {"hourly": 2080, "weekly": 52, "fixed": 1}
+
+
+def normalized_salary():
+    """Frozen copy of ``apps.jobs.facets.normalized_salary``."""
+    rates = getattr(settings, "SALARY_EXCHANGE_RATES", {settings.DEFAULT_CURRENCY: 1})
+    whens = [
+        models.When(
+            salary_currency=currency,
+            salary_type=period,
+            then=models.F("salary") * models.Value(Decimal(str(rate)) * multiplier),
+        )
+        for currency, rate in rates.items()
+        for period, multiplier in SALARY_PERIODS.items()
+    ]
+    return models.Case(
+        *whens,
+        default=models.F("salary"),
+        output_field=models.DecimalField(max_digits=16, decimal_places=2),
+    )
+
+
+def rank_active_jobs(apps, schema_editor):
+    # Zero scores until ``rank_jobs`` runs, so sorted listings and the home
+    # page fall back to the newest jobs rather than showing none.
+    Job = apps.get_model("jobs", "Job")
+    JobRanking = apps.get_model("jobs", "JobRanking")
+    rows = (
+        Job.objects.filter(is_active=True)
+        .annotate(normalized_salary=normalized_salary())
+        .values_list("pk", "normalized_salary")
+        .order_by()
+    )
+    JobRanking.objects.bulk_create(
+        (JobRanking(job_id=pk, salary=salary) for pk, salary in rows.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0011_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobRanking",
+            fields=[
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="ranking",
+                        serialize=False,
+                        to="jobs.job",
+                    ),
+                ),
+                ("popular", models.FloatField(default=0)),
+                ("trending", models.FloatField(default=0)),
+                ("applications", models.IntegerField(default=0)),
+                (
+                    "salary",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=16),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["-popular", "-job"], name="job_ranking_popular_idx"
+                    ),
+                    models.Index(
+                        fields=["-trending", "-job"], name="job_ranking_trending_idx"
+                    ),
+                    models.Index(
+                        fields=["-applications", "-job"], name="job_ranking_applied_idx"
+                    ),
+                    models.Index(
+                        fields=["-salary", "-job"], name="job_ranking_salary_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(rank_active_jobs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.locations.gazetteer import link_places
+
+
+def link_job_places(apps, schema_editor):
+    link_places(apps.get_model("jobs", "Job").objects.all())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_employer_place"),
+        ("jobs", "0012_job_rankings"),
+        ("locations", "0002_load_places"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="place",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to="locations.place",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["place", "-posted_date"],
+                name="job_active_place_idx",
+            ),
+        ),
+        migrations.RunPython(link_job_places, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from djmoney.models.fields import MoneyField
 from apps.accounts.models import Employer, JobSeeker
+from apps.locations.models import Place
 
 
 class Category(models.Model):
@@ -8,14 +9,12 @@ class Category(models.Model):
     icon = models.CharField(
         max_length=50, help_text="FontAwesome icon class (e.g., 'fas fa-code')"
     )
+    # Active jobs in this category, maintained by apps.jobs.signals.
+    job_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.name
 
-    @property
-    def job_count(self):
-        return self.job_set.filter(is_active=True).count()
-
 
 class Job(models.Model):
     JOB_TYPE_CHOICES = [
@@ -38,17 +37,52 @@ class Job(models.Model):
     description = models.TextField()
     requirements = models.TextField()
     location = models.CharField(max_length=100)
+    # The city ``location`` names, set by apps.locations.signals.
+    place = models.ForeignKey(
+        Place, on_delete=models.SET_NULL, null=True, blank=True, editable=False
+    )
     salary = MoneyField(max_digits=10, decimal_places=2, default_currency="USD")
     salary_type = models.CharField(
         max_length=10, choices=SalaryType.choices, default=SalaryType.FIXED
     )
     job_type = models.CharField(max_length=20, choices=JOB_TYPE_CHOICES)
     posted_date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     deadline = models.DateField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
 
     class Meta:
         ordering = ["-posted_date"]
+        # Public pages only ever read active jobs, newest first, so those
+        # indexes are partial; expiry and archival get their own.
+        indexes = [
+            models.Index(
+                fields=["-posted_date", "-id"],
+                condition=models.Q(is_active=True),
+                name="job_active_recent_idx",
+            ),
+            models.Index(
+                fields=["category", "-posted_date"],
+                condition=models.Q(is_active=True),
+                name="job_active_category_idx",
+            ),
+            models.Index(
+                fields=["place", "-posted_date"],
+                condition=models.Q(is_active=True),
+                name="job_active_place_idx",
+            ),
+            models.Index(fields=["employer", "-posted_date"], name="job_employer_idx"),
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(is_active=True),
+                name="job_active_deadline_idx",
+            ),
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(is_active=False),
+                name="job_inactive_updated_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -73,6 +107,225 @@ class Application(models.Model):
 
     class Meta:
         unique_together = ("job", "job_seeker")
+        indexes = [
+            models.Index(fields=["job", "-applied_date"], name="application_job_idx"),
+            models.Index(
+                fields=["job_seeker", "-applied_date"], name="application_seeker_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.job_seeker.user.username} - {self.job.title}"
+
+
+class JobSearchDocument(models.Model):
+    """Per-job statistics used to length-normalise search scores."""
+
+    job = models.OneToOneField(
+        Job, on_delete=models.CASCADE, primary_key=True, related_name="search_document"
+    )
+    length = models.PositiveIntegerField(default=0)
+
+
+class JobSearchPosting(models.Model):
+    """One entry of the inverted index: a term and its weighted frequency in a job."""
+
+    term = models.CharField(max_length=64)
+    job = models.ForeignKey(
+        Job, on_delete=models.CASCADE, related_name="search_postings"
+    )
+    frequency = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = ("term", "job")
+
+
+class Skill(models.Model):
+    """Normalised skill name shared by seekers' profiles and job requirements."""
+
+    name = models.CharField(max_length=100, unique=True)
+    # Active jobs requiring this skill; the document frequency for TF-IDF.
+    job_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.name
+
+
+class JobSkill(models.Model):
+    """One component of a job's L2-normalised TF-IDF skill vector."""
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="skills")
+    skill = models.ForeignKey(
+        Skill, on_delete=models.CASCADE, related_name="job_skills"
+    )
+    weight = models.FloatField()
+
+    class Meta:
+        unique_together = ("skill", "job")
+
+
+class SeekerSkill(models.Model):
+    """One component of a job seeker's L2-normalised TF-IDF skill vector."""
+
+    job_seeker = models.ForeignKey(
+        JobSeeker, on_delete=models.CASCADE, related_name="skill_vector"
+    )
+    skill = models.ForeignKey(
+        Skill, on_delete=models.CASCADE, related_name="seeker_skills"
+    )
+    weight = models.FloatField()
+
+    class Meta:
+        unique_together = ("skill", "job_seeker")
+
+
+class SkillMatch(models.Model):
+    """
+    A precomputed cosine similarity between a job and a job seeker. Rows with
+    ``side="seeker"`` are the seeker's best jobs, ``side="job"`` the job's
+    best candidates.
+    """
+
+    SIDES = [("seeker", "Jobs for a seeker"), ("job", "Candidates for a job")]
+
+    side = models.CharField(max_length=6, choices=SIDES)
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="skill_matches")
+    job_seeker = models.ForeignKey(
+        JobSeeker, on_delete=models.CASCADE, related_name="skill_matches"
+    )
+    score = models.FloatField()
+
+    class Meta:
+        unique_together = ("side", "job", "job_seeker")
+        indexes = [
+            models.Index(fields=["side", "job_seeker", "-score"]),
+            models.Index(fields=["side", "job", "-score"]),
+        ]
+
+
+class JobRanking(models.Model):
+    """
+    Sort keys of an active job, recomputed by ``apps.jobs.ranking``:
+    time-decayed activity scores, the application count and the yearly
+    salary in ``DEFAULT_CURRENCY``.
+    """
+
+    job = models.OneToOneField(
+        Job, on_delete=models.CASCADE, primary_key=True, related_name="ranking"
+    )
+    popular = models.FloatField(default=0)
+    trending = models.FloatField(default=0)
+    applications = models.IntegerField(default=0)
+    salary = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-popular", "-job"], name="job_ranking_popular_idx"),
+            models.Index(fields=["-trending", "-job"], name="job_ranking_trending_idx"),
+            models.Index(
+                fields=["-applications", "-job"], name="job_ranking_applied_idx"
+            ),
+            models.Index(fields=["-salary", "-job"], name="job_ranking_salary_idx"),
+        ]
+
+
+class JobAlert(models.Model):
+    """A job seeker's saved ``JobSearchForm`` criteria; blank fields match anything."""
+
+    class Frequency(models.TextChoices):
+        INSTANT = "instant", "As jobs are posted"
+        DAILY = "daily", "Daily digest"
+
+    job_seeker = models.ForeignKey(
+        JobSeeker, on_delete=models.CASCADE, related_name="job_alerts"
+    )
+    search = models.CharField(max_length=200, blank=True)
+    location = models.CharField(max_length=100, blank=True)
+    category = models.ForeignKey(
+        Category, on_delete=models.CASCADE, null=True, blank=True
+    )
+    job_type = models.CharField(max_length=20, choices=Job.JOB_TYPE_CHOICES, blank=True)
+    # A key of ``facets.SALARY_BANDS``.
+    salary = models.CharField(max_length=20, blank=True)
+    frequency = models.CharField(
+        max_length=10, choices=Frequency.choices, default=Frequency.DAILY
+    )
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        parts = [self.search, self.location, self.category, self.job_type]
+        return ", ".join(str(part) for part in parts if part) or "All jobs"
+
+    def criteria(self):
+        """The alert as ``job_list`` query parameters."""
+        values = {
+            "search": self.search,
+            "location": self.location,
+            "category": self.category_id or "",
+            "job_type": self.job_type,
+            "salary": self.salary,
+        }
+        return {key: value for key, value in values.items() if value}
+
+
+class JobAlertMatch(models.Model):
+    """A new job matched by an alert and not yet emailed."""
+
+    alert = models.ForeignKey(
+        JobAlert, on_delete=models.CASCADE, related_name="pending_matches"
+    )
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="+")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("alert", "job")
+
+
+class ArchivedJob(models.Model):
+    """
+    A job moved out of ``jobs_job`` after it had been inactive for
+    ``JOB_ARCHIVE_AFTER_DAYS``; keeps the original id. See ``apps.jobs.expiry``.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=200)
+    employer = models.ForeignKey(
+        Employer, on_delete=models.CASCADE, related_name="archived_jobs"
+    )
+    category = models.ForeignKey(
+        Category, on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    description = models.TextField()
+    requirements = models.TextField()
+    location = models.CharField(max_length=100)
+    salary = MoneyField(max_digits=10, decimal_places=2, default_currency="USD")
+    salary_type = models.CharField(max_length=10, choices=Job.SalaryType.choices)
+    job_type = models.CharField(max_length=20, choices=Job.JOB_TYPE_CHOICES)
+    posted_date = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    deadline = models.DateField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedApplication(models.Model):
+    """An application to an ``ArchivedJob``; keeps the original id."""
+
+    id = models.BigIntegerField(primary_key=True)
+    job = models.ForeignKey(
+        ArchivedJob, on_delete=models.CASCADE, related_name="applications"
+    )
+    job_seeker = models.ForeignKey(
+        JobSeeker, on_delete=models.CASCADE, related_name="archived_applications"
+    )
+    cover_letter = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    applied_date = models.DateTimeField()
+    updated_date = models.DateTimeField()
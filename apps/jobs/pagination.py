@@ -0,0 +1,217 @@
+import base64
+import binascii
+import math
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+def encode_cursor(job, direction, key="posted_date"):
+    """
+    ``job`` may be a ``Job`` or a ``values()`` row with ``key``/``id``. A
+    row without a ``key`` value (see ``KeysetPaginator.tail``) is encoded
+    with an empty one.
+    """
+    if isinstance(job, dict):
+        value, pk = job[key], job["id"]
+    else:
+        value, pk = getattr(job, key), job.pk
+    if value is None:
+        value = ""
+    elif hasattr(value, "isoformat"):
+        value = value.isoformat()
+    raw = f"{direction}|{value}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, parse=parse_datetime, allow_missing=False):
+    """
+    Return ``(direction, value, pk)`` or ``None`` for a malformed cursor.
+    ``value`` is ``None`` for a row without one, if ``allow_missing``.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        direction, value, pk = raw.split("|")
+        value = parse(value) if value else None
+        pk = int(pk)
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        ValueError,
+        TypeError,
+        InvalidOperation,
+        ValidationError,
+    ):
+        return None
+    if direction not in ("next", "prev") or (value is None and not allow_missing):
+        return None
+    if isinstance(value, (float, Decimal)) and not math.isfinite(value):
+        return None
+    return direction, value, pk
+
+
+def after_cursor(queryset, posted_date, pk):
+    """Rows that come after ``(posted_date, pk)`` in newest-first order."""
+    return (
+        queryset.filter(posted_date__lte=posted_date)
+        .filter(Q(posted_date__lt=posted_date) | Q(pk__lt=pk))
+        .order_by("-posted_date", "-pk")
+    )
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor, previous_cursor, total=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.total = total
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Cursor pagination in descending ``(key, tiebreak)`` order, by default
+    ``Job.Meta.ordering`` (``-posted_date``, then ``-pk``).
+
+    Each page is a single ``WHERE (key, id) < cursor ... LIMIT n + 1`` query,
+    so deep pages cost the same as the first one and no ``COUNT(*)`` is
+    issued. ``total`` is passed through for templates when the caller already
+    knows (or has estimated) the size of the result set.
+
+    ``tail``, if given, holds rows without a key (annotated with ``None``);
+    they follow the keyed rows, newest first. Only the page where one part
+    ends and the other begins takes a second query.
+    """
+
+    def __init__(
+        self,
+        queryset,
+        per_page,
+        total=None,
+        key="posted_date",
+        parse=parse_datetime,
+        tiebreak="pk",
+        tail=None,
+    ):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.total = total
+        self.key = key
+        self.parse = parse
+        self.tiebreak = tiebreak
+        self.tail = tail
+
+    def get_page(self, cursor=None):
+        position = self._position(cursor)
+        first, then = self._queries(position)
+        rows = list(first)
+        if then is not None and len(rows) <= self.per_page:
+            rows += then[: self.per_page + 1 - len(rows)]
+        return self._page(position, rows)
+
+    async def aget_page(self, cursor=None):
+        position = self._position(cursor)
+        first, then = self._queries(position)
+        rows = [row async for row in first]
+        if then is not None and len(rows) <= self.per_page:
+            rows += [row async for row in then[: self.per_page + 1 - len(rows)]]
+        return self._page(position, rows)
+
+    def _position(self, cursor):
+        if not cursor:
+            return None
+        return decode_cursor(cursor, self.parse, allow_missing=self.tail is not None)
+
+    def _queries(self, position):
+        """
+        The query for the page at ``position`` (up to ``per_page + 1`` rows)
+        and the one continuing it into the other part, if there is one.
+        """
+        limit = self.per_page + 1
+        if position is None:
+            return self._keyed("next")[:limit], self._tail("next")
+        direction, value, pk = position
+        if value is None:
+            # In the tail: forward stays there, backward runs into the keyed
+            # rows from their end.
+            if direction == "next":
+                return self._tail("next", pk)[:limit], None
+            return self._tail("prev", pk)[:limit], self._keyed("prev")
+        if direction == "next":
+            return self._keyed("next", value, pk)[:limit], self._tail("next")
+        return self._keyed("prev", value, pk)[:limit], None
+
+    def _keyed(self, direction, value=None, pk=None):
+        """Keyed rows past ``(value, pk)``, nearest first."""
+        key, tiebreak = self.key, self.tiebreak
+        queryset = self.queryset
+        # The separate bound on ``key`` lets the database seek into the
+        # index; with only the OR, SQLite may scan another table and sort.
+        if direction == "next":
+            if value is not None:
+                queryset = queryset.filter(**{f"{key}__lte": value}).filter(
+                    Q(**{f"{key}__lt": value}) | Q(**{f"{tiebreak}__lt": pk})
+                )
+            return queryset.order_by(f"-{key}", f"-{tiebreak}")
+        if value is not None:
+            queryset = queryset.filter(**{f"{key}__gte": value}).filter(
+                Q(**{f"{key}__gt": value}) | Q(**{f"{tiebreak}__gt": pk})
+            )
+        return queryset.order_by(key, tiebreak)
+
+    def _tail(self, direction, pk=None):
+        if self.tail is None:
+            return None
+        if direction == "next":
+            tail = self.tail if pk is None else self.tail.filter(pk__lt=pk)
+            return tail.order_by("-pk")
+        return self.tail.filter(pk__gt=pk).order_by("pk")
+
+    def _page(self, position, rows):
+        more = len(rows) > self.per_page
+        if position is None:
+            return self._build(rows, has_before=False, has_after=more)
+        if position[0] == "next":
+            return self._build(rows, has_before=True, has_after=more)
+        # Previous pages are fetched nearest first.
+        return self._build(rows[: self.per_page][::-1], has_before=more, has_after=True)
+
+    def _build(self, rows, has_before, has_after):
+        rows = rows[: self.per_page]
+        next_cursor = (
+            encode_cursor(rows[-1], "next", self.key) if rows and has_after else None
+        )
+        previous_cursor = (
+            encode_cursor(rows[0], "prev", self.key) if rows and has_before else None
+        )
+        return KeysetPage(rows, next_cursor, previous_cursor, total=self.total)
+
+
+def capped_paginator(queryset, per_page, total):
+    """
+    Numbered pages for orderings with no key to seek on (search relevance),
+    cut off after ``JOB_SEARCH_MAX_PAGES`` so the OFFSET stays shallow.
+    ``total`` is the already known row count, so no COUNT is run.
+    """
+    limit = settings.JOB_SEARCH_MAX_PAGES * per_page
+    paginator = Paginator(queryset[:limit], per_page)
+    paginator.count = min(total, limit)
+    return paginator
@@ -0,0 +1,180 @@
+"""
+Sort orders of job listings other than newest first, read from the
+``JobRanking`` table so a sorted page is a range scan of one of its indexes.
+
+``rebuild_rankings`` (``manage.py rank_jobs``, run every few minutes)
+recomputes the table from the analytics rollups. A job's activity on a day
+is its views plus ``APPLICATION_WEIGHT`` per application; ``popular`` sums
+it over ``POPULAR_DAYS`` and ``trending`` over ``TRENDING_DAYS``, each day
+weighted down by half every ``*_HALF_LIFE_DAYS``. Saving a job updates its
+salary and gives a new job a row with zero scores straight away, as does the
+importer (``rank_new_jobs``); sorted listings show any job still without a
+row after the ranked ones.
+"""
+
+from datetime import timedelta
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Case, F, FloatField, Sum, Value, When
+from django.utils import timezone
+
+from apps.dashboard.models import JobDailyStats, JobStats
+
+from .cache import invalidate
+from .facets import normalized_salary, yearly_salary
+from .models import Job, JobRanking
+from .pagination import KeysetPaginator
+
+APPLICATION_WEIGHT = 10
+POPULAR_DAYS = 60
+POPULAR_HALF_LIFE_DAYS = 14
+TRENDING_DAYS = 7
+TRENDING_HALF_LIFE_DAYS = 1
+
+# ``?sort=`` value -> (label, JobRanking field); "" is newest first.
+SORTS = {
+    "": ("Most Recent", None),
+    "popular": ("Most Popular", "popular"),
+    "trending": ("Trending", "trending"),
+    "most_applied": ("Most Applied", "applications"),
+    "salary": ("Highest Salary", "salary"),
+}
+
+
+def ranked(jobs, sort):
+    """
+    The ranked ``jobs``, with their score for ``sort`` as ``sort_value``.
+    Read by walking one of the ranking indexes. Employers are fetched
+    separately: joined in, SQLite would rather sort every active job.
+    """
+    return (
+        jobs.filter(ranking__isnull=False)
+        .select_related(None)
+        .prefetch_related("employer")
+        .annotate(sort_value=F(f"ranking__{SORTS[sort][1]}"))
+    )
+
+
+def sort_jobs(jobs, sort):
+    """Order ``jobs`` by one of ``SORTS``; ties go to the newest job."""
+    if SORTS[sort][1] is None:
+        return jobs.order_by("-posted_date", "-pk")
+    return ranked(jobs, sort).order_by("-sort_value", "-ranking__job_id")
+
+
+def paginator(jobs, sort, per_page, total=None):
+    """
+    Cursor pagination of ``jobs`` in ``sort`` order, keyed on the score and
+    the job id so each page is a range of a ranking index. Jobs without a
+    ranking row yet follow the ranked ones, newest first.
+    """
+    field = SORTS[sort][1]
+    if field is None:
+        return KeysetPaginator(jobs, per_page, total=total)
+    return KeysetPaginator(
+        ranked(jobs, sort),
+        per_page,
+        total=total,
+        key="sort_value",
+        parse=JobRanking._meta.get_field(field).to_python,
+        tiebreak="ranking__job_id",
+        tail=jobs.filter(ranking__isnull=True).annotate(
+            sort_value=Value(None, output_field=FloatField())
+        ),
+    )
+
+
+def rank_job(job):
+    """Keep a saved job's salary key current; its scores wait for the rebuild."""
+    if not {"salary", "salary_currency", "salary_type"} <= job.__dict__.keys():
+        # Saved with the salary deferred, so it didn't change.
+        return
+    salary = yearly_salary(job.salary.amount, job.salary.currency.code, job.salary_type)
+    if not JobRanking.objects.filter(job=job).update(salary=salary):
+        JobRanking.objects.bulk_create(
+            [JobRanking(job=job, salary=salary)], ignore_conflicts=True
+        )
+
+
+def rank_new_jobs(jobs):
+    """Give jobs inserted in bulk a ranking row with zero scores."""
+    JobRanking.objects.bulk_create(
+        [
+            JobRanking(
+                job_id=job.pk,
+                salary=yearly_salary(
+                    job.salary.amount, job.salary.currency.code, job.salary_type
+                ),
+            )
+            for job in jobs
+            if job.is_active
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def decayed(days, half_life, today):
+    """Sum of each day's activity, weighted by its age."""
+    weight = Case(
+        *[
+            When(day=today - timedelta(days=age), then=Value(0.5 ** (age / half_life)))
+            for age in range(days)
+        ],
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    activity = F("views") + Value(APPLICATION_WEIGHT) * F("applications")
+    return Sum(weight * activity, output_field=FloatField())
+
+
+def rebuild_rankings(batch_size=1000):
+    """Recompute the ranking of every active job."""
+    today = timezone.localdate()
+    scores = {
+        job_id: (popular, trending)
+        for job_id, popular, trending in JobDailyStats.objects.filter(
+            job__is_active=True, day__gt=today - timedelta(days=POPULAR_DAYS)
+        )
+        .values("job_id")
+        .annotate(
+            popular=decayed(POPULAR_DAYS, POPULAR_HALF_LIFE_DAYS, today),
+            trending=decayed(TRENDING_DAYS, TRENDING_HALF_LIFE_DAYS, today),
+        )
+        .values_list("job_id", "popular", "trending")
+        .order_by()
+    }
+    applications = dict(
+        JobStats.objects.filter(job__is_active=True).values_list(
+            "job_id", "applications"
+        )
+    )
+    jobs = (
+        Job.objects.filter(is_active=True)
+        .annotate(normalized_salary=normalized_salary())
+        .values_list("pk", "normalized_salary")
+        .order_by()
+    )
+
+    def ranking(pk, salary):
+        popular, trending = scores.get(pk, (0.0, 0.0))
+        return JobRanking(
+            job_id=pk,
+            # Withdrawals can make a day's activity negative.
+            popular=max(popular, 0.0),
+            trending=max(trending, 0.0),
+            applications=applications.get(pk, 0),
+            salary=salary,
+        )
+
+    rows = jobs.iterator(chunk_size=batch_size)
+    with transaction.atomic():
+        JobRanking.objects.filter(job__is_active=False).delete()
+        while batch := [ranking(*row) for row in islice(rows, batch_size)]:
+            JobRanking.objects.bulk_create(
+                batch,
+                update_conflicts=True,
+                unique_fields=["job"],
+                update_fields=["popular", "trending", "applications", "salary"],
+            )
+    invalidate("rankings")
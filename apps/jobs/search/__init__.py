@@ -0,0 +1,12 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+DEFAULT_BACKEND = "apps.jobs.search.backends.database.DatabaseSearchBackend"
+
+
+@lru_cache(maxsize=None)
+def get_backend():
+    path = getattr(settings, "JOB_SEARCH_BACKEND", DEFAULT_BACKEND)
+    return import_string(path)()
@@ -0,0 +1,34 @@
+class BaseSearchBackend:
+    """
+    Interface every job search backend implements.
+
+    ``search`` receives an already filtered ``Job`` queryset and must return it
+    narrowed to the matching jobs, annotated with ``search_rank`` and ordered
+    best match first, so callers can keep chaining filters and paginate.
+    """
+
+    def setup(self):
+        """Create any storage the backend needs. Safe to call repeatedly."""
+
+    def index(self, job):
+        raise NotImplementedError
+
+    def index_many(self, jobs, batch_size=500):
+        """Index a batch of jobs written without signals (e.g. ``bulk_create``)."""
+        for job in jobs:
+            self.index(job)
+
+    def remove(self, job_id):
+        raise NotImplementedError
+
+    def remove_many(self, job_ids, batch_size=500):
+        """Drop a batch of jobs deactivated without signals (``QuerySet.update``)."""
+        for job_id in job_ids:
+            self.remove(job_id)
+
+    def rebuild(self, queryset, batch_size=500):
+        """Drop the whole index and re-index ``queryset``. Returns the job count."""
+        raise NotImplementedError
+
+    def search(self, queryset, query):
+        raise NotImplementedError
@@ -0,0 +1,153 @@
+import math
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Avg, Case, Count, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast
+
+from apps.jobs.models import JobSearchDocument, JobSearchPosting
+
+from ..tokenizer import tokenize, weighted_terms
+from .base import BaseSearchBackend
+
+
+class DatabaseSearchBackend(BaseSearchBackend):
+    """
+    Portable inverted index stored in ordinary tables, ranked with BM25.
+
+    Every query term must match (the last one as a prefix, so results follow
+    the user while they type). Matching is a range scan on the
+    ``(term, job_id)`` unique index instead of a ``LIKE`` over every row.
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    def index(self, job):
+        if not job.is_active:
+            self.remove(job.pk)
+            return
+        terms = weighted_terms(job)
+        with transaction.atomic():
+            JobSearchPosting.objects.filter(job_id=job.pk).delete()
+            JobSearchPosting.objects.bulk_create(
+                JobSearchPosting(term=term, job_id=job.pk, frequency=frequency)
+                for term, frequency in terms.items()
+            )
+            JobSearchDocument.objects.update_or_create(
+                job_id=job.pk, defaults={"length": sum(terms.values())}
+            )
+
+    def index_many(self, jobs, batch_size=500):
+        jobs = list(jobs)
+        with transaction.atomic():
+            job_ids = [job.pk for job in jobs]
+            JobSearchPosting.objects.filter(job_id__in=job_ids).delete()
+            JobSearchDocument.objects.filter(job_id__in=job_ids).delete()
+            postings, documents = self._entries(job for job in jobs if job.is_active)
+            self._flush(postings, documents, batch_size)
+
+    def remove(self, job_id):
+        with transaction.atomic():
+            JobSearchPosting.objects.filter(job_id=job_id).delete()
+            JobSearchDocument.objects.filter(job_id=job_id).delete()
+
+    def remove_many(self, job_ids, batch_size=500):
+        job_ids = list(job_ids)
+        with transaction.atomic():
+            for start in range(0, len(job_ids), batch_size):
+                batch = job_ids[start : start + batch_size]
+                JobSearchPosting.objects.filter(job_id__in=batch).delete()
+                JobSearchDocument.objects.filter(job_id__in=batch).delete()
+
+    def rebuild(self, queryset, batch_size=500):
+        indexed = 0
+        with transaction.atomic():
+            JobSearchPosting.objects.all().delete()
+            JobSearchDocument.objects.all().delete()
+
+            jobs = queryset.filter(is_active=True).iterator(chunk_size=batch_size)
+            while batch := list(islice(jobs, batch_size)):
+                self._flush(*self._entries(batch), batch_size)
+                indexed += len(batch)
+        return indexed
+
+    def _entries(self, jobs):
+        postings, documents = [], []
+        for job in jobs:
+            terms = weighted_terms(job)
+            postings.extend(
+                JobSearchPosting(term=term, job_id=job.pk, frequency=frequency)
+                for term, frequency in terms.items()
+            )
+            documents.append(
+                JobSearchDocument(job_id=job.pk, length=sum(terms.values()))
+            )
+        return postings, documents
+
+    def _flush(self, postings, documents, batch_size):
+        JobSearchDocument.objects.bulk_create(documents, batch_size=batch_size)
+        JobSearchPosting.objects.bulk_create(postings, batch_size=batch_size * 20)
+
+    def search(self, queryset, query):
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+        *exact, prefix = terms
+        stats = JobSearchDocument.objects.aggregate(
+            total=Count("pk"), avg=Avg("length")
+        )
+        total = stats["total"] or 0
+        avg_length = stats["avg"] or 1.0
+
+        frequencies = dict(
+            JobSearchPosting.objects.filter(term__in=exact)
+            .values_list("term")
+            .annotate(df=Count("job_id"))
+        )
+        prefix_frequency = JobSearchPosting.objects.filter(
+            term__startswith=prefix
+        ).aggregate(df=Count("job_id", distinct=True))["df"]
+
+        for term in exact:
+            queryset = queryset.filter(
+                pk__in=JobSearchPosting.objects.filter(term=term).values("job_id")
+            )
+        queryset = queryset.filter(
+            pk__in=JobSearchPosting.objects.filter(term__startswith=prefix).values(
+                "job_id"
+            )
+        )
+
+        idf = Case(
+            *[
+                When(
+                    search_postings__term=term,
+                    then=Value(self._idf(total, frequencies.get(term, 0))),
+                )
+                for term in exact
+            ],
+            default=Value(self._idf(total, prefix_frequency)),
+            output_field=FloatField(),
+        )
+        tf = Cast(F("search_postings__frequency"), FloatField())
+        length = Cast(F("search_document__length"), FloatField())
+        norm = (
+            Value(self.k1 * (1 - self.b))
+            + Value(self.k1 * self.b / avg_length) * length
+        )
+        score = idf * tf * Value(self.k1 + 1) / (tf + norm)
+
+        return (
+            queryset.filter(
+                Q(search_postings__term__in=exact)
+                | Q(search_postings__term__startswith=prefix)
+            )
+            .annotate(search_rank=Sum(score, output_field=FloatField()))
+            .order_by("-search_rank", "-posted_date", "-pk")
+        )
+
+    @staticmethod
+    def _idf(total, frequency):
+        return math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
@@ -0,0 +1,55 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import FloatField, Value
+
+from ..tokenizer import tokenize
+from .base import BaseSearchBackend
+
+# The "simple" config doesn't stem: the vector and the query hold the words
+# as ``tokenize`` splits them, as in the database backend's index.
+CONFIG = "simple"
+
+VECTOR = (
+    SearchVector("title", weight="A", config=CONFIG)
+    + SearchVector("location", weight="B", config=CONFIG)
+    + SearchVector("requirements", weight="C", config=CONFIG)
+    + SearchVector("description", weight="D", config=CONFIG)
+)
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Ranks with ``tsvector``/``ts_rank`` computed from the job columns.
+
+    Postgres keeps the index itself, so indexing is a no-op; create a GIN
+    expression index over the same vector to avoid recomputing it per row.
+    Queries are tokenized like the other backends: every term must match,
+    the last one as a prefix.
+    """
+
+    def index(self, job):
+        pass
+
+    def remove(self, job_id):
+        pass
+
+    def remove_many(self, job_ids, batch_size=500):
+        pass
+
+    def rebuild(self, queryset, batch_size=500):
+        return queryset.filter(is_active=True).count()
+
+    def search(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+        *exact, prefix = terms
+        # Tokens are [a-z0-9+#] only, so quoting them is enough.
+        raw = " & ".join([f"'{term}'" for term in exact] + [f"'{prefix}':*"])
+        search_query = SearchQuery(raw, search_type="raw", config=CONFIG)
+        return (
+            queryset.annotate(search_vector=VECTOR)
+            .filter(search_vector=search_query)
+            .annotate(search_rank=SearchRank(VECTOR, search_query))
+            .order_by("-search_rank", "-posted_date", "-pk")
+        )
@@ -0,0 +1,104 @@
+from django.db import connection, transaction
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+
+from ..tokenizer import FIELD_WEIGHTS, tokenize
+from .base import BaseSearchBackend
+
+TABLE = "jobs_job_fts"
+COLUMNS = tuple(FIELD_WEIGHTS)
+
+
+class SQLiteFTSSearchBackend(BaseSearchBackend):
+    """
+    Uses an SQLite FTS5 virtual table keyed by the job id and FTS5's built-in
+    ``bm25()`` ranking, weighted like the portable backend.
+    """
+
+    def setup(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} "
+                f"USING fts5({', '.join(COLUMNS)}, tokenize='porter unicode61')"
+            )
+
+    def index(self, job):
+        self.setup()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE} WHERE rowid = %s", [job.pk])
+            if job.is_active:
+                self._insert(cursor, job)
+
+    def index_many(self, jobs, batch_size=500):
+        self.setup()
+        jobs = list(jobs)
+        with transaction.atomic(), connection.cursor() as cursor:
+            for start in range(0, len(jobs), batch_size):
+                batch = jobs[start : start + batch_size]
+                placeholders = ", ".join(["%s"] * len(batch))
+                cursor.execute(
+                    f"DELETE FROM {TABLE} WHERE rowid IN ({placeholders})",
+                    [job.pk for job in batch],
+                )
+            for job in jobs:
+                if job.is_active:
+                    self._insert(cursor, job)
+
+    def remove(self, job_id):
+        self.setup()
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE} WHERE rowid = %s", [job_id])
+
+    def remove_many(self, job_ids, batch_size=500):
+        self.setup()
+        job_ids = list(job_ids)
+        with transaction.atomic(), connection.cursor() as cursor:
+            for start in range(0, len(job_ids), batch_size):
+                batch = job_ids[start : start + batch_size]
+                placeholders = ", ".join(["%s"] * len(batch))
+                cursor.execute(
+                    f"DELETE FROM {TABLE} WHERE rowid IN ({placeholders})", batch
+                )
+
+    def rebuild(self, queryset, batch_size=500):
+        self.setup()
+        indexed = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE}")
+            for job in queryset.filter(is_active=True).iterator(chunk_size=batch_size):
+                self._insert(cursor, job)
+                indexed += 1
+        return indexed
+
+    def _insert(self, cursor, job):
+        placeholders = ", ".join(["%s"] * (len(COLUMNS) + 1))
+        cursor.execute(
+            f"INSERT INTO {TABLE} (rowid, {', '.join(COLUMNS)}) VALUES ({placeholders})",
+            [job.pk, *(getattr(job, column) or "" for column in COLUMNS)],
+        )
+
+    def search(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset.annotate(search_rank=RawSQL("0.0", [], FloatField()))
+
+        *exact, prefix = terms
+        match = " ".join([f'"{term}"' for term in exact] + [f'"{prefix}"*'])
+        weights = ", ".join(str(weight) for weight in FIELD_WEIGHTS.values())
+        table = queryset.model._meta.db_table
+        return (
+            queryset.filter(
+                pk__in=RawSQL(
+                    f"SELECT rowid FROM {TABLE} WHERE {TABLE} MATCH %s", [match]
+                )
+            )
+            .annotate(
+                search_rank=RawSQL(
+                    f"SELECT -bm25({TABLE}, {weights}) FROM {TABLE} "
+                    f"WHERE {TABLE} MATCH %s AND {TABLE}.rowid = {table}.id",
+                    [match],
+                    output_field=FloatField(),
+                )
+            )
+            .order_by("-search_rank", "-posted_date", "-pk")
+        )
@@ -0,0 +1,38 @@
+import re
+from collections import Counter
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+STOP_WORDS = frozenset("""
+    a an and are as at be but by for from has have in is it its of on or our
+    that the their this to was we were will with you your
+    """.split())
+
+MAX_TERM_LENGTH = 64
+
+# Multiplier applied to term frequencies per field, so a match in the title
+# outranks the same word buried in a long description.
+FIELD_WEIGHTS = {
+    "title": 3,
+    "location": 2,
+    "requirements": 1,
+    "description": 1,
+}
+
+
+def tokenize(text):
+    tokens = []
+    for token in TOKEN_PATTERN.findall((text or "").lower()):
+        if token in STOP_WORDS:
+            continue
+        tokens.append(token[:MAX_TERM_LENGTH])
+    return tokens
+
+
+def weighted_terms(job):
+    """Return a ``Counter`` of term -> weighted frequency for ``job``."""
+    counts = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        for token in tokenize(getattr(job, field, "")):
+            counts[token] += weight
+    return counts
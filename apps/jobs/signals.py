@@ -0,0 +1,99 @@
+from django.db.models.signals import (
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from apps.accounts.models import Employer, JobSeeker
+
+from . import matching, ranking, tasks
+from .cache import invalidate_on_commit
+from .counters import UNKNOWN, apply_counter_change, counter_state, stored_counter_state
+from .models import Category, Job
+from .search import get_backend
+
+
+@receiver(post_init, sender=Job)
+def remember_counter_state(sender, instance, **kwargs):
+    instance._counter_state = counter_state(instance) if instance.pk else None
+
+
+@receiver(pre_save, sender=Job)
+@receiver(pre_delete, sender=Job)
+def load_counter_state(sender, instance, **kwargs):
+    if instance._counter_state is UNKNOWN:
+        instance._counter_state = stored_counter_state(instance.pk)
+
+
+@receiver(post_save, sender=Job)
+def update_job_counters(sender, instance, created, **kwargs):
+    new_state = counter_state(instance)
+    if new_state is UNKNOWN:
+        new_state = stored_counter_state(instance.pk)
+    apply_counter_change(None if created else instance._counter_state, new_state)
+    instance._counter_state = new_state
+
+
+@receiver(post_save, sender=Job)
+def index_job(sender, instance, **kwargs):
+    get_backend().index(instance)
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_matches(sender, instance, **kwargs):
+    tasks.refresh_job_matches.delay([instance.pk])
+
+
+@receiver(post_save, sender=Job)
+def match_job_alerts(sender, instance, created, **kwargs):
+    if created and instance.is_active:
+        tasks.match_job_alerts.delay([instance.pk])
+
+
+@receiver(post_save, sender=Job)
+def rank_job(sender, instance, **kwargs):
+    if instance.is_active:
+        ranking.rank_job(instance)
+
+
+@receiver(pre_delete, sender=Job)
+def remove_job_matches(sender, instance, **kwargs):
+    matching.remove_jobs([instance.pk])
+
+
+@receiver(post_save, sender=JobSeeker)
+def refresh_seeker_matches(sender, instance, **kwargs):
+    tasks.refresh_seeker_matches.delay(instance.pk)
+
+
+@receiver(post_delete, sender=Job)
+def release_job_counters(sender, instance, **kwargs):
+    apply_counter_change(instance._counter_state, None)
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job(sender, instance, **kwargs):
+    # Only active jobs are indexed (see index_job).
+    if instance.is_active:
+        get_backend().remove(instance.pk)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_pages(sender, **kwargs):
+    invalidate_on_commit("jobs")
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_pages(sender, **kwargs):
+    invalidate_on_commit("categories")
+
+
+@receiver(post_save, sender=Employer)
+@receiver(post_delete, sender=Employer)
+def invalidate_employer_pages(sender, **kwargs):
+    invalidate_on_commit("employers")
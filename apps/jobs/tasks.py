@@ -0,0 +1,56 @@
+from django.template import loader
+
+from apps.accounts.models import JobSeeker
+from apps.accounts.tasks import send_email
+from apps.tasks.queue import task
+
+from . import alerts, matching
+from .models import Application, Job, JobAlert
+
+
+@task
+def refresh_job_matches(job_ids):
+    jobs = Job.objects.filter(pk__in=job_ids).only(
+        "pk", "is_active", "title", "requirements"
+    )
+    matching.refresh_jobs(jobs)
+
+
+@task
+def refresh_seeker_matches(job_seeker_id):
+    job_seeker = JobSeeker.objects.filter(pk=job_seeker_id).first()
+    if job_seeker is not None:
+        matching.refresh_seeker(job_seeker)
+
+
+@task
+def match_job_alerts(job_ids):
+    """Match new jobs against saved searches and send the instant alerts."""
+    alert_ids = alerts.match_new_jobs(job_ids)
+    if alert_ids:
+        alerts.send_digests(JobAlert.Frequency.INSTANT, alert_ids=alert_ids)
+
+
+@task
+def notify_new_application(application_id, dashboard_url):
+    """Email the employer about a new application."""
+    application = (
+        Application.objects.select_related("job__employer__user", "job_seeker__user")
+        .filter(pk=application_id)
+        .first()
+    )
+    if application is None or not application.job.employer.user.email:
+        return
+    job = application.job
+    seeker = application.job_seeker.user
+    body = loader.render_to_string(
+        "jobs/emails/new_application.txt",
+        {
+            "application": application,
+            "job": job,
+            "employer": job.employer,
+            "applicant": seeker.get_full_name() or seeker.username,
+            "dashboard_url": dashboard_url,
+        },
+    )
+    send_email(f"New application for {job.title}", body, [job.employer.user.email])
@@ -1,3 +1,1325 @@
-from django.test import TestCase
+import base64
+import csv
+import html
+import json
+import re
+import sqlite3
+import tempfile
+import warnings
+from datetime import datetime, timedelta
+from decimal import Decimal
+from inspect import iscoroutinefunction
+from io import StringIO
+from unittest import skipUnless
+from unittest.mock import patch
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import Count, F
+from django.http import QueryDict
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from djmoney.money import Money
+
+from apps.accounts.models import Employer, JobSeeker
+from apps.dashboard import analytics
+from apps.tasks.queue import run_pending_tasks
+from core.seeding import PASSWORD
+from core.testing import QueryBudgetTestCase, SeededTestCase
+
+from . import alerts, expiry, facets, matching
+from .alerts import load_index
+from .counters import reconcile_counters
+from .facets import normalized_salary
+from .forms import JobAlertForm, JobSearchForm
+from .importer import JobImporter
+from .models import (
+    Application,
+    ArchivedJob,
+    Category,
+    Job,
+    JobAlert,
+    JobAlertMatch,
+    JobRanking,
+    JobSearchDocument,
+    SkillMatch,
+)
+from .pagination import KeysetPaginator, decode_cursor
+from .ranking import rebuild_rankings, sort_jobs
+from .search import get_backend
+from .views import filter_jobs
+
+
+class PublicViewQueryBudgetTests(QueryBudgetTestCase):
+    def test_home(self):
+        # featured (trending) jobs, their employers, categories
+        self.assertQueryBudget(reverse("jobs:home"), 3)
+
+    def test_job_list(self):
+        # facet groups, page of jobs with employers
+        self.assertQueryBudget(reverse("jobs:job_list"), 2)
+
+    def test_job_list_filtered(self):
+        # + category validation
+        self.assertQueryBudget(
+            f"{reverse('jobs:job_list')}?category=1&salary=30000-60000", 3
+        )
+
+    def test_job_list_next_page(self):
+        response = self.client.get(reverse("jobs:job_list"))
+        cursor = response.context["jobs"].next_cursor
+        self.assertQueryBudget(f"{reverse('jobs:job_list')}?cursor={cursor}", 2)
+
+    def test_job_list_search(self):
+        # + index statistics, exact and prefix document frequencies
+        self.assertQueryBudget(f"{reverse('jobs:job_list')}?search=python+dev", 5)
+
+    def test_job_list_sorted(self):
+        for sort in ("popular", "trending", "most_applied", "salary"):
+            url = f"{reverse('jobs:job_list')}?sort={sort}"
+            # facet groups, page of ranked jobs, their employers
+            response = self.assertQueryBudget(url, 3)
+            cursor = response.context["jobs"].next_cursor
+            self.assertQueryBudget(f"{url}&cursor={cursor}", 3)
+
+    def test_job_detail(self):
+        job = Job.objects.first()
+        # last-modified lookup, job with employer
+        self.assertQueryBudget(reverse("jobs:job_detail", args=[job.pk]), 2)
+
+    def test_categories(self):
+        self.assertQueryBudget(reverse("jobs:categories"), 1)
+
+    def test_companies(self):
+        self.assertQueryBudget(reverse("jobs:companies"), 1)
+
+    def test_company_detail(self):
+        company = Employer.objects.first()
+        # company with user, active jobs
+        self.assertQueryBudget(reverse("jobs:company_detail", args=[company.pk]), 2)
+
+
+class PublicPageCacheTests(QueryBudgetTestCase):
+    def test_anonymous_pages_are_served_from_cache(self):
+        company = Employer.objects.first()
+        for url in (
+            reverse("jobs:home"),
+            reverse("jobs:categories"),
+            reverse("jobs:companies"),
+            reverse("jobs:company_detail", args=[company.pk]),
+        ):
+            self.client.get(url)
+            self.assertQueryBudget(url, 0)
+
+    def test_job_changes_invalidate_cached_pages(self):
+        url = reverse("jobs:home")
+        self.client.get(url)
+
+        # The first of the featured jobs.
+        job = sort_jobs(Job.objects.filter(is_active=True), "trending").first()
+        job.title = "Freshly Renamed Role"
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save()
+
+        self.assertContains(self.client.get(url), "Freshly Renamed Role")
+
+    def test_logged_in_users_reuse_cached_fragments(self):
+        employer = Employer.objects.select_related("user").first()
+        self.login(employer.user)
+        self.client.get(reverse("jobs:home"))
+        # session, user; featured jobs and category grid come from the cache
+        self.assertQueryBudget(reverse("jobs:home"), 2)
+
+
+class ConditionalGetTests(QueryBudgetTestCase):
+    def revalidate(self, url, budget, **headers):
+        with self.assertNumQueries(budget):
+            return self.client.get(url, headers=headers)
+
+    def test_matching_etag_returns_not_modified(self):
+        company = Employer.objects.first()
+        job = Job.objects.first()
+        for url, budget in (
+            (reverse("jobs:job_list"), 0),
+            (f"{reverse('jobs:job_list')}?search=python", 0),
+            (reverse("jobs:company_detail", args=[company.pk]), 0),
+            # last-modified lookup only
+            (reverse("jobs:job_detail", args=[job.pk]), 1),
+        ):
+            response = self.client.get(url)
+            self.assertIn("public", response["Cache-Control"])
+            self.assertIn("Cookie", response["Vary"])
+
+            response = self.revalidate(url, budget, if_none_match=response["ETag"])
+            self.assertEqual(response.status_code, 304)
+
+    def test_job_detail_honours_if_modified_since(self):
+        url = reverse("jobs:job_detail", args=[Job.objects.first().pk])
+        last_modified = self.client.get(url)["Last-Modified"]
+        response = self.revalidate(url, 1, if_modified_since=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_job_change_changes_etag(self):
+        job = Job.objects.first()
+        url = reverse("jobs:job_detail", args=[job.pk])
+        etag = self.client.get(url)["ETag"]
+
+        job.title = "Freshly Renamed Role"
+        job.save()
+
+        response = self.client.get(url, headers={"if_none_match": etag})
+        self.assertContains(response, "Freshly Renamed Role")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_logged_in_pages_are_private(self):
+        employer = Employer.objects.select_related("user").first()
+        self.login(employer.user)
+        response = self.client.get(reverse("jobs:job_list"))
+        self.assertNotIn("ETag", response)
+        self.assertIn("private", response["Cache-Control"])
+
+
+class AsyncViewTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.company = Employer.objects.first()
+        self.job = Job.objects.filter(is_active=True).first()
+        self.urls = [
+            reverse("jobs:home"),
+            reverse("jobs:job_list"),
+            f"{reverse('jobs:job_list')}?category={self.job.category_id}",
+            f"{reverse('jobs:job_list')}?search=python&page=2",
+            f"{reverse('jobs:job_list')}?sort=trending&page=2",
+            reverse("jobs:job_detail", args=[self.job.pk]),
+            reverse("jobs:categories"),
+            reverse("jobs:companies"),
+            reverse("jobs:company_detail", args=[self.company.pk]),
+        ]
+
+    async def test_asgi_serves_public_pages_with_async_views(self):
+        for url in self.urls:
+            response = await self.async_client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertTrue(iscoroutinefunction(response.resolver_match.func), url)
+
+    async def test_async_views_match_sync_views(self):
+        for url in self.urls:
+            await sync_to_async(cache.clear)()
+            sync_response = await sync_to_async(self.client.get)(url)
+            await sync_to_async(cache.clear)()
+            response = await self.async_client.get(url)
+            self.assertEqual(response.content, sync_response.content, url)
+
+    async def test_logged_in_seeker_sees_application(self):
+        application = (
+            await Application.objects.select_related("job", "job_seeker__user")
+            .filter(job__is_active=True)
+            .afirst()
+        )
+        await sync_to_async(self.login)(application.job_seeker.user)
+        self.async_client.cookies = self.client.cookies
+        response = await self.async_client.get(
+            reverse("jobs:job_detail", args=[application.job_id])
+        )
+        self.assertTrue(response.context["has_applied"])
+        self.assertIn("private", response["Cache-Control"])
+
+    async def test_missing_job_is_not_found(self):
+        response = await self.async_client.get(reverse("jobs:job_detail", args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+
+class ApiTests(SeededTestCase):
+    def get_json(self, url, budget):
+        with self.assertNumQueries(budget):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            return json.loads(b"".join(response.streaming_content))
+
+    def test_job_list_pages_by_cursor(self):
+        url = reverse("api_v1:job_list")
+        seen = []
+        page = self.get_json(f"{url}?limit=50&fields=id", 1)
+        while True:
+            self.assertTrue(all(set(row) == {"id"} for row in page["results"]))
+            seen += [row["id"] for row in page["results"]]
+            if page["next"] is None:
+                break
+            page = self.get_json(f"{url}?limit=50&fields=id&cursor={page['next']}", 1)
+
+        expected = Job.objects.filter(is_active=True).order_by("-posted_date", "-pk")
+        self.assertEqual(seen, list(expected.values_list("id", flat=True)))
+
+    def test_job_list_default_fields_skip_long_text(self):
+        page = self.get_json(f"{reverse('api_v1:job_list')}?limit=5", 1)
+        self.assertEqual(len(page["results"]), 5)
+        self.assertNotIn("description", page["results"][0])
+        self.assertIn("company", page["results"][0])
+
+    def test_job_detail(self):
+        job = Job.objects.select_related("employer").first()
+        url = reverse("api_v1:job_detail", args=[job.pk])
+        # last-modified lookup, job row
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        data = response.json()
+        self.assertEqual(data["description"], job.description)
+        self.assertEqual(data["company"], job.employer.company_name)
+
+        response = self.client.get(url, headers={"if_none_match": response["ETag"]})
+        self.assertEqual(response.status_code, 304)
+
+    def test_categories_and_employers(self):
+        categories = self.get_json(reverse("api_v1:category_list"), 1)
+        self.assertEqual(len(categories["results"]), Category.objects.count())
+
+        url = f"{reverse('api_v1:employer_list')}?limit=3&fields=company_name"
+        page = self.get_json(url, 1)
+        self.assertEqual(len(page["results"]), 3)
+        page = self.get_json(f"{url}&cursor={page['next']}", 1)
+        self.assertEqual(len(page["results"]), Employer.objects.count() - 3)
+        self.assertIsNone(page["next"])
+
+    def test_invalid_requests(self):
+        url = reverse("api_v1:job_list")
+        for query in (
+            "fields=salary,password",
+            "cursor=nonsense",
+            "limit=x",
+            "updated_since=yesterday",
+            "updated_since=2026-02-30T00:00:00",
+        ):
+            self.assertEqual(self.client.get(f"{url}?{query}").status_code, 400)
+        missing = reverse("api_v1:employer_detail", args=[0])
+        self.assertEqual(self.client.get(missing).status_code, 404)
+
+    @override_settings(TIME_ZONE="America/New_York")
+    def test_updated_since_without_an_offset_is_local_time(self):
+        since = timezone.make_aware(datetime(2026, 1, 15, 9, 0))
+        jobs = Job.objects.filter(is_active=True)
+        jobs.update(updated_at=since - timedelta(hours=1))
+        job = jobs.first()
+        Job.objects.filter(pk=job.pk).update(updated_at=since)
+
+        url = f"{reverse('api_v1:job_list')}?fields=id&updated_since=2026-01-15T09:00"
+        with warnings.catch_warnings():
+            # Django warns when a naive datetime reaches a query.
+            warnings.simplefilter("error", RuntimeWarning)
+            page = self.get_json(url, 1)
+        self.assertEqual(page["results"], [{"id": job.pk}])
+
+    @override_settings(API_RATE_LIMIT=(3, 60))
+    def test_rate_limit(self):
+        url = reverse("api_v1:category_list")
+        statuses = [self.client.get(url).status_code for _ in range(4)]
+        self.assertEqual(statuses, [200, 200, 200, 429])
+
+
+def sqlite_has_fts5():
+    with sqlite3.connect(":memory:") as db:
+        options = {row[0] for row in db.execute("PRAGMA compile_options")}
+    return connection.vendor == "sqlite" and "ENABLE_FTS5" in options
+
+
+class SearchBackendTestMixin:
+    """Behaviour every search backend shares; subclasses name the backend."""
+
+    backend = None
+    # ts_rank doesn't normalise for document length.
+    ranks_by_length = True
+    stems = False
+
+    def setUp(self):
+        self.enterContext(override_settings(JOB_SEARCH_BACKEND=self.backend))
+        get_backend.cache_clear()
+        self.addCleanup(get_backend.cache_clear)
+        get_backend().setup()
+        user = get_user_model().objects.create(username="searcher", is_employer=True)
+        self.employer = Employer.objects.create(user=user, company_name="Searchers")
+        self.title = self.make_job("Python Developer", "Build services.")
+        self.short = self.make_job("Backend Engineer", "Mostly Python.")
+        self.long = self.make_job(
+            "Backend Engineer", "Python, " + "and plenty of other work " * 20
+        )
+        self.other = self.make_job("Designer", "Figma prototypes.")
+
+    def make_job(self, title, description, **fields):
+        return Job.objects.create(
+            title=title,
+            employer=self.employer,
+            description=description,
+            requirements="-",
+            location="Remote",
+            salary=50000,
+            job_type="full_time",
+            **fields,
+        )
+
+    def search(self, query):
+        return list(get_backend().search(Job.objects.all(), query))
+
+    def test_best_matches_come_first(self):
+        found = self.search("python")
+        self.assertEqual(found[0], self.title)
+        self.assertCountEqual(found, [self.title, self.short, self.long])
+        if self.ranks_by_length:
+            self.assertEqual(found, [self.title, self.short, self.long])
+        self.assertGreater(found[0].search_rank, found[-1].search_rank)
+
+    def test_every_term_must_match_the_last_as_a_prefix(self):
+        self.assertCountEqual(self.search("pyth"), [self.title, self.short, self.long])
+        self.assertEqual(self.search("developer pyth"), [self.title])
+        self.assertEqual(self.search("pyth developer"), [])
+        self.assertEqual(self.search("python figma"), [])
+
+    def test_inflected_words_match_only_where_the_backend_stems(self):
+        self.assertEqual(self.search("develope"), [self.title])
+        self.assertEqual(self.search("developers"), [self.title] if self.stems else [])
+
+    def test_stop_words_are_ignored(self):
+        self.assertEqual(self.search("the python"), self.search("python"))
+        everything = self.search("the and of")
+        self.assertCountEqual(everything, Job.objects.all())
+        self.assertEqual({job.search_rank for job in everything}, {0.0})
+
+    def test_index_follows_saves_deactivation_and_deletes(self):
+        self.other.title = "Python Designer"
+        self.other.save()
+        self.assertIn(self.other, self.search("python"))
+        self.assertEqual(self.search("designer"), [self.other])
+
+        self.other.is_active = False
+        self.other.save()
+        self.assertNotIn(self.other, self.search("python"))
+        self.other.is_active = True
+        self.other.save()
+        self.assertIn(self.other, self.search("python"))
+
+        pk = self.other.pk
+        self.other.delete()
+        self.assertNotIn(pk, self.indexed())
+        self.assertEqual(self.search("designer"), [])
+
+    def indexed(self):
+        return set(Job.objects.filter(is_active=True).values_list("pk", flat=True))
+
+
+class DatabaseSearchBackendTests(SearchBackendTestMixin, TestCase):
+    backend = "apps.jobs.search.backends.database.DatabaseSearchBackend"
+
+    def indexed(self):
+        return set(JobSearchDocument.objects.values_list("job_id", flat=True))
+
+
+@skipUnless(sqlite_has_fts5(), "needs SQLite with FTS5")
+class SQLiteFTSSearchBackendTests(SearchBackendTestMixin, TestCase):
+    backend = "apps.jobs.search.backends.sqlite_fts.SQLiteFTSSearchBackend"
+    # The porter tokenizer stems the text and the query alike.
+    stems = True
+
+    def indexed(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT rowid FROM jobs_job_fts")
+            return {row[0] for row in cursor.fetchall()}
+
+
+@skipUnless(connection.vendor == "postgresql", "needs PostgreSQL")
+class PostgresSearchBackendTests(SearchBackendTestMixin, TestCase):
+    backend = "apps.jobs.search.backends.postgres.PostgresSearchBackend"
+    ranks_by_length = False
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = get_user_model().objects.create(username="paged", is_employer=True)
+        employer = Employer.objects.create(user=user, company_name="Paged")
+        jobs = Job.objects.bulk_create(
+            Job(
+                title=f"Paged {i}",
+                employer=employer,
+                description="-",
+                requirements="-",
+                location="Remote",
+                salary=50000,
+                job_type="full_time",
+            )
+            for i in range(23)
+        )
+        # Three jobs per timestamp, so pages split runs of equal dates.
+        start = timezone.now()
+        for i, job in enumerate(jobs):
+            Job.objects.filter(pk=job.pk).update(
+                posted_date=start - timedelta(hours=i // 3)
+            )
+        cls.expected = list(
+            Job.objects.order_by("-posted_date", "-pk").values_list("pk", flat=True)
+        )
+
+    def walk(self, paginator):
+        """Every page forward, then back from the last; returns the pages."""
+        pages = [paginator.get_page()]
+        self.assertFalse(pages[0].has_previous())
+        while pages[-1].has_next():
+            pages.append(paginator.get_page(pages[-1].next_cursor))
+        back = [pages[-1]]
+        while back[-1].has_previous():
+            back.append(paginator.get_page(back[-1].previous_cursor))
+        forward = [[job.pk for job in page] for page in pages]
+        self.assertEqual([[job.pk for job in page] for page in back[::-1]], forward)
+        return forward
+
+    def test_every_page_forward_and_back(self):
+        pages = self.walk(KeysetPaginator(Job.objects.all(), 5))
+        self.assertEqual([len(page) for page in pages], [5, 5, 5, 5, 3])
+        self.assertEqual([pk for page in pages for pk in page], self.expected)
+
+    def test_ties_are_broken_by_id(self):
+        Job.objects.update(posted_date=timezone.now())
+        pages = self.walk(KeysetPaginator(Job.objects.all(), 4))
+        self.assertEqual(
+            [pk for page in pages for pk in page], sorted(self.expected, reverse=True)
+        )
+
+    def test_malformed_and_tampered_cursors_start_over(self):
+        def encoded(raw):
+            return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+        posted = timezone.now().isoformat()
+        bad = [
+            "bogus",
+            "%%%",
+            base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+            encoded("next|2024-01-01"),
+            encoded(f"sideways|{posted}|1"),
+            encoded(f"next|{posted}|one"),
+            encoded("next|yesterday|1"),
+            encoded("next||1"),
+            encoded(f"next|{posted}|1|2"),
+        ]
+        paginator = KeysetPaginator(Job.objects.all(), 5)
+        first = [job.pk for job in paginator.get_page()]
+        for cursor in bad:
+            self.assertIsNone(decode_cursor(cursor), cursor)
+            self.assertEqual([job.pk for job in paginator.get_page(cursor)], first)
+        for value in ("nan", "inf"):
+            self.assertIsNone(decode_cursor(encoded(f"next|{value}|1"), float))
+
+    def test_empty_queryset(self):
+        page = KeysetPaginator(Job.objects.none(), 5).get_page()
+        self.assertEqual(list(page), [])
+        self.assertFalse(page.has_other_pages())
+        self.assertIsNone(page.next_cursor)
+
+    def test_page_links_keep_the_query_encoded(self):
+        params = {"location": "Remote", "ref": "c++ & go", "note": "a=b"}
+        response = self.client.get(reverse("jobs:job_list"), params)
+        link = re.search(r'href="(\?[^"]*cursor=[^"]*)"', response.content.decode())
+        self.assertEqual(
+            QueryDict(html.unescape(link[1])[1:]).dict(),
+            {**params, "cursor": response.context["jobs"].next_cursor},
+        )
+
+    @override_settings(JOB_SEARCH_MAX_PAGES=2)
+    def test_search_results_stop_after_the_page_cap(self):
+        get_backend().rebuild(Job.objects.all())
+        url = reverse("jobs:job_list")
+        for page in ("2", "3"):
+            response = self.client.get(url, {"search": "paged", "page": page})
+            jobs = response.context["jobs"]
+            self.assertEqual((jobs.number, jobs.paginator.count), (2, 18), page)
+            self.assertEqual(response.context["total_jobs"], 23)
+            self.assertContains(response, "page=1")
+            self.assertNotContains(response, "page=3")
+
+    async def test_async_pages_match(self):
+        paginator = KeysetPaginator(Job.objects.all(), 5)
+        first = await paginator.aget_page()
+        second = await paginator.aget_page(first.next_cursor)
+        self.assertEqual([job.pk for job in [*first, *second]], self.expected[:10])
+
+
+class JobCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.employers = [
+            Employer.objects.create(
+                user=User.objects.create(username=f"counted{i}", is_employer=True),
+                company_name=f"Counted {i}",
+            )
+            for i in range(2)
+        ]
+        cls.categories = [
+            Category.objects.create(name=f"Counted {i}") for i in range(2)
+        ]
+
+    def assertCounts(self, categories, employers):
+        self.assertEqual(
+            [
+                Category.objects.get(pk=category.pk).job_count
+                for category in self.categories
+            ],
+            categories,
+        )
+        self.assertEqual(
+            [
+                Employer.objects.get(pk=employer.pk).job_count
+                for employer in self.employers
+            ],
+            employers,
+        )
+
+    def test_counters_follow_each_change(self):
+        first, second = self.categories
+        job = Job.objects.create(
+            title="Counted",
+            employer=self.employers[0],
+            category=first,
+            description="-",
+            requirements="-",
+            location="Remote",
+            salary=50000,
+            job_type="full_time",
+        )
+        self.assertCounts([1, 0], [1, 0])
+
+        job.is_active = False
+        job.save()
+        self.assertCounts([0, 0], [0, 0])
+        # Moving an inactive job changes nothing.
+        job.category = second
+        job.save()
+        self.assertCounts([0, 0], [0, 0])
+
+        job.is_active = True
+        job.save()
+        self.assertCounts([0, 1], [1, 0])
+
+        job.category = first
+        job.employer = self.employers[1]
+        job.save()
+        self.assertCounts([1, 0], [0, 1])
+
+        # A save without the tracked fields loaded reads them back.
+        deferred = Job.objects.only("pk", "title").get(pk=job.pk)
+        deferred.title = "Renamed"
+        deferred.save()
+        self.assertCounts([1, 0], [0, 1])
+
+        job.delete()
+        self.assertCounts([0, 0], [0, 0])
+        self.assertEqual(reconcile_counters(), (0, 0))
+
+    def test_reconcile_command_repairs_drift(self):
+        Job.objects.create(
+            title="Counted",
+            employer=self.employers[0],
+            category=self.categories[0],
+            description="-",
+            requirements="-",
+            location="Remote",
+            salary=50000,
+            job_type="full_time",
+        )
+        Category.objects.update(job_count=5)
+        Employer.objects.filter(pk=self.employers[0].pk).update(job_count=0)
+
+        out = StringIO()
+        call_command("reconcile_job_counts", stdout=out)
+        self.assertIn("Corrected 2 categories and 1 employers.", out.getvalue())
+        self.assertCounts([1, 0], [1, 0])
+        self.assertEqual(reconcile_counters(), (0, 0))
+
+
+@override_settings(SALARY_EXCHANGE_RATES={"USD": 1, "EUR": 1.1, "GBP": 1.25})
+class FacetTests(TestCase):
+    # title: (job type, category, salary, currency, pay period, location, band)
+    JOBS = {
+        "salaried": ("full_time", "A", 50000, "USD", "fixed", "Remote", "30000-60000"),
+        "hourly": ("full_time", "B", 25, "USD", "hourly", "Berlin", "30000-60000"),
+        "weekly": ("contract", "A", 1500, "EUR", "weekly", "Remote", "60000-90000"),
+        "pounds": ("part_time", "B", 20000, "GBP", "fixed", "Remote", "0-30000"),
+        "senior": ("contract", "A", 80000, "GBP", "fixed", "Berlin", "90000+"),
+        "intern": ("internship", "B", 10, "USD", "hourly", "Remote", "0-30000"),
+        "boundary": ("full_time", "B", 60000, "USD", "fixed", "Remote", "60000-90000"),
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        user = get_user_model().objects.create(username="faceted", is_employer=True)
+        employer = Employer.objects.create(user=user, company_name="Facets")
+        cls.categories = {
+            name: Category.objects.create(name=f"Category {name}") for name in "AB"
+        }
+        for title, job in cls.JOBS.items():
+            job_type, category, amount, currency, period, location, _band = job
+            Job.objects.create(
+                title=title,
+                employer=employer,
+                category=cls.categories[category],
+                description="-",
+                requirements="-",
+                location=location,
+                salary=Money(amount, currency),
+                salary_type=period,
+                job_type=job_type,
+            )
+
+    def titles(self, jobs):
+        return set(jobs.values_list("title", flat=True))
+
+    def counts(self, result, facet):
+        return {
+            str(option["value"]): option["count"]
+            for option in result[facet]
+            if option["count"]
+        }
+
+    def test_currencies_and_pay_periods_fall_in_yearly_bands(self):
+        for key, *_ in facets.SALARY_BANDS:
+            expected = {title for title, job in self.JOBS.items() if job[-1] == key}
+            selected = facets.apply_facets(Job.objects.all(), {"salary": key})
+            self.assertEqual(self.titles(selected), expected, key)
+        for job in Job.objects.all():
+            band = facets.band_for(
+                job.salary.amount, job.salary_currency, job.salary_type
+            )
+            self.assertEqual(band, self.JOBS[job.title][-1], job.title)
+
+        groups = facets.facet_counts(Job.objects.all(), {})
+        self.assertEqual(
+            self.counts(groups, "salary"),
+            {"0-30000": 2, "30000-60000": 2, "60000-90000": 2, "90000+": 1},
+        )
+
+    def test_each_facet_ignores_its_own_selection(self):
+        a, b = self.categories["A"], self.categories["B"]
+        criteria = {"job_type": "full_time", "category": b}
+        result = facets.facet_counts(Job.objects.all(), criteria)
+
+        # in category B, whatever the job type
+        self.assertEqual(
+            self.counts(result, "job_type"),
+            {"full_time": 2, "part_time": 1, "internship": 1},
+        )
+        # full time, whatever the category
+        self.assertEqual(self.counts(result, "category"), {str(a.pk): 1, str(b.pk): 2})
+        # both selections apply to the facets without one
+        self.assertEqual(
+            self.counts(result, "salary"), {"30000-60000": 1, "60000-90000": 1}
+        )
+        self.assertEqual(
+            self.counts(result, "location"), {"Berlin, Germany": 1, "Remote": 1}
+        )
+        self.assertEqual(
+            [
+                option["value"]
+                for facet in ("job_type", "category", "salary")
+                for option in result[facet]
+                if option["selected"]
+            ],
+            ["full_time", b.pk],
+        )
+
+    def test_total_matches_the_filtered_jobs(self):
+        a = self.categories["A"]
+        for criteria in (
+            {},
+            {"job_type": "contract"},
+            {"category": a, "salary": "60000-90000"},
+            {"job_type": "full_time", "salary": "30000-60000"},
+            {"job_type": "internship", "category": a},
+        ):
+            jobs = Job.objects.all()
+            counts = facets.facet_counts(jobs, criteria)
+            expected = facets.apply_facets(jobs, criteria).count()
+            for facet in ("job_type", "category", "salary"):
+                self.assertEqual(
+                    facets.facet_total(counts, facet), expected, (criteria, facet)
+                )
+
+
+class JobImportTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = Category.objects.order_by("pk")[3]
+
+    def row(self, i, **overrides):
+        return {
+            "title": f"Imported Zookeeper {i}",
+            "category": self.category.name,
+            "description": "Feed the animals.",
+            "requirements": "Patience",
+            "location": "Berlin",
+            "salary": "52000",
+            "job_type": "full_time",
+            **overrides,
+        }
+
+    def test_command_imports_csv_and_reports_errors(self):
+        employer, category = Employer.objects.order_by("pk")[2], self.category
+        rows = [self.row(i, employer=employer.company_name.lower()) for i in range(250)]
+        rows += [
+            self.row(250, employer=employer.company_name, job_type="gig"),
+            self.row(251, employer="Nobody", category="Unknown"),
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+            file.flush()
+            stdout, stderr = StringIO(), StringIO()
+            with CaptureQueriesContext(connection) as queries:
+                call_command(
+                    "import_jobs",
+                    file.name,
+                    batch_size=100,
+                    stdout=stdout,
+                    stderr=stderr,
+                )
+
+        # Three batches of a few dozen statements each, not one per row.
+        self.assertLess(len(queries), 100)
+        self.assertIn("Imported 250 jobs; 2 rows rejected.", stdout.getvalue())
+        self.assertIn("Line 252: job_type", stderr.getvalue())
+        self.assertIn("Line 253: category: Unknown category.", stderr.getvalue())
+        self.assertIn("Line 253: employer: Unknown employer.", stderr.getvalue())
+
+        employer_count, category_count = employer.job_count, category.job_count
+        employer.refresh_from_db()
+        category.refresh_from_db()
+        self.assertEqual(employer.job_count, employer_count + 250)
+        self.assertEqual(category.job_count, category_count + 250)
+        results = get_backend().search(Job.objects.all(), "zookeeper")
+        self.assertEqual(results.count(), 250)
+
+    def test_employer_uploads_jsonl(self):
+        employer = Employer.objects.select_related("user").first()
+        lines = [json.dumps(self.row(i, salary=61000)) for i in range(3)]
+        lines.insert(1, "[1, 2]")
+        upload = SimpleUploadedFile("jobs.jsonl", "\n".join(lines).encode())
+
+        self.login(employer.user)
+        response = self.client.post(reverse("jobs:import_jobs"), {"file": upload})
+
+        self.assertContains(response, "Imported 3 jobs.")
+        self.assertContains(response, "Line 2")
+        imported = Job.objects.filter(title__startswith="Imported Zookeeper")
+        self.assertEqual(
+            set(imported.values_list("employer_id", flat=True)), {employer.pk}
+        )
+        # Ranked with zero scores, so sorted listings include them at once.
+        self.assertEqual(
+            set(
+                JobRanking.objects.filter(job__in=imported).values_list(
+                    "salary", flat=True
+                )
+            ),
+            {Decimal("61000")},
+        )
+
+
+@override_settings(TASKS_EAGER=True)
+class SkillMatchingTests(SeededTestCase):
+    skill_matches = True
+
+    def test_normalize_skills(self):
+        self.assertEqual(
+            matching.split_skills("Python, ReactJS;  Machine   Learning\nJS, python"),
+            ["python", "react", "machine learning", "javascript"],
+        )
+
+    def test_recommendations_follow_shared_skills(self):
+        seeker = JobSeeker.objects.first()
+        seeker.skills = "Go, Docker"
+        with self.captureOnCommitCallbacks(execute=True):
+            seeker.save()
+
+        # one indexed read
+        with self.assertNumQueries(1):
+            jobs = list(matching.recommended_jobs(seeker, limit=10))
+        self.assertEqual(len(jobs), 10)
+        for job in jobs:
+            self.assertTrue(
+                {"go", "docker"} & set(matching.split_skills(job.requirements))
+            )
+        self.assertEqual(
+            [job.match_score for job in jobs],
+            sorted((job.match_score for job in jobs), reverse=True),
+        )
+
+    def test_job_changes_refresh_matches_incrementally(self):
+        seeker = JobSeeker.objects.first()
+        seeker.skills = "Fortran"
+        with self.captureOnCommitCallbacks(execute=True):
+            seeker.save()
+        self.assertEqual(list(matching.recommended_jobs(seeker)), [])
+
+        job = Job.objects.filter(is_active=True).first()
+        job.requirements = "Fortran, Android"
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save()
+        self.assertEqual(list(matching.recommended_jobs(seeker)), [job])
+        self.assertIn(seeker, list(matching.top_candidates(job)))
+
+        job.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save()
+        self.assertFalse(SkillMatch.objects.filter(job=job).exists())
+
+    def test_lists_are_capped(self):
+        with patch.object(matching, "MATCHES_PER_OWNER", 5):
+            matching.rebuild()
+        per_seeker = (
+            SkillMatch.objects.filter(side="seeker")
+            .values("job_seeker")
+            .annotate(n=Count("pk"))
+            .values_list("n", flat=True)
+        )
+        self.assertEqual(max(per_seeker), 5)
+
+
+class ApplicationNotificationTests(SeededTestCase):
+    def test_employer_is_emailed_from_the_queue(self):
+        seeker = JobSeeker.objects.select_related("user").first()
+        job = Job.objects.filter(is_active=True).exclude(
+            applications__job_seeker=seeker
+        )[0]
+        self.login(seeker.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("jobs:apply_job", args=[job.pk]), {"cover_letter": "Hi"}
+            )
+        self.assertEqual(len(mail.outbox), 0)
+
+        run_pending_tasks()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [job.employer.user.email])
+        self.assertIn(job.title, mail.outbox[0].subject)
+        self.assertIn("/dashboard/employer/", mail.outbox[0].body)
+
+
+class JobAlertTests(SeededTestCase):
+    CRITERIA = [
+        {},
+        {"search": "docker"},
+        {"search": "backend develop"},
+        {"search": "aws go", "location": "berlin"},
+        {"job_type": "contract", "salary": "60000-90000"},
+        {"location": "London", "category": True, "salary": "90000+"},
+    ]
+
+    def test_index_agrees_with_the_search_form(self):
+        category = Category.objects.first()
+        seeker = JobSeeker.objects.first()
+        alerts = [
+            JobAlert.objects.create(
+                job_seeker=seeker,
+                **{
+                    **criteria,
+                    "category": category if "category" in criteria else None,
+                },
+            )
+            for criteria in self.CRITERIA
+        ]
+        index = load_index()
+        # Alerts are only matched against active jobs.
+        jobs = list(Job.objects.filter(is_active=True).order_by("pk"))
+        matched = {alert.pk: set() for alert in alerts}
+        for job in jobs:
+            for pk in index.match(job):
+                matched[pk].add(job.pk)
+
+        for alert in alerts:
+            form = JobSearchForm(alert.criteria())
+            self.assertTrue(form.is_valid(), form.errors)
+            expected = filter_jobs(
+                Job.objects.filter(pk__in=[job.pk for job in jobs]),
+                form.cleaned_data,
+            )
+            self.assertEqual(matched[alert.pk], {job.pk for job in expected}, alert)
+        # the comparison means something only if most alerts match some jobs
+        self.assertGreaterEqual(sum(bool(jobs) for jobs in matched.values()), 4)
+
+    def test_alert_form_does_not_share_the_search_form_fields(self):
+        alert_salary = JobAlertForm.base_fields["salary"]
+        self.assertIsNot(alert_salary, JobSearchForm.base_fields["salary"])
+        self.assertEqual(
+            alert_salary.choices, JobSearchForm.base_fields["salary"].choices
+        )
+
+    def test_instant_alert_is_emailed_when_a_job_is_posted(self):
+        seeker = JobSeeker.objects.select_related("user").first()
+        self.login(seeker.user)
+        response = self.client.post(
+            reverse("jobs:job_alerts"),
+            {"search": "kotlin", "frequency": "instant"},
+        )
+        self.assertRedirects(response, reverse("jobs:job_alerts"))
+        self.assertContains(self.client.get(reverse("jobs:job_alerts")), "kotlin")
+        self.assertContains(
+            self.client.get(reverse("jobs:job_list")), "Email me new jobs"
+        )
+
+        employer = Employer.objects.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            Job.objects.create(
+                title="Android Engineer",
+                employer=employer,
+                description="Mobile apps.",
+                requirements="Kotlin",
+                location="Remote",
+                salary=50000,
+                job_type="full_time",
+            )
+            Job.objects.create(
+                title="Backend Engineer",
+                employer=employer,
+                description="APIs.",
+                requirements="Go",
+                location="Remote",
+                salary=50000,
+                job_type="full_time",
+            )
+        run_pending_tasks()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [seeker.user.email])
+        self.assertIn("Android Engineer", mail.outbox[0].body)
+        self.assertNotIn("Backend Engineer", mail.outbox[0].body)
+        self.assertFalse(JobAlertMatch.objects.exists())
+
+    def test_daily_digests_are_batched_per_seeker(self):
+        seekers = list(JobSeeker.objects.all()[:3])
+        for seeker in seekers:
+            JobAlert.objects.create(job_seeker=seeker, search="react")
+            JobAlert.objects.create(job_seeker=seeker, location="Berlin")
+        rows = [
+            {
+                "title": f"React Developer {i}",
+                "category": Category.objects.first().name,
+                "description": "Frontend.",
+                "requirements": "React",
+                "location": "Berlin",
+                "salary": "40000",
+                "job_type": "full_time",
+                "employer": Employer.objects.first().company_name,
+            }
+            for i in range(3)
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            JobImporter().run(enumerate(rows, 2))
+        run_pending_tasks()
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(JobAlertMatch.objects.count(), 3 * 2 * 3)
+
+        # one query for recipients, one per batch of seekers
+        with CaptureQueriesContext(connection) as queries:
+            sent = alerts.send_digests(JobAlert.Frequency.DAILY, batch_size=2)
+        self.assertEqual(sent, 3)
+        self.assertLess(len(queries), 15)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIn("React Developer 2", mail.outbox[0].body)
+        self.assertEqual(mail.outbox[0].subject, "6 new jobs matching your alerts")
+        self.assertFalse(JobAlertMatch.objects.exists())
+        self.assertEqual(JobAlert.objects.filter(last_sent_at__isnull=False).count(), 6)
+
+
+class JobExpiryTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        # Start from a board whose inactive jobs were archived already.
+        Job.objects.filter(is_active=False).delete()
+
+    def test_expired_jobs_are_deactivated_in_bulk(self):
+        today = timezone.localdate()
+        expired_ids = list(Job.objects.order_by("pk").values_list("pk", flat=True)[:30])
+        Job.objects.filter(pk__in=expired_ids).update(deadline=today - timedelta(1))
+        Job.objects.filter(pk__in=expired_ids[:5]).update(deadline=today)
+        before = timezone.now()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(expiry.expire_jobs(batch_size=10), 25)
+
+        expired = Job.objects.filter(pk__in=expired_ids[5:])
+        self.assertFalse(expired.filter(is_active=True).exists())
+        self.assertFalse(expired.filter(updated_at__lt=before).exists())
+        self.assertEqual(
+            Job.objects.filter(pk__in=expired_ids[:5], is_active=True).count(), 5
+        )
+        self.assertEqual(reconcile_counters(), (0, 0))
+        found = get_backend().search(Job.objects.all(), "python")
+        self.assertFalse(found.filter(pk__in=expired_ids[5:]).exists())
+        self.assertEqual(expiry.expire_jobs(), 0)
+
+    def test_inactive_jobs_are_archived_with_applications(self):
+        job = Job.objects.filter(applications__isnull=False).first()
+        job.salary = Money(42000, "EUR")
+        job.is_active = False
+        job.save()
+        applications = list(job.applications.values_list("pk", "status"))
+
+        # not inactive for long enough yet
+        self.assertEqual(expiry.archive_jobs(), 0)
+        archived = expiry.archive_jobs(before=timezone.now() + timedelta(seconds=1))
+
+        self.assertEqual(archived, 1)
+        self.assertFalse(Job.objects.filter(pk=job.pk).exists())
+        copy = ArchivedJob.objects.get(pk=job.pk)
+        self.assertEqual(
+            (copy.title, copy.salary, copy.employer_id),
+            (job.title, Money(42000, "EUR"), job.employer_id),
+        )
+        self.assertEqual(
+            sorted(copy.applications.values_list("pk", "status")), sorted(applications)
+        )
+        self.assertEqual(reconcile_counters(), (0, 0))
+
+    def test_command(self):
+        Job.objects.filter(pk=Job.objects.first().pk).update(
+            deadline=timezone.localdate() - timedelta(1)
+        )
+        out = StringIO()
+        call_command("expire_jobs", "--archive-after", "0", stdout=out)
+        self.assertIn("Deactivated 1 expired jobs", out.getvalue())
+        self.assertIn("Archived 1 inactive jobs", out.getvalue())
+
+
+class JobRankingTests(SeededTestCase):
+    def listed(self, sort, **params):
+        response = self.client.get(reverse("jobs:job_list"), {"sort": sort, **params})
+        return [job.pk for job in response.context["jobs"]]
+
+    def test_recent_activity_counts_more(self):
+        today = timezone.localdate()
+        old, recent, quiet = Job.objects.filter(is_active=True)[:3]
+        analytics.record_traffic(
+            {
+                (today - timedelta(days=20), old.pk): {"views": 4000},
+                (today, recent.pk): {"views": 1000},
+                (today - timedelta(days=3), quiet.pk): {"views": 500},
+            }
+        )
+        rebuild_rankings()
+
+        # Three weeks old, the 4000 views count for about 1500 today.
+        self.assertEqual(self.listed("popular")[:3], [old.pk, recent.pk, quiet.pk])
+        # Trending only looks at the last week.
+        self.assertEqual(self.listed("trending")[:2], [recent.pk, quiet.pk])
+        # The featured jobs on the home page are the trending ones.
+        home = self.client.get(reverse("jobs:home"))
+        self.assertEqual(home.context["featured_jobs"][0], recent)
+
+    def test_most_applied_and_salary_orders(self):
+        most_applied = self.listed("most_applied", category=Category.objects.first().pk)
+        counts = [Job.objects.get(pk=pk).applications.count() for pk in most_applied]
+        self.assertEqual(counts, sorted(counts, reverse=True))
+
+        salaries = Job.objects.filter(is_active=True).annotate(
+            yearly=normalized_salary()
+        )
+        top = salaries.order_by("-yearly", "-pk").values_list("pk", flat=True)[:9]
+        self.assertEqual(self.listed("salary"), list(top))
+
+    def test_saved_jobs_are_ranked_at_once(self):
+        employer = Employer.objects.first()
+        job = Job.objects.create(
+            title="Best Paid Role",
+            employer=employer,
+            description="-",
+            requirements="-",
+            location="Remote",
+            salary=Money(10_000_000, "USD"),
+            job_type="full_time",
+        )
+        self.assertEqual(self.listed("salary")[0], job.pk)
+
+        job.is_active = False
+        job.save()
+        self.assertNotIn(job.pk, self.listed("salary"))
+        rebuild_rankings()
+        self.assertFalse(JobRanking.objects.filter(job=job).exists())
+
+    def test_saving_with_the_salary_deferred(self):
+        job = Job.objects.filter(is_active=True).first()
+        salary = JobRanking.objects.get(job=job).salary
+        deferred = Job.objects.only("pk", "title").get(pk=job.pk)
+        deferred.title = "Renamed"
+        deferred.save()
+        self.assertEqual(JobRanking.objects.get(job=job).salary, salary)
+
+    def walk(self, params):
+        """Every page of a listing, forward then back; returns the job ids."""
+        url = reverse("jobs:job_list")
+        pages = [self.client.get(url, params).context["jobs"]]
+        while pages[-1].next_cursor:
+            cursor = pages[-1].next_cursor
+            pages.append(
+                self.client.get(url, {**params, "cursor": cursor}).context["jobs"]
+            )
+        back = [pages[-1]]
+        while back[-1].previous_cursor:
+            cursor = back[-1].previous_cursor
+            back.append(
+                self.client.get(url, {**params, "cursor": cursor}).context["jobs"]
+            )
+        forward = [[job.pk for job in page] for page in pages]
+        self.assertEqual([[job.pk for job in page] for page in back[::-1]], forward)
+        return [pk for page in forward for pk in page]
+
+    def test_unranked_jobs_follow_the_ranked_ones(self):
+        category = Category.objects.create(name="Contracting")
+        employer = Employer.objects.first()
+        for i in range(30):
+            Job.objects.create(
+                title=f"Contractor {i}",
+                employer=employer,
+                category=category,
+                description="-",
+                requirements="-",
+                location="Remote",
+                # repeated salaries, so ties are broken by id
+                salary=Money(40_000 + 1000 * (i % 7), "USD"),
+                job_type="contract",
+            )
+        params = {"sort": "salary", "category": category.pk}
+        jobs = Job.objects.filter(category=category)
+        JobRanking.objects.filter(
+            job__in=jobs.order_by("pk").values("pk")[:12]
+        ).delete()
+        expected = list(sort_jobs(jobs, "salary").values_list("pk", flat=True))
+        expected += (
+            jobs.filter(ranking__isnull=True)
+            .order_by("-pk")
+            .values_list("pk", flat=True)
+        )
+        self.assertEqual(len(expected), 30)
+        self.assertEqual(self.walk(params), expected)
+        response = self.client.get(reverse("jobs:job_list"), params)
+        self.assertEqual(response.context["total_jobs"], len(expected))
+
+    def test_listings_show_jobs_before_the_first_rebuild(self):
+        JobRanking.objects.all().delete()
+        params = {"sort": "trending", "category": Category.objects.first().pk}
+        newest = Job.objects.filter(is_active=True, category=params["category"])
+        self.assertEqual(
+            self.walk(params), list(newest.order_by("-pk").values_list("pk", flat=True))
+        )
+
+    def test_malformed_sort_cursor_starts_over(self):
+        first = self.listed("popular")
+        for cursor in ("bogus", "bmV4dHxuYW58MQ", "bmV4dHwxMnx4"):
+            self.assertEqual(self.listed("popular", cursor=cursor), first, cursor)
+
+
+class QueryIndexTests(QueryBudgetTestCase):
+    def test_hot_queries_use_indexes(self):
+        out = StringIO()
+        call_command("explain_queries", "--repeat", "1", "--fail-on-scan", stdout=out)
+        self.assertIn("job_list: 2 queries", out.getvalue())
+        self.assertNotIn("full scan", out.getvalue())
+
+
+def benchmark_tables(runners, **options):
+    """Run the benchmark command; returns ``{runner: {page: row}}``."""
+    out = StringIO()
+    call_command(
+        "benchmark",
+        runner=runners,
+        requests=2,
+        warmup=0,
+        filter=["jobs:", "dashboard:jobseeker"],
+        stdout=out,
+        **options,
+    )
+    tables = {runners[0]: {}}
+    table = tables[runners[0]]
+    for line in out.getvalue().splitlines():
+        row = line.split()
+        if len(row) == 1 or row[0] == "req/s":
+            table = tables.setdefault(row[0], {})
+        elif ":" in row[0]:
+            table[row[0]] = row
+    return tables
+
+
+class SeedAndBenchmarkTests(TestCase):
+    def seed(self, **options):
+        call_command(
+            "seed",
+            employers=3,
+            seekers=10,
+            jobs=60,
+            applications=40,
+            stdout=StringIO(),
+            **options,
+        )
+
+    def test_seed_is_deterministic_and_consistent(self):
+        self.seed(seed=7)
+        jobs = Job.objects.filter(employer__user__username__startswith="seed7-")
+        self.assertEqual(jobs.count(), 60)
+        self.assertEqual(
+            Application.objects.filter(job_seeker__user__username__startswith="seed7-")
+            .values("job", "job_seeker")
+            .distinct()
+            .count(),
+            40,
+        )
+        self.assertFalse(
+            Application.objects.filter(applied_date__lt=F("job__posted_date")).exists()
+        )
+        self.assertTrue(jobs.filter(posted_date__lt=timezone.now() - timedelta(days=7)))
+        employer = Employer.objects.get(user__username="seed7-employer0")
+        self.assertEqual(
+            employer.job_count, employer.jobs.filter(is_active=True).count()
+        )
+        self.assertTrue(self.client.login(username="seed7-seeker0", password=PASSWORD))
+        titles = list(jobs.order_by("pk").values_list("title", "location"))
+
+        with self.assertRaises(CommandError):
+            self.seed(seed=7)
+        get_user_model().objects.filter(username__startswith="seed7-").delete()
+        self.seed(seed=7)
+        self.assertEqual(
+            titles, list(jobs.order_by("pk").values_list("title", "location"))
+        )
+
+    def test_benchmark_requests_every_page(self):
+        self.seed()
+        tables = benchmark_tables(["client", "wsgi"])
+        self.assertEqual(list(tables), ["client", "wsgi", "req/s"])
+        for runner in ("client", "wsgi"):
+            pages = tables[runner]
+            self.assertIn("jobs:company_detail", pages)
+            self.assertEqual(pages["jobs:job_list"][1], "200")
+            self.assertEqual(pages["dashboard:jobseeker_dashboard"][1], "200")
+        self.assertTrue(tables["req/s"]["jobs:home"][2].endswith("x"))
+
+
+class ASGIBenchmarkTests(TransactionTestCase):
+    # The ASGI handler runs each request's queries on a thread of its own,
+    # which can't see the data of a test wrapped in a transaction.
+    def test_asgi_runner(self):
+        call_command(
+            "seed",
+            employers=3,
+            seekers=10,
+            jobs=60,
+            applications=40,
+            stdout=StringIO(),
+        )
+        pages = benchmark_tables(["asgi"], concurrency=2)["asgi"]
+        for name in ("jobs:home", "jobs:job_list", "jobs:job_detail"):
+            self.assertEqual(pages[name][1], "200")
+        self.assertEqual(pages["dashboard:jobseeker_dashboard"][1], "200")
+        self.assertEqual(pages["jobs:job_list"][-1], "2.0")
@@ -7,8 +7,11 @@ urlpatterns = [
     path('', views.home, name='home'),
     path('jobs/', views.job_list, name='job_list'),
     path('jobs/post/', views.post_job, name='post_job'),
+    path('jobs/import/', views.import_jobs, name='import_jobs'),
     path('jobs/<int:job_id>/', views.job_detail, name='job_detail'),
     path('jobs/<int:job_id>/apply/', views.apply_job, name='apply_job'),
+    path('jobs/alerts/', views.job_alerts, name='job_alerts'),
+    path('jobs/alerts/<int:pk>/delete/', views.delete_job_alert, name='delete_job_alert'),
     path('categories/', views.categories, name='categories'),
     path('companies/', views.companies, name='companies'),
     path('companies/<int:pk>/', views.company_detail, name='company_detail'),
@@ -1,22 +1,77 @@
+import csv
+import io
+
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db.models import Q
-from .models import Job, Application, Category
-from .forms import JobForm, JobApplicationForm, JobSearchForm, JobPostForm
+from django.conf import settings
+from .models import Job, JobAlert, Application, Category
+from .forms import (
+    JobForm,
+    JobAlertForm,
+    JobApplicationForm,
+    JobImportForm,
+    JobSearchForm,
+    JobPostForm,
+)
+from .importer import JobImporter, guess_format, read_rows
+from .facets import apply_facets, facet_counts, facet_total
+from . import ranking
+from .ranking import sort_jobs
+from .cache import cache_public_page, conditional_public_page
+from .pagination import capped_paginator
+from .search import get_backend
+from .tasks import notify_new_application
 from django.shortcuts import render
 from .models import Category
 from apps.accounts.models import Employer
+from apps.dashboard import tracking
+from apps.locations import gazetteer
+
+
+def filter_jobs(jobs, criteria, facets=True):
+    """
+    Apply cleaned ``JobSearchForm`` criteria to a ``Job`` queryset.
+
+    With ``facets=False`` only the free-text criteria are applied, which is
+    the base set ``facet_counts`` needs.
+    """
+    search = criteria.get("search")
+    location = criteria.get("location")
+    radius = criteria.get("radius")
+
+    if location:
+        # Matched by place (or the places nearby) through the place indexes;
+        # text naming no known place by substring.
+        place = gazetteer.resolve(location)
+        if place is None:
+            jobs = jobs.filter(location__icontains=location)
+        elif radius:
+            jobs = jobs.filter(place__in=gazetteer.within(place, radius))
+        else:
+            jobs = jobs.filter(place=place)
+    if search:
+        jobs = get_backend().search(jobs, search)
+    if facets:
+        jobs = apply_facets(jobs, criteria)
+    return jobs
 
 
+@conditional_public_page("jobs", "employers")
+@cache_public_page("jobs", "employers")
 def companies(request):
     companies = Employer.objects.all()
     return render(request, "jobs/companies.html", {"companies": companies})
 
 
+@conditional_public_page("jobs", "categories", "employers", "rankings")
+@cache_public_page("jobs", "categories", "employers", "rankings")
 def home(request):
-    featured_jobs = Job.objects.filter(is_active=True)[:6]
+    featured_jobs = sort_jobs(
+        Job.objects.filter(is_active=True).select_related("employer"), "trending"
+    )[:6]
     categories = Category.objects.all()
     context = {
         "featured_jobs": featured_jobs,
@@ -25,42 +80,63 @@ def home(request):
     return render(request, "jobs/home.html", context)
 
 
+@conditional_public_page(
+    "jobs", "categories", "employers", "rankings", revalidated=tracking.replay
+)
 def job_list(request):
     form = JobSearchForm(request.GET)
-    jobs = Job.objects.filter(is_active=True)
-    print(jobs, "jobs")
-
-    if form.is_valid():
-        search = form.cleaned_data.get("search")
-        location = form.cleaned_data.get("location")
-        category = form.cleaned_data.get("category")
-        job_type = form.cleaned_data.get("job_type")
-
-        if search:
-            jobs = jobs.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
-        if location:
-            jobs = jobs.filter(location__icontains=location)
-        if category:
-            jobs = jobs.filter(category=category)
-        if job_type:
-            jobs = jobs.filter(job_type=job_type)
+    jobs = Job.objects.filter(is_active=True).select_related("employer")
+
+    criteria = form.cleaned_data if form.is_valid() else {}
+    jobs = filter_jobs(jobs, criteria, facets=False)
+    facets = facet_counts(jobs, criteria)
+    jobs = apply_facets(jobs, criteria)
+
+    # Listings page by cursor, keyed on posted_date or the sort's ranking
+    # score; search results in relevance order can't be, so they keep a
+    # capped number of numbered pages.
+    sort = criteria.get("sort", "")
+    cursor_pagination = not criteria.get("search") or bool(sort)
+    if cursor_pagination:
+        paginator = ranking.paginator(jobs, sort, 9, total=facet_total(facets))
+        jobs = paginator.get_page(request.GET.get("cursor"))
+    else:
+        paginator = capped_paginator(jobs, 9, facet_total(facets))
+        page = request.GET.get("page")
+        jobs = paginator.get_page(page)
 
-    paginator = Paginator(jobs, 9)  # 9 jobs per page
-    page = request.GET.get("page")
-    jobs = paginator.get_page(page)
+    shown = [job.pk for job in jobs]
+    tracking.record(request, "impressions", shown)
 
     context = {
         "jobs": jobs,
         "form": form,
+        "facets": facets,
+        "total_jobs": facet_total(facets),
+        "cursor_pagination": cursor_pagination,
     }
 
-    return render(request, "jobs/job_list.html", context)
+    response = render(request, "jobs/job_list.html", context)
+    response.revalidation_data = {"impressions": shown}
+    return response
 
 
+def job_last_modified(request, job_id):
+    return (
+        Job.objects.filter(id=job_id, is_active=True)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+
+
+@conditional_public_page(
+    "employers", last_modified=job_last_modified, revalidated=tracking.replay
+)
 def job_detail(request, job_id):
-    job = get_object_or_404(Job, id=job_id, is_active=True)
+    job = get_object_or_404(
+        Job.objects.select_related("employer"), id=job_id, is_active=True
+    )
+    tracking.record(request, "views", [job.pk])
     application_form = JobApplicationForm() if request.user.is_authenticated else None
     has_applied = False
 
@@ -74,7 +150,9 @@ def job_detail(request, job_id):
         "application_form": application_form,
         "has_applied": has_applied,
     }
-    return render(request, "jobs/job_detail.html", context)
+    response = render(request, "jobs/job_detail.html", context)
+    response.revalidation_data = {"views": [job.pk]}
+    return response
 
 
 @login_required
@@ -88,8 +166,6 @@ def post_job(request):
 
     if request.method == "POST":
         form = JobPostForm(request.POST)
-        print(form, "form")
-        print(request.POST, "request.POST")
 
         if form.is_valid():
             job = form.save(commit=False)
@@ -106,6 +182,46 @@ def post_job(request):
     return render(request, "jobs/post_job.html", {"form": form})
 
 
+@login_required
+def import_jobs(request):
+    employer = getattr(request.user, "employer", None)
+    if employer is None and not request.user.is_staff:
+        messages.error(
+            request,
+            "You need an employer account to post jobs. Switch to an employer profile first.",
+        )
+        return redirect("accounts:employer_signup")
+
+    result = None
+    if request.method == "POST":
+        form = JobImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            upload = form.cleaned_data["file"]
+            # Staff without an employer profile name the employer in each row.
+            importer = JobImporter(employer=employer)
+            stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+            try:
+                result = importer.run(read_rows(stream, guess_format(upload.name)))
+            except (UnicodeDecodeError, csv.Error):
+                messages.error(request, "The file could not be read as UTF-8 text.")
+            else:
+                if result.created:
+                    messages.success(request, f"Imported {result.created} jobs.")
+                if result.errors:
+                    messages.error(
+                        request, f"{len(result.errors)} rows were rejected."
+                    )
+    else:
+        form = JobImportForm()
+
+    context = {
+        "form": form,
+        "result": result,
+        "errors": result.errors[:100] if result else [],
+    }
+    return render(request, "jobs/import_jobs.html", context)
+
+
 @login_required
 def apply_job(request, job_id):
     if not request.user.is_job_seeker:
@@ -125,6 +241,10 @@ def apply_job(request, job_id):
             application.job = job
             application.job_seeker = request.user.jobseeker
             application.save()
+            notify_new_application.delay(
+                application.pk,
+                request.build_absolute_uri(reverse("dashboard:employer_dashboard")),
+            )
             messages.success(request, "Application submitted successfully!")
             return redirect("dashboard:jobseeker_dashboard")
 
@@ -136,21 +256,7 @@ def search_jobs(request):
     jobs = Job.objects.filter(is_active=True)
 
     if form.is_valid():
-        search = form.cleaned_data.get("search")
-        location = form.cleaned_data.get("location")
-        category = form.cleaned_data.get("category")
-        job_type = form.cleaned_data.get("job_type")
-
-        if search:
-            jobs = jobs.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
-        if location:
-            jobs = jobs.filter(location__icontains=location)
-        if category:
-            jobs = jobs.filter(category=category)
-        if job_type:
-            jobs = jobs.filter(job_type=job_type)
+        jobs = filter_jobs(jobs, form.cleaned_data)
 
     paginator = Paginator(jobs, 9)  # 9 jobs per page
     page = request.GET.get("page")
@@ -163,6 +269,43 @@ def search_jobs(request):
     return render(request, "jobs/search_results.html", context)
 
 
+@login_required
+def job_alerts(request):
+    if not request.user.is_job_seeker:
+        messages.error(request, "Access denied. Job seeker account required.")
+        return redirect("jobs:home")
+
+    job_seeker = request.user.jobseeker
+    alerts = job_seeker.job_alerts.select_related("category")
+    if request.method == "POST":
+        form = JobAlertForm(request.POST)
+        if len(alerts) >= settings.JOB_ALERT_LIMIT:
+            messages.error(
+                request, f"You can keep up to {settings.JOB_ALERT_LIMIT} job alerts."
+            )
+        elif form.is_valid():
+            alert = form.save(commit=False)
+            alert.job_seeker = job_seeker
+            alert.save()
+            messages.success(request, "Job alert saved.")
+            return redirect("jobs:job_alerts")
+    else:
+        form = JobAlertForm()
+
+    return render(request, "jobs/job_alerts.html", {"form": form, "alerts": alerts})
+
+
+@login_required
+def delete_job_alert(request, pk):
+    if request.method == "POST":
+        alert = get_object_or_404(JobAlert, pk=pk, job_seeker__user=request.user)
+        alert.delete()
+        messages.success(request, "Job alert deleted.")
+    return redirect("jobs:job_alerts")
+
+
+@conditional_public_page("jobs", "categories")
+@cache_public_page("jobs", "categories")
 def categories(request):
     categories = Category.objects.all()
     context = {
@@ -171,12 +314,15 @@ def categories(request):
     return render(request, "jobs/categories.html", context)
 
 
+@conditional_public_page("jobs", "employers")
+@cache_public_page("jobs", "employers")
 def company_detail(request, pk):
-    company = get_object_or_404(Employer, pk=pk)
+    company = get_object_or_404(Employer.objects.select_related("user"), pk=pk)
     active_jobs = Job.objects.filter(employer=company, is_active=True)
 
     context = {
         "company": company,
         "active_jobs": active_jobs,
+        "job_count": company.job_count,
     }
     return render(request, "jobs/company_detail.html", context)
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import Place
+
+
+@admin.register(Place)
+class PlaceAdmin(admin.ModelAdmin):
+    list_display = ("label", "country", "latitude", "longitude", "population")
+    list_filter = ("country",)
+    search_fields = ("name", "label")
@@ -0,0 +1,230 @@
+"""
+Canonical places for the free-text locations of jobs and employers, from
+the gazetteer bundled in ``data/``; no geocoding service is called.
+
+``resolve`` maps text such as "NYC", "New York" or "Brooklyn, NY 11201" to
+the id of a ``Place``, and text naming no known city ("Remote", "Texas") to
+``None``. Words after the city's name and comma-separated parts must name
+its region or country, so "Paris, TX" is not Paris, France; when several
+places fit, the most populous wins. Saved jobs and employers get their
+``place`` from a ``pre_save`` signal; rows written in bulk need
+``link_places`` (``manage.py load_places``).
+
+``within`` answers radius searches from a grid of one-degree cells over the
+places, so a search measures the places in the cells its circle overlaps
+rather than every place, and the jobs are then read through the index on
+their place. The gazetteer and its grid are loaded once per process.
+"""
+
+import math
+import re
+import unicodedata
+from collections import defaultdict, namedtuple
+from functools import cache
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# Countries whose places are labelled with a region code, as "Austin, TX".
+REGION_LABELS = {"US", "CA", "AU"}
+
+# Words about the kind of work rather than where it is.
+IGNORED_WORDS = {"remote", "hybrid", "onsite"}
+
+Entry = namedtuple(
+    "Entry", "id name region country latitude longitude population label"
+)
+
+
+def fold(text):
+    """Lower case without accents or punctuation: "St. Louis" -> "st louis"."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = re.sub(r"[.'’]", "", text.casefold())
+    return " ".join(re.sub(r"[\W_]+", " ", text).split())
+
+
+def _rows(name):
+    with open(DATA_DIR / name, encoding="utf-8") as file:
+        for line in file:
+            if line.strip() and not line.startswith("#"):
+                yield line.rstrip("\n").split("\t")
+
+
+def distance_km(a, b):
+    """Great-circle distance between two entries."""
+    lat1, lng1, lat2, lng2 = map(
+        math.radians, (a.latitude, a.longitude, b.latitude, b.longitude)
+    )
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(h, 1.0)))
+
+
+class Gazetteer:
+    def __init__(self, places, areas):
+        area_names = defaultdict(list)
+        for country, region, names in areas:
+            area_names[country, region] = names.split("|")
+
+        self.places = {}
+        # Folded name or alias -> ids of the places going by it.
+        self.names = defaultdict(list)
+        # Id -> folded names of its region and country, accepted as qualifiers.
+        self.qualifiers = {}
+        # (floor(latitude), floor(longitude)) -> ids of the places in that cell.
+        self.cells = defaultdict(list)
+        for pk, name, region, country, lat, lng, population, aliases in places:
+            country_name = area_names[country, ""][0]
+            if country in REGION_LABELS:
+                label = f"{name}, {region}"
+            elif name == country_name:
+                label = name
+            else:
+                label = f"{name}, {country_name}"
+            entry = Entry(
+                int(pk),
+                name,
+                region,
+                country,
+                float(lat),
+                float(lng),
+                int(population),
+                label,
+            )
+            self.places[entry.id] = entry
+            for alias in {fold(alias) for alias in [name, *aliases.split("|")]}:
+                if alias:
+                    self.names[alias].append(entry.id)
+            self.qualifiers[entry.id] = {
+                fold(area)
+                for key in ((country, ""), (country, region))
+                for area in area_names.get(key, ())
+            }
+            self.cells[self._cell(entry.latitude, entry.longitude)].append(entry.id)
+
+    @staticmethod
+    def _cell(latitude, longitude):
+        return math.floor(latitude), math.floor(longitude)
+
+    def resolve(self, text):
+        """The id of the place ``text`` names, or ``None``."""
+        text = re.sub(r"\([^)]*\)", " ", text or "")
+        parts = []
+        for part in re.split(r"[,;/|]|\s-\s", text):
+            # Postcodes and words like "remote" say nothing about the city.
+            words = [
+                word
+                for word in fold(part).split()
+                if word not in IGNORED_WORDS and not any(c.isdigit() for c in word)
+            ]
+            if words:
+                parts.append(words)
+        if not parts:
+            return None
+
+        words, qualifiers = parts[0], [" ".join(part) for part in parts[1:]]
+        # Longest name first: "new york ny" -> "new york" qualified by "ny".
+        for cut in range(len(words), 0, -1):
+            candidates = self.names.get(" ".join(words[:cut]))
+            if not candidates:
+                continue
+            rest = qualifiers + ([" ".join(words[cut:])] if words[cut:] else [])
+            matching = [
+                pk
+                for pk in candidates
+                if all(self._qualifies(pk, qualifier) for qualifier in rest)
+            ]
+            if matching:
+                return max(matching, key=lambda pk: self.places[pk].population)
+        return None
+
+    def _qualifies(self, pk, qualifier):
+        known = self.qualifiers[pk]
+        return qualifier in known or all(word in known for word in qualifier.split())
+
+    def within(self, pk, km):
+        """Ids of the places at most ``km`` from place ``pk``, itself included."""
+        origin = self.places[pk]
+        lat_span = km / KM_PER_DEGREE
+        rows = range(
+            max(math.floor(origin.latitude - lat_span), -90),
+            min(math.floor(origin.latitude + lat_span), 89) + 1,
+        )
+        # Degrees of longitude shrink towards the poles: widen the search for
+        # the highest latitude the circle reaches.
+        top = min(abs(origin.latitude) + lat_span, 90.0)
+        cos_top = math.cos(math.radians(top))
+        if cos_top < 1e-6 or lat_span / cos_top >= 180:
+            columns = range(-180, 180)
+        else:
+            lng_span = lat_span / cos_top
+            columns = {
+                (column + 180) % 360 - 180
+                for column in range(
+                    math.floor(origin.longitude - lng_span),
+                    math.floor(origin.longitude + lng_span) + 1,
+                )
+            }
+        return {
+            candidate
+            for row in rows
+            for column in columns
+            for candidate in self.cells.get((row, column), ())
+            if distance_km(origin, self.places[candidate]) <= km
+        }
+
+
+@cache
+def gazetteer():
+    return Gazetteer(_rows("places.tsv"), _rows("areas.tsv"))
+
+
+def resolve(text):
+    return gazetteer().resolve(text)
+
+
+def within(pk, km):
+    return gazetteer().within(pk, km)
+
+
+def label(pk):
+    return gazetteer().places[pk].label
+
+
+def sync_places(model=None):
+    """Make the ``Place`` table match the bundled gazetteer."""
+    if model is None:
+        from .models import Place as model
+
+    places = gazetteer().places
+    model.objects.exclude(pk__in=places).delete()
+    model.objects.bulk_create(
+        [model(**entry._asdict()) for entry in places.values()],
+        update_conflicts=True,
+        unique_fields=["id"],
+        update_fields=[field for field in Entry._fields if field != "id"],
+    )
+    return len(places)
+
+
+def link_places(queryset):
+    """
+    Point every row of ``queryset`` (jobs or employers) at the place its
+    ``location`` resolves to: one UPDATE per distinct location that changes.
+    Returns the number of rows updated.
+    """
+    updated = 0
+    pairs = queryset.order_by().values_list("location", "place_id").distinct()
+    for location, place_id in list(pairs):
+        resolved = resolve(location)
+        if resolved != place_id:
+            updated += queryset.filter(location=location, place_id=place_id).update(
+                place_id=resolved
+            )
+    return updated
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from apps.accounts.models import Employer
+from apps.jobs.cache import invalidate
+from apps.jobs.models import Job
+from apps.locations.gazetteer import link_places, sync_places
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the bundled gazetteer into the Place table and point every job "
+        "and employer at the place its location names. Run it after editing "
+        "the gazetteer or inserting rows in bulk."
+    )
+
+    def handle(self, *args, **options):
+        places = sync_places()
+        jobs = link_places(Job.objects.all())
+        employers = link_places(Employer.objects.all())
+        if jobs:
+            invalidate("jobs")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Loaded {places} places; relinked {jobs} jobs and "
+                f"{employers} employers."
+            )
+        )
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Place",
+            fields=[
+                ("id", models.PositiveIntegerField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=100)),
+                ("region", models.CharField(blank=True, max_length=10)),
+                ("country", models.CharField(max_length=2)),
+                ("latitude", models.FloatField()),
+                ("longitude", models.FloatField()),
+                ("population", models.PositiveIntegerField(default=0)),
+                ("label", models.CharField(max_length=150)),
+            ],
+            options={
+                "ordering": ["label"],
+            },
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:42
+
+from pathlib import Path
+
+from django.db import migrations
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Countries whose places are labelled with a region code, as "Austin, TX".
+REGION_LABELS = {"US", "CA", "AU"}
+
+
+def rows(name):
+    with open(DATA_DIR / name, encoding="utf-8") as file:
+        for line in file:
+            if line.strip() and not line.startswith("#"):
+                yield line.rstrip("\n").split("\t")
+
+
+def load_places(apps, schema_editor):
+    # A copy of ``gazetteer.sync_places`` as of this migration, so later
+    # changes to the gazetteer code can't change what it loads.
+    Place = apps.get_model("locations", "Place")
+    countries = {
+        country: names.split("|")[0]
+        for country, region, names in rows("areas.tsv")
+        if not region
+    }
+    places = []
+    for pk, name, region, country, lat, lng, population, _aliases in rows("places.tsv"):
+        if country in REGION_LABELS:
+            label = f"{name}, {region}"
+        elif name == countries[country]:
+            label = name
+        else:
+            label = f"{name}, {countries[country]}"
+        places.append(
+            Place(
+                id=int(pk),
+                name=name,
+                region=region,
+                country=country,
+                latitude=float(lat),
+                longitude=float(lng),
+                population=int(population),
+                label=label,
+            )
+        )
+    Place.objects.bulk_create(places)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(load_places, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class Place(models.Model):
+    """
+    A city of the bundled gazetteer (``apps.locations.gazetteer``), kept in
+    sync by ``manage.py load_places``. Ids come from the gazetteer file.
+    """
+
+    id = models.PositiveIntegerField(primary_key=True)
+    name = models.CharField(max_length=100)
+    region = models.CharField(max_length=10, blank=True)
+    country = models.CharField(max_length=2)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    population = models.PositiveIntegerField(default=0)
+    label = models.CharField(max_length=150)
+
+    class Meta:
+        ordering = ["label"]
+
+    def __str__(self):
+        return self.label
@@ -0,0 +1,13 @@
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from apps.accounts.models import Employer
+from apps.jobs.models import Job
+
+from .gazetteer import resolve
+
+
+@receiver(pre_save, sender=Job)
+@receiver(pre_save, sender=Employer)
+def resolve_place(sender, instance, **kwargs):
+    instance.place_id = resolve(instance.location)
@@ -0,0 +1,206 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from apps.accounts.models import Employer
+from apps.jobs.alerts import AlertIndex
+from apps.jobs.importer import JobImporter
+from apps.jobs.models import Category, Job
+from core.testing import QueryBudgetTestCase, SeededTestCase
+
+from .gazetteer import distance_km, gazetteer, label, resolve, within
+from .models import Place
+
+
+class GazetteerTests(SimpleTestCase):
+    def test_spellings_of_one_city_resolve_to_one_place(self):
+        new_york = resolve("New York, NY")
+        self.assertIsNotNone(new_york)
+        for text in (
+            "NYC",
+            "New York",
+            "new york city",
+            "New York NY",
+            "Brooklyn",
+            "Manhattan, NY 10001",
+            "New York, New York, USA",
+            "NYC (Hybrid)",
+        ):
+            self.assertEqual(resolve(text), new_york, text)
+        self.assertEqual(resolve("Zürich"), resolve("Zurich, Switzerland"))
+        self.assertEqual(resolve("St Louis"), resolve("Saint Louis, MO"))
+
+    def test_qualifiers_must_agree(self):
+        self.assertEqual(label(resolve("Paris")), "Paris, France")
+        self.assertIsNone(resolve("Paris, TX"))
+        self.assertEqual(label(resolve("Cambridge, MA")), "Cambridge, MA")
+        # the most populous of the places sharing a name
+        self.assertEqual(label(resolve("Cambridge")), "Cambridge, United Kingdom")
+        self.assertEqual(label(resolve("Perth WA")), "Perth, WA")
+
+    def test_text_naming_no_city(self):
+        for text in ("", "Remote", "Texas", "Germany", "Anywhere"):
+            self.assertIsNone(resolve(text), text)
+
+    def test_labels_resolve_to_their_place(self):
+        for pk in gazetteer().places:
+            self.assertEqual(resolve(label(pk)), pk)
+
+    def test_within_agrees_with_measuring_every_place(self):
+        places = gazetteer().places
+        for text in ("NYC", "Reykjavik", "Auckland", "Singapore", "Honolulu"):
+            origin = places[resolve(text)]
+            for km in (10, 50, 100, 1000, 5000):
+                expected = {
+                    pk
+                    for pk, place in places.items()
+                    if distance_km(origin, place) <= km
+                }
+                self.assertEqual(within(origin.id, km), expected, (text, km))
+
+    def test_within_50_km_of_new_york(self):
+        nearby = {label(pk) for pk in within(resolve("NYC"), 50)}
+        self.assertEqual(
+            nearby, {"New York, NY", "Newark, NJ", "Jersey City, NJ", "Hoboken, NJ"}
+        )
+
+
+class PlaceLinkingTests(SeededTestCase):
+    def make_job(self, location, **fields):
+        return Job.objects.create(
+            title="Staff Engineer",
+            employer=Employer.objects.first(),
+            category=Category.objects.first(),
+            description="Platform work.",
+            requirements="Go",
+            location=location,
+            salary=100000,
+            job_type="full_time",
+            **fields,
+        )
+
+    def test_seeded_rows_are_linked(self):
+        self.assertEqual(Place.objects.count(), len(gazetteer().places))
+        self.assertFalse(
+            Job.objects.filter(location="New York, NY", place__isnull=True).exists()
+        )
+        self.assertFalse(
+            Job.objects.filter(location="Remote", place__isnull=False).exists()
+        )
+
+    def test_saving_resolves_the_place(self):
+        job = self.make_job("Brooklyn, NY")
+        self.assertEqual(job.place_id, resolve("NYC"))
+        job.location = "Remote"
+        job.save()
+        self.assertIsNone(job.place_id)
+        employer = Employer.objects.first()
+        employer.location = "Berlin"
+        employer.save()
+        self.assertEqual(employer.place.label, "Berlin, Germany")
+
+    def test_imported_jobs_get_their_place(self):
+        employer = Employer.objects.first()
+        result = JobImporter(employer=employer).run(
+            [
+                (
+                    1,
+                    {
+                        "title": "Importer",
+                        "description": "Imported.",
+                        "requirements": "SQL",
+                        "location": "Jersey City, NJ",
+                        "salary": "50000",
+                        "job_type": "full_time",
+                        "category": Category.objects.first().name,
+                    },
+                )
+            ]
+        )
+        self.assertEqual(result.created, 1)
+        job = Job.objects.get(title="Importer")
+        self.assertEqual(job.place.label, "Jersey City, NJ")
+
+    def test_load_places_relinks_rows_written_in_bulk(self):
+        Job.objects.filter(location="London, UK").update(place=None)
+        call_command("load_places", stdout=StringIO())
+        self.assertFalse(
+            Job.objects.filter(location="London, UK", place__isnull=True).exists()
+        )
+
+
+class LocationSearchTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        Job.objects.filter(location="London, UK").update(
+            location="Newark, NJ", place=resolve("Newark, NJ")
+        )
+
+    def listed(self, **params):
+        response = self.client.get(reverse("jobs:job_list"), params)
+        return response.context["total_jobs"], response.context["facets"]["location"]
+
+    def test_spellings_find_the_same_jobs(self):
+        expected = Job.objects.filter(is_active=True, location="New York, NY").count()
+        for text in ("New York", "NYC", "new york, ny", "Manhattan"):
+            total, _facets = self.listed(location=text)
+            self.assertEqual(total, expected, text)
+
+    def test_radius_includes_nearby_places(self):
+        new_york = Job.objects.filter(is_active=True, location="New York, NY").count()
+        newark = Job.objects.filter(is_active=True, location="Newark, NJ").count()
+        self.assertEqual(self.listed(location="NYC", radius=10)[0], new_york)
+        total, facets = self.listed(location="NYC", radius=50)
+        self.assertEqual(total, new_york + newark)
+        self.assertEqual(
+            {option["label"]: option["count"] for option in facets},
+            {"New York, NY": new_york, "Newark, NJ": newark},
+        )
+        self.assertEqual(
+            [option["label"] for option in facets if option["selected"]],
+            ["New York, NY"],
+        )
+
+    def test_unknown_text_matches_by_substring(self):
+        remote = Job.objects.filter(is_active=True, location="Remote").count()
+        self.assertEqual(self.listed(location="remote", radius=50)[0], remote)
+
+    def test_alerts_match_by_place(self):
+        index = AlertIndex(
+            [
+                {
+                    "pk": 1,
+                    "search": "",
+                    "location": "NYC",
+                    "category_id": None,
+                    "job_type": "",
+                    "salary": "",
+                },
+                {
+                    "pk": 2,
+                    "search": "",
+                    "location": "remote",
+                    "category_id": None,
+                    "job_type": "",
+                    "salary": "",
+                },
+            ]
+        )
+        for location, expected in (
+            ("New York, NY", {1}),
+            ("Newark, NJ", set()),
+            ("Remote", {2}),
+        ):
+            job = Job.objects.filter(location=location).first()
+            self.assertEqual(index.match(job), expected, location)
+
+
+class LocationQueryBudgetTests(QueryBudgetTestCase):
+    def test_location_search(self):
+        # facet groups, page of jobs with employers
+        self.assertQueryBudget(f"{reverse('jobs:job_list')}?location=NYC", 2)
+        self.assertQueryBudget(
+            f"{reverse('jobs:job_list')}?location=NYC&radius=100&sort=popular", 3
+        )
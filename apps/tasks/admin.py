@@ -0,0 +1,16 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ("name", "status", "attempts", "run_at", "created_at")
+    list_filter = ("status", "name")
+    readonly_fields = ("created_at",)
+    actions = ["retry"]
+
+    @admin.action(description="Retry now")
+    def retry(self, request, queryset):
+        queryset.update(status=Task.Status.QUEUED, attempts=0, run_at=timezone.now())
@@ -0,0 +1,44 @@
+import signal
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from apps.tasks.queue import Worker
+
+
+class Command(BaseCommand):
+    help = "Run queued background tasks. Start several for more throughput."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Number of threads running tasks.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the queue is empty.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no task is due instead of polling.",
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: worker.stop())
+
+        concurrency = options["concurrency"]
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            if options["once"]:
+                ran = sum(pool.map(lambda _: worker.run_pending(), range(concurrency)))
+                self.stdout.write(self.style.SUCCESS(f"Ran {ran} tasks."))
+                return
+            self.stdout.write(f"Worker started with {concurrency} threads.")
+            for _ in range(concurrency):
+                pool.submit(worker.run_forever, options["poll_interval"])
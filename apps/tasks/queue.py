@@ -0,0 +1,173 @@
+"""
+A small database-backed task queue.
+
+Functions decorated with ``@task`` gain ``.delay(*args, **kwargs)``, which
+stores a ``Task`` row once the current transaction commits (so the worker
+never sees ids of rows that were rolled back). ``manage.py run_worker``
+claims due tasks with a conditional UPDATE, so any number of worker threads
+and processes can share the table without a broker or row locks. Failed
+tasks are retried with exponential backoff, then kept as ``failed``.
+
+Arguments must be JSON serialisable; pass ids rather than model instances.
+With ``TASKS_EAGER = True`` tasks run in-process on commit instead.
+"""
+
+import logging
+import random
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+registry = {}
+
+
+class TaskFunction:
+    def __init__(self, func, name, max_attempts):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def delay(self, *args, **kwargs):
+        """Run the task in the background after the current transaction commits."""
+        if settings.TASKS_EAGER:
+            transaction.on_commit(lambda: self.func(*args, **kwargs))
+            return
+        transaction.on_commit(
+            lambda: Task.objects.create(
+                name=self.name,
+                args=list(args),
+                kwargs=kwargs,
+                max_attempts=self.max_attempts,
+            )
+        )
+
+
+def task(func=None, *, max_attempts=3):
+    """Register ``func`` as a task: ``@task`` or ``@task(max_attempts=5)``."""
+
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        registry[name] = TaskFunction(func, name, max_attempts)
+        return registry[name]
+
+    return decorator(func) if func is not None else decorator
+
+
+def backoff(attempts):
+    """Seconds to wait before retry number ``attempts``, with 10% jitter."""
+    delay = min(settings.TASKS_RETRY_BACKOFF * 2 ** (attempts - 1), 3600)
+    return delay * random.uniform(1, 1.1)
+
+
+class Worker:
+    def __init__(self, lease=None, batch_size=20):
+        self.lease = timedelta(seconds=lease or settings.TASKS_LEASE)
+        self.batch_size = batch_size
+        self.stopping = threading.Event()
+
+    def due(self, now):
+        return Q(status=Task.Status.QUEUED, run_at__lte=now) | Q(
+            status=Task.Status.RUNNING, locked_until__lt=now
+        )
+
+    def claim(self):
+        """Claim the next due task, or return ``None`` when there is none."""
+        now = timezone.now()
+        candidates = (
+            Task.objects.filter(self.due(now))
+            .order_by("run_at", "pk")
+            .values_list("pk", flat=True)[: self.batch_size]
+        )
+        for pk in candidates:
+            claimed = (
+                Task.objects.filter(self.due(now), pk=pk).update(
+                    status=Task.Status.RUNNING,
+                    locked_until=now + self.lease,
+                    attempts=F("attempts") + 1,
+                )
+                == 1
+            )
+            if claimed:
+                return Task.objects.get(pk=pk)
+        return None
+
+    def execute(self, task):
+        func = registry.get(task.name)
+        # Only while this worker's lease holds: once it expires another
+        # worker may have claimed the task, and that claim owns the row.
+        leased = Task.objects.filter(pk=task.pk, locked_until=task.locked_until)
+        try:
+            if func is None:
+                raise LookupError(f"No task registered as {task.name!r}.")
+            func(*task.args, **task.kwargs)
+        except Exception:
+            error = traceback.format_exc()
+            if task.attempts >= task.max_attempts:
+                logger.error("Task %s failed permanently:\n%s", task, error)
+                updated = leased.update(
+                    status=Task.Status.FAILED, locked_until=None, last_error=error
+                )
+            else:
+                logger.warning("Task %s failed, retrying:\n%s", task, error)
+                updated = leased.update(
+                    status=Task.Status.QUEUED,
+                    locked_until=None,
+                    run_at=timezone.now() + timedelta(seconds=backoff(task.attempts)),
+                    last_error=error,
+                )
+            if not updated:
+                self.lost_lease(task)
+            return False
+        deleted, _ = leased.delete()
+        if not deleted:
+            self.lost_lease(task)
+        return True
+
+    def lost_lease(self, task):
+        logger.warning(
+            "Task %s outlived its lease and was claimed again; "
+            "leaving it to the new claim (raise TASKS_LEASE if this recurs).",
+            task,
+        )
+
+    def run_pending(self):
+        """Run due tasks until none are left. Returns how many ran."""
+        ran = 0
+        while not self.stopping.is_set():
+            task = self.claim()
+            if task is None:
+                break
+            self.execute(task)
+            ran += 1
+        return ran
+
+    def run_forever(self, poll_interval=1.0):
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                if not self.run_pending():
+                    self.stopping.wait(poll_interval)
+        finally:
+            # Connections are per thread; don't leave this one open.
+            connections.close_all()
+
+    def stop(self):
+        self.stopping.set()
+
+
+def run_pending_tasks():
+    """Run every due task in this thread; handy in tests and cron jobs."""
+    return Worker().run_pending()
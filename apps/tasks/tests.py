@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import CustomUser
+
+from .models import Task
+from .queue import Worker, run_pending_tasks, task
+
+calls = []
+
+
+@task
+def record(value):
+    calls.append(value)
+
+
+@task(max_attempts=2)
+def explode():
+    raise RuntimeError("boom")
+
+
+class TaskQueueTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_delay_enqueues_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            record.delay("a")
+            self.assertFalse(Task.objects.exists())
+        for callback in callbacks:
+            callback()
+        queued = Task.objects.get()
+        self.assertEqual((queued.name, queued.args), (record.name, ["a"]))
+
+        self.assertEqual(run_pending_tasks(), 1)
+        self.assertEqual(calls, ["a"])
+        self.assertFalse(Task.objects.exists())
+
+    @override_settings(TASKS_EAGER=True)
+    def test_eager_runs_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            record.delay("b")
+        self.assertEqual(calls, ["b"])
+        self.assertFalse(Task.objects.exists())
+
+    def test_failures_back_off_then_fail(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            explode.delay()
+
+        with self.assertLogs("apps.tasks.queue", "WARNING"):
+            run_pending_tasks()
+        queued = Task.objects.get()
+        self.assertEqual(queued.status, Task.Status.QUEUED)
+        self.assertEqual(queued.attempts, 1)
+        self.assertGreater(queued.run_at, timezone.now())
+        self.assertIn("boom", queued.last_error)
+        # not due yet
+        self.assertEqual(run_pending_tasks(), 0)
+
+        Task.objects.update(run_at=timezone.now())
+        with self.assertLogs("apps.tasks.queue", "ERROR"):
+            run_pending_tasks()
+        self.assertEqual(Task.objects.get().status, Task.Status.FAILED)
+        self.assertEqual(run_pending_tasks(), 0)
+
+    def test_claims_are_exclusive_until_the_lease_expires(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            record.delay("c")
+        first, second = Worker(), Worker()
+        claimed = first.claim()
+        self.assertIsNotNone(claimed)
+        self.assertIsNone(second.claim())
+
+        # the first worker died mid-task
+        Task.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+        reclaimed = second.claim()
+        self.assertEqual(reclaimed.pk, claimed.pk)
+        self.assertEqual(reclaimed.attempts, 2)
+        second.execute(reclaimed)
+        self.assertEqual(calls, ["c"])
+
+    def test_an_expired_lease_leaves_the_task_to_the_new_claim(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            record.delay("d")
+        first, second = Worker(), Worker()
+        claimed = first.claim()
+        Task.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+        reclaimed = second.claim()
+
+        # The first worker finishes late; the second claim keeps the row.
+        with self.assertLogs("apps.tasks.queue", "WARNING"):
+            first.execute(claimed)
+        self.assertEqual(Task.objects.get().locked_until, reclaimed.locked_until)
+        second.execute(reclaimed)
+        self.assertEqual(calls, ["d", "d"])
+        self.assertFalse(Task.objects.exists())
+
+    def test_password_reset_email_is_queued(self):
+        CustomUser.objects.create_user("reset", "reset@example.com", "pw")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("accounts:password_reset"), {"email": "reset@example.com"}
+            )
+        self.assertEqual(len(mail.outbox), 0)
+        run_pending_tasks()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["reset@example.com"])
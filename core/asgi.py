@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
+
+# Imported once the apps are loaded.
+from apps.dashboard import tracking  # noqa: E402
+
+tracking.start_flusher()
@@ -0,0 +1,18 @@
+"""
+URLconf for requests served under ASGI: ``core.urls`` with the jobs app
+routed to its async views (``apps.jobs.async_urls``).
+"""
+
+from django.urls import include, path
+
+from apps.jobs import urls as jobs_urls
+from core import urls
+
+urlpatterns = [
+    (
+        path(str(pattern.pattern), include("apps.jobs.async_urls"))
+        if getattr(pattern, "urlconf_name", None) is jobs_urls
+        else pattern
+    )
+    for pattern in urls.urlpatterns
+]
@@ -0,0 +1,130 @@
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+MISSING = object()
+
+
+class TieredCache(BaseCache):
+    """
+    Two-tier cache: a small per-process LRU (``LocMemCache``) in front of a
+    shared backend configured as another ``CACHES`` alias.
+
+    Reads hit the local tier first and fill it from the shared one; writes
+    and deletes go to both. Local entries live at most ``LOCAL_TIMEOUT``
+    seconds, which bounds how long another process can serve a value that
+    was invalidated elsewhere.
+
+    OPTIONS: ``SHARED_ALIAS`` (default ``"shared"``), ``LOCAL_TIMEOUT``
+    (default 5) and ``LOCAL_MAX_ENTRIES`` (default 1000).
+
+    The async read and write methods serve local hits without leaving the
+    event loop and use the shared backend's async API otherwise.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.shared_alias = options.get("SHARED_ALIAS", "shared")
+        self.local_timeout = options.get("LOCAL_TIMEOUT", 5)
+        self.local = LocMemCache(
+            location or "tiered-local",
+            {
+                "TIMEOUT": self.local_timeout,
+                "OPTIONS": {"MAX_ENTRIES": options.get("LOCAL_MAX_ENTRIES", 1000)},
+            },
+        )
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def _local_timeout(self, timeout):
+        if timeout is DEFAULT_TIMEOUT or timeout is None:
+            return self.local_timeout
+        return min(timeout, self.local_timeout)
+
+    def get(self, key, default=None, version=None):
+        value = self.local.get(key, MISSING, version=version)
+        if value is MISSING:
+            value = self.shared.get(key, MISSING, version=version)
+            if value is MISSING:
+                return default
+            self.local.set(key, value, version=version)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = self.local.get_many(keys, version=version)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            fetched = self.shared.get_many(missing, version=version)
+            self.local.set_many(fetched, version=version)
+            found.update(fetched)
+        return found
+
+    async def aget(self, key, default=None, version=None):
+        value = self.local.get(key, MISSING, version=version)
+        if value is MISSING:
+            value = await self.shared.aget(key, MISSING, version=version)
+            if value is MISSING:
+                return default
+            self.local.set(key, value, version=version)
+        return value
+
+    async def aget_many(self, keys, version=None):
+        found = self.local.get_many(keys, version=version)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            fetched = await self.shared.aget_many(missing, version=version)
+            self.local.set_many(fetched, version=version)
+            found.update(fetched)
+        return found
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version=version)
+        if added:
+            self.local.set(key, value, self._local_timeout(timeout), version=version)
+        return added
+
+    async def aadd(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = await self.shared.aadd(key, value, timeout, version=version)
+        if added:
+            self.local.set(key, value, self._local_timeout(timeout), version=version)
+        return added
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version=version)
+        self.local.set(key, value, self._local_timeout(timeout), version=version)
+
+    async def aset(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        await self.shared.aset(key, value, timeout, version=version)
+        self.local.set(key, value, self._local_timeout(timeout), version=version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout, version=version)
+        self.local.set_many(data, self._local_timeout(timeout), version=version)
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self.local.delete(key, version=version)
+        return self.shared.touch(key, timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self.shared.incr(key, delta, version=version)
+        self.local.set(key, value, version=version)
+        return value
+
+    def delete(self, key, version=None):
+        self.local.delete(key, version=version)
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        self.local.delete_many(keys, version=version)
+        self.shared.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        return self.get(key, MISSING, version=version) is not MISSING
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
@@ -0,0 +1,341 @@
+"""
+In-process request instrumentation, fed by ``InstrumentationMiddleware``.
+
+Each request records its view, status, wall time, database queries and
+their time, template render time and cache hits/misses. The last
+``INSTRUMENTATION_BUFFER_SIZE`` requests are kept in a ring buffer for
+percentiles; running totals per view are kept for Prometheus counters.
+Both are per process, so with several workers each reports its own.
+
+Query, template and cache figures come from wrapping every database
+connection, the Django template backend and the configured cache backends
+once, when the middleware is loaded. The wrappers find the request being
+recorded through a context variable, which also follows async views into
+the threads that run their queries, and do nothing outside one.
+"""
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import Template
+
+_current = ContextVar("instrumentation_request", default=None)
+_lock = threading.Lock()
+_profile_lock = threading.Lock()
+_installed = False
+
+# (view, status, seconds, queries, db seconds, template seconds, hits, misses)
+samples = deque(maxlen=1)
+# view -> [requests, errors, seconds, queries, db s, template s, hits, misses]
+totals = defaultdict(lambda: [0, 0, 0.0, 0, 0.0, 0.0, 0, 0])
+# (finished at, view, path, milliseconds, pstats report) for slow requests.
+slow_profiles = deque(maxlen=20)
+
+MISSING = object()
+
+
+class RequestStats:
+    __slots__ = (
+        "queries",
+        "db_time",
+        "template_time",
+        "hits",
+        "misses",
+        "rendering",
+        "reading_cache",
+        "token",
+    )
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.hits = 0
+        self.misses = 0
+        # Nested template renders and cache tiers are counted once.
+        self.rendering = False
+        self.reading_cache = False
+        self.token = None
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper on every connection; times queries of recorded requests."""
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - start
+
+
+def _add_query_recorder(sender, connection, **kwargs):
+    # First in the list, so ``connection.execute_wrapper()`` blocks that are
+    # open when the connection is created still pop their own wrapper.
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[
+        min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    ]
+
+
+def install():
+    """Size the buffer and wrap template rendering and cache reads, once."""
+    global samples, _installed
+    with _lock:
+        if samples.maxlen != settings.INSTRUMENTATION_BUFFER_SIZE:
+            samples = deque(samples, maxlen=settings.INSTRUMENTATION_BUFFER_SIZE)
+        if _installed:
+            return
+        _installed = True
+    # Async views run their queries in worker threads, each with its own
+    # connection, so the wrapper goes on every connection as it opens; the
+    # request is found through the context variable.
+    connection_created.connect(_add_query_recorder)
+    for connection in connections.all(initialized_only=True):
+        _add_query_recorder(None, connection)
+    Template.render = _timed_render(Template.render)
+    for backend in {type(caches[alias]) for alias in settings.CACHES}:
+        backend.get = _counted_get(backend.get)
+        backend.get_many = _counted_get_many(backend.get_many)
+        backend.aget = _counted_aget(backend.aget)
+        backend.aget_many = _counted_aget_many(backend.aget_many)
+
+
+def _timed_render(render):
+    def timed_render(self, *args, **kwargs):
+        stats = _current.get()
+        if stats is None or stats.rendering:
+            return render(self, *args, **kwargs)
+        stats.rendering = True
+        start = time.perf_counter()
+        try:
+            return render(self, *args, **kwargs)
+        finally:
+            stats.template_time += time.perf_counter() - start
+            stats.rendering = False
+
+    return timed_render
+
+
+def _counted_get(get):
+    def counted_get(self, key, default=None, version=None):
+        stats = _current.get()
+        if stats is None or stats.reading_cache:
+            return get(self, key, default, version=version)
+        stats.reading_cache = True
+        try:
+            value = get(self, key, MISSING, version=version)
+        finally:
+            stats.reading_cache = False
+        if value is MISSING:
+            stats.misses += 1
+            return default
+        stats.hits += 1
+        return value
+
+    return counted_get
+
+
+def _counted_get_many(get_many):
+    def counted_get_many(self, keys, version=None):
+        stats = _current.get()
+        if stats is None or stats.reading_cache:
+            return get_many(self, keys, version=version)
+        keys = list(keys)
+        stats.reading_cache = True
+        try:
+            found = get_many(self, keys, version=version)
+        finally:
+            stats.reading_cache = False
+        stats.hits += len(found)
+        stats.misses += len(keys) - len(found)
+        return found
+
+    return counted_get_many
+
+
+def _counted_aget(aget):
+    async def counted_aget(self, key, default=None, version=None):
+        stats = _current.get()
+        if stats is None or stats.reading_cache:
+            return await aget(self, key, default, version=version)
+        stats.reading_cache = True
+        try:
+            value = await aget(self, key, MISSING, version=version)
+        finally:
+            stats.reading_cache = False
+        if value is MISSING:
+            stats.misses += 1
+            return default
+        stats.hits += 1
+        return value
+
+    return counted_aget
+
+
+def _counted_aget_many(aget_many):
+    async def counted_aget_many(self, keys, version=None):
+        stats = _current.get()
+        if stats is None or stats.reading_cache:
+            return await aget_many(self, keys, version=version)
+        keys = list(keys)
+        stats.reading_cache = True
+        try:
+            found = await aget_many(self, keys, version=version)
+        finally:
+            stats.reading_cache = False
+        stats.hits += len(found)
+        stats.misses += len(keys) - len(found)
+        return found
+
+    return counted_aget_many
+
+
+def start():
+    """Begin recording the current request; pass the result to ``finish``."""
+    stats = RequestStats()
+    stats.token = _current.set(stats)
+    return stats
+
+
+def finish(stats, view, status, seconds):
+    _current.reset(stats.token)
+    with _lock:
+        samples.append(
+            (
+                view,
+                status,
+                seconds,
+                stats.queries,
+                stats.db_time,
+                stats.template_time,
+                stats.hits,
+                stats.misses,
+            )
+        )
+        total = totals[view]
+        total[0] += 1
+        total[1] += status >= 500
+        total[2] += seconds
+        total[3] += stats.queries
+        total[4] += stats.db_time
+        total[5] += stats.template_time
+        total[6] += stats.hits
+        total[7] += stats.misses
+
+
+def start_profile():
+    """A running profiler, or None if another request is being profiled."""
+    if not _profile_lock.acquire(blocking=False):
+        return None
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def finish_profile(profiler, view, path, seconds):
+    profiler.disable()
+    _profile_lock.release()
+    if seconds * 1000 < settings.INSTRUMENTATION_SLOW_REQUEST_MS:
+        return
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(30)
+    slow_profiles.append((time.time(), view, path, seconds * 1000, report.getvalue()))
+
+
+def summary():
+    """Per-view aggregates over the buffered requests, slowest p90 first."""
+    with _lock:
+        snapshot = list(samples)
+    by_view = defaultdict(list)
+    for sample in snapshot:
+        by_view[sample[0]].append(sample)
+    rows = []
+    for view, group in by_view.items():
+        wall = sorted(sample[2] * 1000 for sample in group)
+        count = len(group)
+        hits = sum(sample[6] for sample in group)
+        lookups = hits + sum(sample[7] for sample in group)
+        rows.append(
+            {
+                "view": view,
+                "requests": count,
+                "errors": sum(sample[1] >= 500 for sample in group),
+                "p50": percentile(wall, 0.5),
+                "p90": percentile(wall, 0.9),
+                "p99": percentile(wall, 0.99),
+                "max": wall[-1],
+                "queries": sum(sample[3] for sample in group) / count,
+                "db_ms": sum(sample[4] for sample in group) * 1000 / count,
+                "template_ms": sum(sample[5] for sample in group) * 1000 / count,
+                "cache_hit_rate": hits / lookups if lookups else None,
+            }
+        )
+    return sorted(rows, key=lambda row: row["p90"], reverse=True)
+
+
+def _label(view):
+    return view.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    """Windowed latency quantiles and running totals in Prometheus text format."""
+    lines = [
+        "# HELP django_view_latency_seconds Request wall time per view over the "
+        "most recent requests.",
+        "# TYPE django_view_latency_seconds summary",
+    ]
+    for row in summary():
+        view = _label(row["view"])
+        for quantile in ("p50", "p90", "p99"):
+            lines.append(
+                f'django_view_latency_seconds{{view="{view}",'
+                f'quantile="0.{quantile[1:]}"}} {row[quantile] / 1000:.6f}'
+            )
+    with _lock:
+        current = {view: list(total) for view, total in totals.items()}
+    for view, total in current.items():
+        lines.append(
+            f'django_view_latency_seconds_sum{{view="{_label(view)}"}} {total[2]:.6f}'
+        )
+        lines.append(
+            f'django_view_latency_seconds_count{{view="{_label(view)}"}} {total[0]}'
+        )
+
+    for name, index, description in (
+        ("django_view_errors_total", 1, "Responses with a 5xx status."),
+        ("django_view_db_queries_total", 3, "Database queries run."),
+        ("django_view_db_seconds_total", 4, "Time spent running queries."),
+        ("django_view_template_seconds_total", 5, "Time spent rendering templates."),
+        ("django_view_cache_hits_total", 6, "Cache reads that found the key."),
+        ("django_view_cache_misses_total", 7, "Cache reads that missed."),
+    ):
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        for view, total in current.items():
+            value = total[index]
+            value = f"{value:.6f}" if isinstance(value, float) else value
+            lines.append(f'{name}{{view="{_label(view)}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    with _lock:
+        samples.clear()
+        totals.clear()
+        slow_profiles.clear()
@@ -1,38 +1,59 @@
 # core/middleware/admin_cookie_middleware.py
 from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
 
+ADMIN_PATH_PREFIX = "/admin/"
 
-class AdminSessionCookieMiddleware:
+ADMIN_SESSION_COOKIE = "admin_sessionid"
+ADMIN_CSRF_COOKIE = "admin_csrftoken"
+CLIENT_SESSION_COOKIE = "client_sessionid"
+CLIENT_CSRF_COOKIE = "client_csrftoken"
+
+
+def cookie_scope(path):
+    """Return ``(session cookie, session path, csrf cookie)`` for a request path."""
+    if path.startswith(ADMIN_PATH_PREFIX):
+        return ADMIN_SESSION_COOKIE, ADMIN_PATH_PREFIX, ADMIN_CSRF_COOKIE
+    return CLIENT_SESSION_COOKIE, "/", CLIENT_CSRF_COOKIE
+
+
+class AdminSessionCookieMiddleware(MiddlewareMixin):
     """
     Switches between admin and client cookies so their sessions are isolated.
     Keeps both admin and frontend login states independent.
-    """
 
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-        # Backup original cookie settings
-        original_name = settings.SESSION_COOKIE_NAME
-        original_path = getattr(settings, "SESSION_COOKIE_PATH", "/")
-        original_csrf_name = getattr(settings, "CSRF_COOKIE_NAME", "csrftoken")
-
-        # Use admin-specific cookies if path starts with /admin/
-        if request.path.startswith("/admin/"):
-            settings.SESSION_COOKIE_NAME = "admin_sessionid"
-            settings.SESSION_COOKIE_PATH = "/admin/"
-            settings.CSRF_COOKIE_NAME = "admin_csrftoken"
-        else:
-            settings.SESSION_COOKIE_NAME = "client_sessionid"
-            settings.SESSION_COOKIE_PATH = "/"
-            settings.CSRF_COOKIE_NAME = "client_csrftoken"
-
-        # Process request/response
-        response = self.get_response(request)
-
-        # Restore global settings for the next request
-        settings.SESSION_COOKIE_NAME = original_name
-        settings.SESSION_COOKIE_PATH = original_path
-        settings.CSRF_COOKIE_NAME = original_csrf_name
+    Works per request instead of touching ``settings``: incoming scoped
+    cookies are exposed under the standard ``SESSION_COOKIE_NAME`` /
+    ``CSRF_COOKIE_NAME`` for the session and CSRF middleware, and the
+    cookies they set are renamed back on the way out. Must be listed before
+    both of them. Safe under threaded and async workers.
+    """
 
+    def process_request(self, request):
+        session_cookie, _session_path, csrf_cookie = cookie_scope(request.path)
+        cookies = dict(request.COOKIES)
+        for standard, scoped in (
+            (settings.SESSION_COOKIE_NAME, session_cookie),
+            (settings.CSRF_COOKIE_NAME, csrf_cookie),
+        ):
+            if scoped in cookies:
+                cookies[standard] = cookies.pop(scoped)
+            else:
+                cookies.pop(standard, None)
+        request.COOKIES = cookies
+
+    def process_response(self, request, response):
+        session_cookie, session_path, csrf_cookie = cookie_scope(request.path)
+        for standard, scoped, path in (
+            (settings.SESSION_COOKIE_NAME, session_cookie, session_path),
+            (settings.CSRF_COOKIE_NAME, csrf_cookie, None),
+        ):
+            morsel = response.cookies.pop(standard, None)
+            if morsel is None:
+                continue
+            response.cookies[scoped] = morsel.value
+            renamed = response.cookies[scoped]
+            renamed.update({key: value for key, value in morsel.items() if value})
+            if path is not None:
+                renamed["path"] = path
         return response
@@ -0,0 +1,30 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+
+class ASGIURLConfMiddleware:
+    """
+    Routes requests to ``ASGI_URLCONF`` when the middleware stack runs
+    async (under ASGI), so public pages are served by their native async
+    views there and by the sync ones under WSGI, where an async view would
+    need an event loop per request.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if settings.ASGI_URLCONF:
+            request.urlconf = settings.ASGI_URLCONF
+        return await self.get_response(request)
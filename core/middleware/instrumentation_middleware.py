@@ -0,0 +1,74 @@
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from core import instrumentation
+
+
+class InstrumentationMiddleware:
+    """
+    Records per-view timings, query counts, template time and cache hit rate
+    into ``core.instrumentation`` (see ``/admin/metrics/``). List it first so
+    the wall time covers the other middleware.
+
+    Removed from the stack entirely unless ``INSTRUMENTATION_ENABLED``. A
+    fraction ``INSTRUMENTATION_PROFILE_RATE`` of requests also runs under
+    cProfile, and the profiles of those slower than
+    ``INSTRUMENTATION_SLOW_REQUEST_MS`` are kept.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.profile_rate = settings.INSTRUMENTATION_PROFILE_RATE
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        instrumentation.install()
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        profiler, stats, start = self.start()
+        response = None
+        try:
+            response = self.get_response(request)
+        finally:
+            self.finish(request, response, profiler, stats, start)
+        return response
+
+    async def __acall__(self, request):
+        # cProfile sees the event loop thread only: work an async view hands
+        # to worker threads (queries) is missing and interleaved requests on
+        # the loop are included.
+        profiler, stats, start = self.start()
+        response = None
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.finish(request, response, profiler, stats, start)
+        return response
+
+    def start(self):
+        profiler = None
+        if self.profile_rate and random.random() < self.profile_rate:
+            profiler = instrumentation.start_profile()
+        return profiler, instrumentation.start(), time.perf_counter()
+
+    def finish(self, request, response, profiler, stats, start):
+        seconds = time.perf_counter() - start
+        match = request.resolver_match
+        view = match.view_name if match else "<unresolved>"
+        status = response.status_code if response is not None else 500
+        instrumentation.finish(stats, view, status, seconds)
+        if profiler is not None:
+            instrumentation.finish_profile(
+                profiler, view, request.get_full_path(), seconds
+            )
@@ -0,0 +1,394 @@
+"""
+Synthetic data at production scale for ``manage.py seed`` and the benchmark
+commands.
+
+Rows are generated lazily from one ``random.Random(seed)`` and written with
+``bulk_create`` in chunks, so memory stays flat up to millions of rows and
+the same seed always produces the same data. Signals are bypassed; the
+stored counters, places, the search index and (optionally) skill matches
+are rebuilt once at the end. Every seeded user can sign in with ``PASSWORD``.
+"""
+
+import random
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.models import Employer, JobSeeker, Profile
+from apps.dashboard.analytics import rebuild_rollups
+from apps.jobs import matching
+from apps.jobs.counters import reconcile_counters
+from apps.jobs.models import Application, Category, Job
+from apps.jobs.ranking import rebuild_rankings
+from apps.jobs.search import get_backend
+from apps.locations.gazetteer import link_places
+
+PASSWORD = "seed-password"
+
+# (category, icon, job titles, skills)
+DOMAINS = [
+    (
+        "Software Development",
+        "fas fa-code",
+        ["Backend Developer", "Frontend Developer", "Full Stack Engineer"],
+        ["Python", "Django", "JavaScript", "React", "TypeScript", "Go", "SQL"],
+    ),
+    (
+        "Mobile",
+        "fas fa-mobile-alt",
+        ["iOS Developer", "Android Developer", "Mobile Engineer"],
+        ["Swift", "Kotlin", "Flutter", "React Native", "Java"],
+    ),
+    (
+        "Design",
+        "fas fa-palette",
+        ["Product Designer", "UX Researcher", "UI Designer"],
+        ["Figma", "Sketch", "User Research", "Prototyping", "Illustrator"],
+    ),
+    (
+        "Data",
+        "fas fa-database",
+        ["Data Engineer", "Data Analyst", "Machine Learning Engineer"],
+        ["SQL", "Python", "Spark", "Airflow", "Machine Learning", "Tableau"],
+    ),
+    (
+        "DevOps",
+        "fas fa-cogs",
+        ["DevOps Engineer", "Site Reliability Engineer", "Platform Engineer"],
+        ["AWS", "Docker", "Kubernetes", "Terraform", "Linux", "Go"],
+    ),
+    (
+        "Marketing",
+        "fas fa-bullhorn",
+        ["Marketing Manager", "Content Strategist", "SEO Specialist"],
+        ["SEO", "Copywriting", "Google Analytics", "Social Media", "Email Marketing"],
+    ),
+    (
+        "Sales",
+        "fas fa-chart-line",
+        ["Account Executive", "Sales Development Representative", "Sales Manager"],
+        ["Salesforce", "Negotiation", "Lead Generation", "CRM"],
+    ),
+    (
+        "Customer Service",
+        "fas fa-headset",
+        ["Support Specialist", "Customer Success Manager", "Help Desk Technician"],
+        ["Zendesk", "Communication", "Troubleshooting", "CRM"],
+    ),
+    (
+        "Finance",
+        "fas fa-money-bill-wave",
+        ["Accountant", "Financial Analyst", "Controller"],
+        ["Excel", "Accounting", "Financial Modeling", "SAP"],
+    ),
+    (
+        "Healthcare",
+        "fas fa-hospital",
+        ["Registered Nurse", "Medical Assistant", "Pharmacist"],
+        ["Patient Care", "EMR", "Clinical Documentation", "CPR"],
+    ),
+    (
+        "Education",
+        "fas fa-graduation-cap",
+        ["Teacher", "Instructional Designer", "Tutor"],
+        ["Curriculum Design", "Classroom Management", "E-learning"],
+    ),
+    (
+        "Human Resources",
+        "fas fa-users",
+        ["Recruiter", "HR Generalist", "People Operations Manager"],
+        ["Recruiting", "Onboarding", "Payroll", "Employee Relations"],
+    ),
+]
+LEVELS = [("Junior", 0.7), ("", 1.0), ("Senior", 1.35), ("Lead", 1.6)]
+LOCATIONS = [
+    "New York, NY",
+    "San Francisco, CA",
+    "Austin, TX",
+    "Chicago, IL",
+    "Seattle, WA",
+    "Boston, MA",
+    "London, UK",
+    "Berlin, Germany",
+    "Amsterdam, Netherlands",
+    "Paris, France",
+    "Toronto, Canada",
+    "Remote",
+]
+CURRENCIES = {"USD": 0.7, "EUR": 0.2, "GBP": 0.1}
+JOB_TYPES = {"full_time": 0.7, "part_time": 0.1, "contract": 0.15, "internship": 0.05}
+COMPANY_WORDS = [
+    "Acme",
+    "Blue",
+    "Bright",
+    "Cloud",
+    "Delta",
+    "Global",
+    "Green",
+    "Nova",
+    "Peak",
+    "Quantum",
+    "Red",
+    "Summit",
+    "Vertex",
+]
+COMPANY_SUFFIXES = ["Labs", "Systems", "Health", "Group", "Works", "Partners"]
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie"]
+LAST_NAMES = ["Smith", "Garcia", "Chen", "Khan", "Novak", "Silva", "Okafor", "Berg"]
+SENTENCES = [
+    "You will work closely with a small, experienced team.",
+    "We value ownership, clear writing and steady delivery.",
+    "The role includes mentoring and regular code or design reviews.",
+    "Flexible hours and a generous learning budget are included.",
+    "You will help shape the roadmap for a growing product.",
+    "Our customers rely on us every day, so quality matters.",
+]
+STATUSES = {"pending": 0.5, "reviewing": 0.25, "accepted": 0.1, "rejected": 0.15}
+
+
+def _weighted(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def _chunks(rows, size):
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+@contextmanager
+def _explicit_dates(model):
+    """
+    Let ``auto_now``/``auto_now_add`` fields keep the generated value instead
+    of the insert time, so seeded data is spread over months.
+    """
+    fields = [
+        (field, field.auto_now, field.auto_now_add)
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    for field, _auto_now, _auto_now_add in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in fields:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Seeder:
+    """
+    ``Seeder(seed=0).run(jobs=100_000, ...)``. Usernames carry the seed
+    (``seed0-employer12``), so runs with different seeds can share a database.
+    ``password=None`` gives the users an unusable password without hashing.
+    """
+
+    def __init__(self, seed=0, batch_size=5000, log=None, password=PASSWORD):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+        self.password = make_password(password)
+
+    def exists(self):
+        return (
+            get_user_model()
+            .objects.filter(username__startswith=f"seed{self.seed}-")
+            .exists()
+        )
+
+    def run(
+        self,
+        employers=200,
+        seekers=5000,
+        jobs=20000,
+        applications=50000,
+        skill_matches=False,
+    ):
+        with transaction.atomic():
+            categories = self.categories()
+            employer_ids = self.employers(employers)
+            seeker_ids = self.seekers(seekers)
+            job_ids = self.jobs(jobs, categories, employer_ids)
+            self.applications(applications, job_ids, seeker_ids)
+        self.log(
+            "Rebuilding counters, analytics, rankings, places and the search index..."
+        )
+        reconcile_counters()
+        rebuild_rollups()
+        rebuild_rankings()
+        link_places(Employer.objects.all())
+        link_places(Job.objects.all())
+        get_backend().rebuild(Job.objects.all())
+        if skill_matches:
+            self.log("Computing skill matches...")
+            matching.rebuild()
+
+    def bulk_create(self, model, rows):
+        """Insert ``rows`` in chunks; returns the new primary keys."""
+        ids = []
+        with _explicit_dates(model):
+            for chunk in _chunks(rows, self.batch_size):
+                ids.extend(obj.pk for obj in model.objects.bulk_create(chunk))
+        self.log(f"Inserted {len(ids)} rows into {model._meta.db_table}.")
+        return ids
+
+    def categories(self):
+        """Map of category id -> domain, reusing categories with the same name."""
+        existing = dict(Category.objects.values_list("name", "pk"))
+        missing = [domain for domain in DOMAINS if domain[0] not in existing]
+        for pk, domain in zip(
+            self.bulk_create(
+                Category,
+                (Category(name=name, icon=icon) for name, icon, *_ in missing),
+            ),
+            missing,
+        ):
+            existing[domain[0]] = pk
+        return {existing[domain[0]]: domain for domain in DOMAINS}
+
+    def users(self, role, count, **fields):
+        User = get_user_model()
+        rng = self.rng
+        joined = [self.now - timedelta(days=rng.randrange(720)) for _ in range(count)]
+        user_ids = self.bulk_create(
+            User,
+            (
+                User(
+                    username=f"seed{self.seed}-{role}{i}",
+                    email=f"seed{self.seed}-{role}{i}@example.com",
+                    password=self.password,
+                    first_name=rng.choice(FIRST_NAMES),
+                    last_name=rng.choice(LAST_NAMES),
+                    date_joined=joined[i],
+                    created_at=joined[i],
+                    **fields,
+                )
+                for i in range(count)
+            ),
+        )
+        self.bulk_create(
+            Profile,
+            (
+                Profile(
+                    user_id=user_id,
+                    location=rng.choice(LOCATIONS),
+                    created_at=date,
+                    updated_at=date,
+                )
+                for user_id, date in zip(user_ids, joined)
+            ),
+        )
+        return user_ids
+
+    def employers(self, count):
+        rng = self.rng
+        user_ids = self.users("employer", count, is_employer=True)
+        return self.bulk_create(
+            Employer,
+            (
+                Employer(
+                    user_id=user_id,
+                    company_name=(
+                        f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_WORDS)} "
+                        f"{rng.choice(COMPANY_SUFFIXES)} {i}"
+                    ),
+                    company_description=" ".join(rng.sample(SENTENCES, 2)),
+                    company_website=f"https://company{i}.example.com",
+                    location=rng.choice(LOCATIONS),
+                    industry=rng.choice(DOMAINS)[0],
+                )
+                for i, user_id in enumerate(user_ids)
+            ),
+        )
+
+    def seekers(self, count):
+        rng = self.rng
+        user_ids = self.users("seeker", count, is_job_seeker=True)
+        return self.bulk_create(
+            JobSeeker,
+            (
+                JobSeeker(
+                    user_id=user_id,
+                    skills=", ".join(rng.sample(rng.choice(DOMAINS)[3], 3)),
+                    experience=f"{rng.randrange(0, 15)} years",
+                )
+                for user_id in user_ids
+            ),
+        )
+
+    def jobs(self, count, categories, employer_ids):
+        rng = self.rng
+        category_ids = list(categories)
+        # A few employers post most of the jobs, as on real boards.
+        employer_weights = [1 / (rank + 1) for rank in range(len(employer_ids))]
+
+        self.posted_dates = []
+        today = timezone.localdate(self.now)
+
+        def job():
+            category_id = rng.choice(category_ids)
+            _name, _icon, titles, skills = categories[category_id]
+            level, multiplier = rng.choice(LEVELS)
+            currency = _weighted(rng, CURRENCIES)
+            job_type = _weighted(rng, JOB_TYPES)
+            if job_type in ("part_time", "internship"):
+                salary_type, amount = Job.SalaryType.HOURLY, rng.randrange(15, 60)
+            else:
+                salary_type = Job.SalaryType.FIXED
+                amount = round(rng.randrange(35000, 110000) * multiplier, -3)
+            posted = self.now - timedelta(minutes=rng.randrange(60 * 24 * 180))
+            self.posted_dates.append(posted)
+            deadline = None
+            if rng.random() < 0.6:
+                deadline = (posted + timedelta(days=rng.randrange(14, 90))).date()
+            return Job(
+                title=f"{level} {rng.choice(titles)}".strip(),
+                employer_id=rng.choices(employer_ids, weights=employer_weights)[0],
+                category_id=category_id,
+                description=" ".join(rng.sample(SENTENCES, 3)),
+                requirements=", ".join(rng.sample(skills, min(3, len(skills)))),
+                location=rng.choice(LOCATIONS),
+                salary=Decimal(amount),
+                salary_currency=currency,
+                salary_type=salary_type,
+                job_type=job_type,
+                posted_date=posted,
+                updated_at=posted,
+                deadline=deadline,
+                # Jobs past their deadline have been expired already.
+                is_active=rng.random() < 0.9 and not (deadline and deadline < today),
+            )
+
+        return self.bulk_create(Job, (job() for _ in range(count)))
+
+    def applications(self, count, job_ids, seeker_ids):
+        """About ``count`` applications, spread over seekers, one per job each."""
+        rng = self.rng
+        if not job_ids or not seeker_ids:
+            return []
+        per_seeker, extra = divmod(count, len(seeker_ids))
+
+        def rows():
+            for index, seeker_id in enumerate(seeker_ids):
+                wanted = min(per_seeker + (index < extra), len(job_ids))
+                for job_index in rng.sample(range(len(job_ids)), wanted):
+                    posted = self.posted_dates[job_index]
+                    applied = posted + (self.now - posted) * rng.random()
+                    yield Application(
+                        job_id=job_ids[job_index],
+                        job_seeker_id=seeker_id,
+                        cover_letter=rng.choice(SENTENCES),
+                        status=_weighted(rng, STATUSES),
+                        applied_date=applied,
+                        updated_date=applied,
+                    )
+
+        return self.bulk_create(Application, rows())
@@ -15,9 +15,11 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     # Custom apps
+    "apps.locations.apps.LocationsConfig",
     "apps.accounts.apps.AccountsConfig",
     "apps.jobs.apps.JobsConfig",
     "apps.dashboard.apps.DashboardConfig",
+    "apps.tasks.apps.TasksConfig",
     "djmoney",
     "django_select2",  # ✅ Required for the widgets to work
 ]
@@ -40,6 +42,8 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.instrumentation_middleware.InstrumentationMiddleware",
+    "core.middleware.asgi_urlconf_middleware.ASGIURLConfMiddleware",
     "core.middleware.admin_cookie_middleware.AdminSessionCookieMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -51,6 +55,9 @@ MIDDLEWARE = [
 ]
 
 ROOT_URLCONF = "core.urls"
+# Used instead under ASGI, to serve the public pages with async views; set
+# to None to run the sync views there too.
+ASGI_URLCONF = "core.asgi_urls"
 
 TEMPLATES = [
     {
@@ -87,5 +94,77 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 LOGIN_REDIRECT_URL = "dashboard:employer_dashboard"
 LOGOUT_REDIRECT_URL = "/admin/login"
 
+# Per-process LRU in front of a shared cache. Point "shared" at
+# FileBasedCache or RedisCache to share entries between workers.
+CACHES = {
+    "default": {
+        "BACKEND": "core.cache.TieredCache",
+        "OPTIONS": {
+            "SHARED_ALIAS": "shared",
+            "LOCAL_TIMEOUT": 5,
+            "LOCAL_MAX_ENTRIES": 1000,
+        },
+    },
+    "shared": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "shared",
+    },
+}
+# Seconds an anonymous page render is reused (pages are also invalidated
+# as soon as the jobs, categories or employers they show change).
+PUBLIC_PAGE_CACHE_TIMEOUT = 600
+# max-age sent to browsers and proxies for anonymous pages; they revalidate
+# with ETag/Last-Modified afterwards.
+PUBLIC_PAGE_MAX_AGE = 60
+
+# Read-only JSON API (apps.jobs.api): default and maximum rows per page, and
+# (requests, seconds) allowed per client address; (0, 0) disables throttling.
+API_PAGE_SIZE = 100
+API_MAX_PAGE_SIZE = 500
+API_RATE_LIMIT = (600, 60)
+
+# Background tasks (apps.tasks): run them in-process on commit instead of
+# through ``manage.py run_worker``, the base retry delay in seconds (doubled
+# per attempt) and how long a worker may hold a task before it is retried.
+TASKS_EAGER = False
+TASKS_RETRY_BACKOFF = 30
+TASKS_LEASE = 300
+
+# Job impressions and views (apps.dashboard.tracking): seconds between writes
+# of the counts buffered in each process, and how long a visitor counts once
+# per job.
+VIEW_TRACKING_FLUSH_INTERVAL = 30
+VIEW_TRACKING_DEDUP_SECONDS = 1800
+
+# ``manage.py expire_jobs`` moves jobs inactive for this long to the archive.
+JOB_ARCHIVE_AFTER_DAYS = 180
+
+# Request instrumentation (core.instrumentation), shown at /admin/metrics/:
+# per-view timings for the last BUFFER_SIZE requests of each process. A
+# share PROFILE_RATE of requests also runs under cProfile and the profiles
+# of those slower than SLOW_REQUEST_MS are kept. Prometheus can scrape
+# /admin/metrics/?format=prometheus with "Authorization: Bearer METRICS_TOKEN".
+INSTRUMENTATION_ENABLED = False
+INSTRUMENTATION_BUFFER_SIZE = 10000
+INSTRUMENTATION_PROFILE_RATE = 0
+INSTRUMENTATION_SLOW_REQUEST_MS = 500
+METRICS_TOKEN = ""
+
+# Base URL for links in emails sent outside a request.
+SITE_URL = "http://127.0.0.1:8000"
+# Saved searches per job seeker, and digests sent per email connection batch.
+JOB_ALERT_LIMIT = 20
+JOB_ALERT_EMAIL_BATCH_SIZE = 100
+
 DEFAULT_CURRENCY = "USD"
 CURRENCIES = ("USD", "EUR", "GBP")
+# Rates converting each currency into DEFAULT_CURRENCY for salary filtering.
+SALARY_EXCHANGE_RATES = {"USD": 1, "EUR": 1.08, "GBP": 1.27}
+
+# Full-text search over jobs. Swap for
+# "apps.jobs.search.backends.sqlite_fts.SQLiteFTSSearchBackend" or
+# "apps.jobs.search.backends.postgres.PostgresSearchBackend" where available.
+JOB_SEARCH_BACKEND = "apps.jobs.search.backends.database.DatabaseSearchBackend"
+# Search results in relevance order page by OFFSET; only this many pages are
+# served.
+JOB_SEARCH_MAX_PAGES = 20
@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.middleware.admin_cookie_middleware import CLIENT_SESSION_COOKIE
+from core.seeding import Seeder
+
+
+def seed_dataset(
+    employers=20,
+    seekers=50,
+    jobs=2000,
+    applications=2000,
+    skill_matches=False,
+):
+    """
+    The ``manage.py seed`` data at test scale. Users get no usable password;
+    tests sign in with ``force_login``.
+    """
+    Seeder(password=None).run(
+        employers=employers,
+        seekers=seekers,
+        jobs=jobs,
+        applications=applications,
+        skill_matches=skill_matches,
+    )
+
+
+class SeededTestCase(TestCase):
+    """
+    Seeds a small ``dataset`` once per class; tests add the rows they need.
+    """
+
+    dataset = {"employers": 5, "seekers": 20, "jobs": 200, "applications": 200}
+    # Building every skill match list takes a while; only opt in where a test
+    # reads them.
+    skill_matches = False
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(**cls.dataset, skill_matches=cls.skill_matches)
+
+    def setUp(self):
+        cache.clear()
+
+    def login(self, user):
+        self.client.force_login(user)
+        session = self.client.cookies.pop(settings.SESSION_COOKIE_NAME)
+        self.client.cookies[CLIENT_SESSION_COOKIE] = session.value
+
+
+class QueryBudgetTestCase(SeededTestCase):
+    """
+    Seeds a dataset large enough that any per-row query in a view shows up
+    as a budget failure, and checks that views render with an exact number
+    of queries, independent of the number of rows shown.
+    """
+
+    dataset = {"employers": 20, "seekers": 50, "jobs": 2000, "applications": 2000}
+
+    def assertQueryBudget(self, url, budget, user=None):
+        if user is not None:
+            self.login(user)
+        with self.assertNumQueries(budget):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
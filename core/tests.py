@@ -0,0 +1,144 @@
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse
+
+from apps.accounts.models import Employer
+from core import instrumentation
+from core.middleware.admin_cookie_middleware import (
+    ADMIN_SESSION_COOKIE,
+    CLIENT_SESSION_COOKIE,
+    AdminSessionCookieMiddleware,
+    cookie_scope,
+)
+from core.testing import SeededTestCase
+
+
+@override_settings(
+    INSTRUMENTATION_ENABLED=True,
+    INSTRUMENTATION_PROFILE_RATE=1,
+    INSTRUMENTATION_SLOW_REQUEST_MS=0,
+    METRICS_TOKEN="secret",
+)
+class InstrumentationTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        instrumentation.reset()
+
+    def admin_login(self):
+        staff = Employer.objects.select_related("user").first().user
+        staff.is_staff = True
+        staff.save()
+        self.client.force_login(staff)
+        session = self.client.cookies.pop(settings.SESSION_COOKIE_NAME)
+        self.client.cookies[ADMIN_SESSION_COOKIE] = session.value
+
+    def test_records_per_view_metrics(self):
+        for _ in range(2):
+            self.assertEqual(self.client.get(reverse("jobs:job_list")).status_code, 200)
+        self.client.get("/no-such-page/")
+
+        rows = {row["view"]: row for row in instrumentation.summary()}
+        job_list = rows["jobs:job_list"]
+        self.assertEqual(job_list["requests"], 2)
+        self.assertGreater(job_list["queries"], 0)
+        self.assertGreater(job_list["template_ms"], 0)
+        # The first request renders and caches the page, the second reuses it.
+        self.assertGreater(job_list["cache_hit_rate"], 0)
+        self.assertLess(job_list["cache_hit_rate"], 1)
+        self.assertEqual(rows["<unresolved>"]["requests"], 1)
+        self.assertEqual(
+            [view for _at, view, *_rest in instrumentation.slow_profiles][:2],
+            ["jobs:job_list", "jobs:job_list"],
+        )
+        self.assertIn("cumulative", instrumentation.slow_profiles[0][-1])
+
+    def test_metrics_endpoint_is_staff_only(self):
+        self.client.get(reverse("jobs:categories"))
+        prometheus = reverse("metrics") + "?format=prometheus"
+
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 302)
+        self.assertEqual(self.client.get(prometheus).status_code, 403)
+        response = self.client.get(
+            prometheus, headers={"Authorization": "Bearer secret"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'django_view_latency_seconds_count{view="jobs:categories"} 1',
+            response.content.decode(),
+        )
+
+        self.admin_login()
+        response = self.client.get(reverse("metrics"))
+        self.assertContains(response, "jobs:categories")
+        self.assertEqual(self.client.get(prometheus).status_code, 200)
+
+    @override_settings(INSTRUMENTATION_ENABLED=False)
+    def test_disabled_records_nothing(self):
+        self.client.get(reverse("jobs:job_list"))
+        self.assertEqual(len(instrumentation.samples), 0)
+
+
+def echo_session(request):
+    """Stand-in for the session/CSRF middleware: reads and sets the standard cookies."""
+    time.sleep(random.random() / 1000)
+    session = request.COOKIES.get(settings.SESSION_COOKIE_NAME, "")
+    response = HttpResponse(session)
+    response.set_cookie(
+        settings.SESSION_COOKIE_NAME, session, path=settings.SESSION_COOKIE_PATH
+    )
+    response.set_cookie(settings.CSRF_COOKIE_NAME, "token")
+    return response
+
+
+async def async_echo_session(request):
+    await asyncio.sleep(random.random() / 1000)
+    return echo_session(request)
+
+
+class AdminSessionCookieMiddlewareTests(SimpleTestCase):
+    paths = ["/admin/", "/admin/jobs/job/", "/jobs/", "/dashboard/employer/"] * 250
+
+    def make_request(self, path):
+        factory = RequestFactory()
+        factory.cookies[ADMIN_SESSION_COOKIE] = "admin"
+        factory.cookies[CLIENT_SESSION_COOKIE] = "client"
+        return factory.get(path)
+
+    def assertScoped(self, path, response):
+        session_cookie, session_path, csrf_cookie = cookie_scope(path)
+        expected = "admin" if path.startswith("/admin/") else "client"
+        self.assertEqual(response.content.decode(), expected)
+        self.assertEqual(set(response.cookies), {session_cookie, csrf_cookie})
+        self.assertEqual(response.cookies[session_cookie].value, expected)
+        self.assertEqual(response.cookies[session_cookie]["path"], session_path)
+
+    def test_concurrent_threads_do_not_cross_talk(self):
+        middleware = AdminSessionCookieMiddleware(echo_session)
+        names = (settings.SESSION_COOKIE_NAME, settings.CSRF_COOKIE_NAME)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            responses = list(
+                pool.map(lambda path: middleware(self.make_request(path)), self.paths)
+            )
+
+        for path, response in zip(self.paths, responses):
+            self.assertScoped(path, response)
+        self.assertEqual(
+            (settings.SESSION_COOKIE_NAME, settings.CSRF_COOKIE_NAME), names
+        )
+
+    async def test_concurrent_async_requests_do_not_cross_talk(self):
+        middleware = AdminSessionCookieMiddleware(async_echo_session)
+
+        responses = await asyncio.gather(
+            *(middleware(self.make_request(path)) for path in self.paths)
+        )
+
+        for path, response in zip(self.paths, responses):
+            self.assertScoped(path, response)
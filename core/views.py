@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse, HttpResponseForbidden
+from django.shortcuts import render
+from django.utils.crypto import constant_time_compare
+
+from core import instrumentation
+
+
+def metrics(request):
+    """
+    Request instrumentation for staff, as an admin page or, with
+    ``?format=prometheus``, as Prometheus text. Scrapers without an admin
+    session send ``Authorization: Bearer <METRICS_TOKEN>``.
+    """
+    if request.GET.get("format") == "prometheus":
+        token = settings.METRICS_TOKEN
+        authorization = request.headers.get("Authorization", "")
+        if not request.user.is_staff and not (
+            token and constant_time_compare(authorization, f"Bearer {token}")
+        ):
+            return HttpResponseForbidden()
+        return HttpResponse(
+            instrumentation.prometheus_text(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+    return _metrics_page(request)
+
+
+@staff_member_required
+def _metrics_page(request):
+    context = {
+        **admin.site.each_context(request),
+        "title": "Request metrics",
+        "enabled": settings.INSTRUMENTATION_ENABLED,
+        "rows": instrumentation.summary(),
+        "buffered": len(instrumentation.samples),
+        "slow_profiles": reversed(instrumentation.slow_profiles),
+    }
+    return render(request, "admin/metrics.html", context)